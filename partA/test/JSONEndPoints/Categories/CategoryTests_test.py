@@ -1,63 +1,10 @@
 import requests
 import pytest
-import time
-import subprocess
-import psutil
 
-BASE_URL = "http://localhost:4567"
 CATEGORIES_ENDPOINT = "/categories"
-JAR_PATH = "../../../runTodoManagerRestAPI-1.5.5.jar"
 
-
-@pytest.fixture(scope="function", autouse=True)
-def setup_and_teardown():
-
-    # Start the Java application in the background
-    process = subprocess.Popen(
-        ["java", "-jar", JAR_PATH],
-        stdout=subprocess.DEVNULL,  # Hide logs
-        stderr=subprocess.DEVNULL
-    )
-
-    # Wait for the server to be ready
-    max_retries = 5
-    for attempt in range(max_retries):
-        try:
-            response = requests.get(f"{BASE_URL}{CATEGORIES_ENDPOINT}", timeout=2)
-            if response.status_code == 200:
-                break
-        except requests.exceptions.ConnectionError:
-            time.sleep(1)
-    else:
-        process.terminate()
-        raise RuntimeError("Server failed to start.")
-
-    # Tests are run here
-    yield
-
-    # Gracefully shut down the server
-    try:
-        requests.get(f"{BASE_URL}/shutdown")
-    except Exception:
-        print("Server did not respond to shutdown request.")
-
-    # Ensure the Java process is killed
-    try:
-        parent = psutil.Process(process.pid)
-        for child in parent.children(recursive=True):
-            if child.is_running():
-                child.terminate()
-        psutil.wait_procs(parent.children(), timeout=5)  # Ensure all children terminate
-        if parent.is_running():
-            parent.terminate()
-            parent.wait(timeout=5)
-    except psutil.NoSuchProcess:
-        pass
-    except Exception as e:
-        print(f"Error occurred while terminating processes: {e}")
-
-def test_get_all_categories():
-    response = requests.get(f"{BASE_URL}{CATEGORIES_ENDPOINT}")
+def test_get_all_categories(base_url):
+    response = requests.get(f"{base_url}{CATEGORIES_ENDPOINT}")
     expected_categories = [
         {
             "id": "1",
@@ -77,12 +24,13 @@ def test_get_all_categories():
     expected_categories.sort(key=lambda x: x["id"])
     assert response_categories == expected_categories
 
-def test_create_category_without_id_with_title():
+# Asserts the id a new server gives the first created object
+def test_create_category_without_id_with_title(fresh_server):
     body = {
         "title": "University",
         "description": "",
     }
-    response = requests.post(f"{BASE_URL}{CATEGORIES_ENDPOINT}", json=body)
+    response = requests.post(f"{fresh_server.base_url}{CATEGORIES_ENDPOINT}", json=body)
     expected = {
         "id": "3",
         "title": "University",
@@ -91,37 +39,37 @@ def test_create_category_without_id_with_title():
     assert response.status_code == 201
     assert response.json() == expected
 
-def test_create_category_without_id_without_title():
+def test_create_category_without_id_without_title(base_url):
     body = {
         "title": "",
         "description": "Studying",
     }
-    response = requests.post(f"{BASE_URL}{CATEGORIES_ENDPOINT}", json=body)
+    response = requests.post(f"{base_url}{CATEGORIES_ENDPOINT}", json=body)
     expected = {
         "errorMessages": ["Failed Validation: title : can not be empty"],
     }
     assert response.status_code == 400
     assert response.json() == expected
 
-def test_head_categories():
-    response = requests.head(f"{BASE_URL}{CATEGORIES_ENDPOINT}")
+def test_head_categories(base_url):
+    response = requests.head(f"{base_url}{CATEGORIES_ENDPOINT}")
     assert response.status_code == 200
 
-def test_create_category():
+def test_create_category(base_url):
     response = requests.post(
-        f"{BASE_URL}/categories",
+        f"{base_url}/categories",
         json={"title": "Test Category"}
     )
     assert response.status_code == 201
     assert "id" in response.json()
 
-def test_get_nonexistent_category():
-    response = requests.get(f"{BASE_URL}/categories/9999")
+def test_get_nonexistent_category(base_url):
+    response = requests.get(f"{base_url}/categories/9999")
     assert response.status_code == 404
 
-def test_malformed_json():
+def test_malformed_json(base_url):
     response = requests.post(
-        f"{BASE_URL}/categories",
+        f"{base_url}/categories",
         data="invalid_json",
         headers={"Content-Type": "application/json"}
     )
@@ -1,71 +1,26 @@
 import requests
 import pytest
-import time
-import subprocess
-import psutil
 
-BASE_URL = "http://localhost:4567"
 PROJECTS_ENDPOINT = "/projects"
 PROJECTS_RELATIONSHIP = "projects"
 CATEGORIES_ENDPOINT = "/categories"
 CATEGORIES_RELATIONSHIP = "categories"
 VALID_ID = 1
 INVALID_ID = 20
-JAR_PATH = "../../../runTodoManagerRestAPI-1.5.5.jar"
 
-@pytest.fixture(scope="function", autouse=True)
-def setup_and_teardown():
-
-    # Start the Java application in the background
-    process = subprocess.Popen(
-        ["java", "-jar", JAR_PATH],
-        stdout=subprocess.DEVNULL,  # Hide logs
-        stderr=subprocess.DEVNULL
-    )
-
-    # Wait for the server to be ready
-    max_retries = 5
-    for attempt in range(max_retries):
-        try:
-            response = requests.get(f"{BASE_URL}{PROJECTS_ENDPOINT}", timeout=2)
-            create_relationship()
-            if response.status_code == 200:
-                break
-        except requests.exceptions.ConnectionError:
-            time.sleep(1)
-    else:
-        process.terminate()
-        raise RuntimeError("Server failed to start.")
-
-    # Tests are run here
-    yield
-
-    # Gracefully shut down the server
-    try:
-        requests.get(f"{BASE_URL}/shutdown")
-    except Exception:
-        print("Server did not respond to shutdown request.")
-
-    # Ensure the Java process is killed
-    try:
-        parent = psutil.Process(process.pid)
-        for child in parent.children(recursive=True):  # Kill child processes
-            if child.is_running():
-                child.terminate()
-        if parent.is_running():
-            parent.terminate()
-        parent.wait()
-    except psutil.NoSuchProcess:
-        pass
-
-def create_relationship():
+def create_relationship(base_url):
     try:
-        requests.post(f"{BASE_URL}{PROJECTS_ENDPOINT}/{VALID_ID}/{CATEGORIES_RELATIONSHIP}", json={"id": "1"})
+        requests.post(f"{base_url}{PROJECTS_ENDPOINT}/{VALID_ID}/{CATEGORIES_RELATIONSHIP}", json={"id": "1"})
     except requests.exceptions.RequestException:
         pass
 
-def test_get_all_categories_for_project():
-    response = requests.get(f"{BASE_URL}{PROJECTS_ENDPOINT}/{VALID_ID}/{CATEGORIES_RELATIONSHIP}")
+@pytest.fixture(scope="function", autouse=True)
+def setup_data(base_url):
+    # Data every test expects on top of the default server state
+    create_relationship(base_url)
+
+def test_get_all_categories_for_project(base_url):
+    response = requests.get(f"{base_url}{PROJECTS_ENDPOINT}/{VALID_ID}/{CATEGORIES_RELATIONSHIP}")
     expected = {
         "categories": [
             {
@@ -81,8 +36,8 @@ def test_get_all_categories_for_project():
     expected["categories"].sort(key=lambda x: x["id"])
     assert response_categories == expected["categories"]
 
-def testknownbug_get_categories_for_nonexistent_project():
-    response = requests.get(f"{BASE_URL}{PROJECTS_ENDPOINT}/{INVALID_ID}/{CATEGORIES_RELATIONSHIP}")
+def testknownbug_get_categories_for_nonexistent_project(base_url):
+    response = requests.get(f"{base_url}{PROJECTS_ENDPOINT}/{INVALID_ID}/{CATEGORIES_RELATIONSHIP}")
     expected = {
         'categories': [
             {
@@ -96,23 +51,23 @@ def testknownbug_get_categories_for_nonexistent_project():
     assert response.status_code == 200
     assert response.json() == expected
 
-def test_head_categories_for_project():
-    response = requests.head(f"{BASE_URL}{PROJECTS_ENDPOINT}/{VALID_ID}/{CATEGORIES_RELATIONSHIP}")
+def test_head_categories_for_project(base_url):
+    response = requests.head(f"{base_url}{PROJECTS_ENDPOINT}/{VALID_ID}/{CATEGORIES_RELATIONSHIP}")
     assert response.status_code == 200
 
-def testknownbug_head_categories_for_nonexistent_project():
-    response = requests.head(f"{BASE_URL}{PROJECTS_ENDPOINT}/{INVALID_ID}/{CATEGORIES_RELATIONSHIP}")
+def testknownbug_head_categories_for_nonexistent_project(base_url):
+    response = requests.head(f"{base_url}{PROJECTS_ENDPOINT}/{INVALID_ID}/{CATEGORIES_RELATIONSHIP}")
     #BUG: The API should return a 404 status code
     # This is a bug in the API, it should return a 404 status code #
     assert response.status_code == 200
 
-def test_create_relationship_between_project_and_category():
+def test_create_relationship_between_project_and_category(base_url):
     body = {"id": "2"}
-    response = requests.post(f"{BASE_URL}{PROJECTS_ENDPOINT}/{VALID_ID}/{CATEGORIES_RELATIONSHIP}", json=body)
+    response = requests.post(f"{base_url}{PROJECTS_ENDPOINT}/{VALID_ID}/{CATEGORIES_RELATIONSHIP}", json=body)
     assert response.status_code == 201
 
     # Verifying that the relationship persists
-    relationship = requests.get(f"{BASE_URL}{PROJECTS_ENDPOINT}/{VALID_ID}/{CATEGORIES_RELATIONSHIP}")
+    relationship = requests.get(f"{base_url}{PROJECTS_ENDPOINT}/{VALID_ID}/{CATEGORIES_RELATIONSHIP}")
     expected = {
         "categories": [
             {
@@ -133,42 +88,42 @@ def test_create_relationship_between_project_and_category():
     expected["categories"].sort(key=lambda x: x["id"])
     assert response_categories == expected["categories"]
 
-def test_create_relationship_with_nonexistent_project():
+def test_create_relationship_with_nonexistent_project(base_url):
     body = {"id": "1"}
     expected = {
         "errorMessages": [f"Could not find parent thing for relationship projects/{INVALID_ID}/categories"],
     }
-    response = requests.post(f"{BASE_URL}{PROJECTS_ENDPOINT}/{INVALID_ID}/{CATEGORIES_RELATIONSHIP}", json=body)
+    response = requests.post(f"{base_url}{PROJECTS_ENDPOINT}/{INVALID_ID}/{CATEGORIES_RELATIONSHIP}", json=body)
     assert response.status_code == 404
     assert response.json() == expected
 
-def test_delete_relationship_between_project_and_category():
+def test_delete_relationship_between_project_and_category(base_url):
     categ_id = 1
-    response = requests.delete(f"{BASE_URL}{PROJECTS_ENDPOINT}/{VALID_ID}/{CATEGORIES_RELATIONSHIP}/{categ_id}")
+    response = requests.delete(f"{base_url}{PROJECTS_ENDPOINT}/{VALID_ID}/{CATEGORIES_RELATIONSHIP}/{categ_id}")
     assert response.status_code == 200
 
     # Verify deletion through get request
-    relationship = requests.get(f"{BASE_URL}{CATEGORIES_ENDPOINT}/{VALID_ID}/{PROJECTS_RELATIONSHIP}")
+    relationship = requests.get(f"{base_url}{CATEGORIES_ENDPOINT}/{VALID_ID}/{PROJECTS_RELATIONSHIP}")
     expected = {"projects": []}
     assert relationship.status_code == 200
     assert relationship.json() == expected
 
-def test_delete_nonexistent_relationship_between_project_and_category():
+def test_delete_nonexistent_relationship_between_project_and_category(base_url):
     categ_id = 2
-    response = requests.delete(f"{BASE_URL}{PROJECTS_ENDPOINT}/{VALID_ID}/{CATEGORIES_RELATIONSHIP}/{categ_id}")
+    response = requests.delete(f"{base_url}{PROJECTS_ENDPOINT}/{VALID_ID}/{CATEGORIES_RELATIONSHIP}/{categ_id}")
     expected = {
         "errorMessages": [f"Could not find any instances with projects/{VALID_ID}/categories/{categ_id}"],
     }
     assert response.status_code == 404
     assert response.json() == expected
 
-def testknownbug_bidirectional_relationship_creation():
+def testknownbug_bidirectional_relationship_creation(base_url):
     body = {"id": "2"}
-    response = requests.post(f"{BASE_URL}{PROJECTS_ENDPOINT}/{VALID_ID}/{CATEGORIES_RELATIONSHIP}", json=body)
+    response = requests.post(f"{base_url}{PROJECTS_ENDPOINT}/{VALID_ID}/{CATEGORIES_RELATIONSHIP}", json=body)
     assert response.status_code == 201
 
     # Check that the relationship exists from projects to categories (SUCCESS - EXISTS)
-    relationship = requests.get(f"{BASE_URL}{PROJECTS_ENDPOINT}/{VALID_ID}/{CATEGORIES_RELATIONSHIP}")
+    relationship = requests.get(f"{base_url}{PROJECTS_ENDPOINT}/{VALID_ID}/{CATEGORIES_RELATIONSHIP}")
     expected = {
         "categories": [
            {
@@ -190,7 +145,7 @@ def testknownbug_bidirectional_relationship_creation():
     assert response_categories == expected["categories"]
 
     # Check if category to projects relationship is created (bidirectionality) (BUG - NON-EXISTENT)
-    categ_project_rel = requests.get(f"{BASE_URL}{CATEGORIES_ENDPOINT}/{body['id']}/{PROJECTS_ENDPOINT}")
+    categ_project_rel = requests.get(f"{base_url}{CATEGORIES_ENDPOINT}/{body['id']}/{PROJECTS_ENDPOINT}")
     expected_rel = {"projects": []}
     assert categ_project_rel.status_code == 200
     assert categ_project_rel.json() == expected_rel
\ No newline at end of file
@@ -1,54 +1,10 @@
 import requests
 import pytest
-import time
-import subprocess
-import psutil
 
-BASE_URL = "http://localhost:4567"
 TODOS_ENDPOINT = "/todos"
-JAR_PATH = "../../../runTodoManagerRestAPI-1.5.5.jar"
 
-@pytest.fixture(scope="function", autouse=True)
-def setup_and_teardown():
-
-    # Start the Java application in the background
-    process = subprocess.Popen(
-        ["java", "-jar", JAR_PATH],
-        stdout=subprocess.DEVNULL,  # Hide logs
-        stderr=subprocess.DEVNULL
-    )
-
-    # Wait for the server to be ready
-    max_retries = 5
-    for attempt in range(max_retries):
-        try:
-            response = requests.get(f"{BASE_URL}{TODOS_ENDPOINT}", timeout=2)
-            if response.status_code == 200:
-                break
-        except requests.exceptions.ConnectionError:
-            time.sleep(1)
-    else:
-        process.terminate()
-        raise RuntimeError("Server failed to start.")
-
-    # Tests are run here
-    yield
-
-    # Gracefully shut down the server
-    try:
-        requests.get(f"{BASE_URL}/shutdown")
-    except Exception:
-        print("Server did not respond to shutdown request.")
-
-    # Ensure the Java process is killed
-    parent = psutil.Process(process.pid)
-    for child in parent.children(recursive=True):  # Kill child processes
-        child.terminate()
-    process.terminate()
-    process.wait()
-
-def test_get_all_todos():
-    response = requests.get(f"{BASE_URL}{TODOS_ENDPOINT}")
+def test_get_all_todos(base_url):
+    response = requests.get(f"{base_url}{TODOS_ENDPOINT}")
     assert response.status_code == 200
 
     expected = {
@@ -84,8 +40,8 @@ def test_get_all_todos():
 
     assert response_todos == expected["todos"]
 
-def test_get_todos_by_done_status():
-    response = requests.get(f"{BASE_URL}{TODOS_ENDPOINT}", params={"doneStatus": "false"})
+def test_get_todos_by_done_status(base_url):
+    response = requests.get(f"{base_url}{TODOS_ENDPOINT}", params={"doneStatus": "false"})
     assert response.status_code == 200
 
     expected = {
@@ -121,8 +77,8 @@ def test_get_todos_by_done_status():
 
     assert response_todos == expected["todos"]
 
-def test_get_todos_by_done_status_and_title():
-    response = requests.get(f"{BASE_URL}{TODOS_ENDPOINT}", params={"doneStatus": "false", "title": "file paperwork"})
+def test_get_todos_by_done_status_and_title(base_url):
+    response = requests.get(f"{base_url}{TODOS_ENDPOINT}", params={"doneStatus": "false", "title": "file paperwork"})
     expected = {
         "todos": [
             {
@@ -139,13 +95,14 @@ def test_get_todos_by_done_status_and_title():
     assert response.status_code == 200
     assert response.json() == expected
 
-def test_create_todo_without_id():
+# Asserts the id a new server gives the first created object
+def test_create_todo_without_id(fresh_server):
     body = {
         "title": "feed dog",
         "doneStatus": False,
         "description": "give him food",
     }
-    response = requests.post(f"{BASE_URL}{TODOS_ENDPOINT}", json=body)
+    response = requests.post(f"{fresh_server.base_url}{TODOS_ENDPOINT}", json=body)
     expected = {
         "id": "3",
         "title": "feed dog",
@@ -155,7 +112,7 @@ def test_create_todo_without_id():
     assert response.status_code == 201
     assert response.json() == expected
 
-def test_create_todo_without_title():
+def test_create_todo_without_title(base_url):
     body = {
         "doneStatus": False,
         "description": "give him food",
@@ -163,11 +120,11 @@ def test_create_todo_without_title():
     expected = {
         "errorMessages": ["title : field is mandatory"],
     }
-    response = requests.post(f"{BASE_URL}{TODOS_ENDPOINT}", json=body)
+    response = requests.post(f"{base_url}{TODOS_ENDPOINT}", json=body)
     assert response.status_code == 400
     assert response.json() == expected
 
-def test_create_todo_with_extra_attribute():
+def test_create_todo_with_extra_attribute(base_url):
     body = {
         "title": "Feed my dog",
         "doneStatus": False,
@@ -177,10 +134,10 @@ def test_create_todo_with_extra_attribute():
     expected = {
         "errorMessages": ["Could not find field: monthCreated"],
     }
-    response = requests.post(f"{BASE_URL}{TODOS_ENDPOINT}", json=body)
+    response = requests.post(f"{base_url}{TODOS_ENDPOINT}", json=body)
     assert response.status_code == 400
     assert response.json() == expected
 
-def test_head_todos():
-    response = requests.head(f"{BASE_URL}{TODOS_ENDPOINT}")
+def test_head_todos(base_url):
+    response = requests.head(f"{base_url}{TODOS_ENDPOINT}")
     assert response.status_code == 200
\ No newline at end of file
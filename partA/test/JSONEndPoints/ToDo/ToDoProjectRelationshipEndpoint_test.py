@@ -1,70 +1,26 @@
 import requests
 import pytest
-import time
-import subprocess
-import psutil
 
-BASE_URL = "http://localhost:4567"
 TODOS_ENDPOINT = "/todos"
 PROJECTS_ENDPOINT = "/projects"
 PROJ_TODO_RELATIONSHIP = "tasks"
 TODO_PROJ_RELATIONSHIP = "tasksof"
 VALID_ID = 1
 INVALID_ID = 40
-JAR_PATH = "../../../runTodoManagerRestAPI-1.5.5.jar"
-
-@pytest.fixture(scope="function", autouse=True)
-def setup_and_teardown():
-
-    # Start the Java application in the background
-    process = subprocess.Popen(
-        ["java", "-jar", JAR_PATH],
-        stdout=subprocess.DEVNULL,  # Hide logs
-        stderr=subprocess.DEVNULL
-    )
-
-    # Wait for the server to be ready
-    max_retries = 5
-    for attempt in range(max_retries):
-        try:
-            response = requests.get(f"{BASE_URL}{TODOS_ENDPOINT}", timeout=2)
-            if response.status_code == 200:
-                break
-        except requests.exceptions.ConnectionError:
-            time.sleep(1)
-    else:
-        process.terminate()
-        raise RuntimeError("Server failed to start.")
-
-    # Tests are run here
-    yield
-
-    # Gracefully shut down the server
-    try:
-        requests.get(f"{BASE_URL}/shutdown")
-    except Exception:
-        print("Server did not respond to shutdown request.")
-
-    # Ensure the Java process is killed
-    parent = psutil.Process(process.pid)
-    for child in parent.children(recursive=True):  # Kill child processes
-        child.terminate()
-    process.terminate()
-    process.wait()
-
-def test_head_projects_for_todo():
+
+def test_head_projects_for_todo(base_url):
     todo_id = VALID_ID
-    response = requests.head(f"{BASE_URL}{TODOS_ENDPOINT}/{todo_id}/{TODO_PROJ_RELATIONSHIP}")
+    response = requests.head(f"{base_url}{TODOS_ENDPOINT}/{todo_id}/{TODO_PROJ_RELATIONSHIP}")
     assert response.status_code == 200
 
-def test_head_projects_for_nonexistent_todo():
+def test_head_projects_for_nonexistent_todo(base_url):
     todo_id = INVALID_ID
-    response = requests.head(f"{BASE_URL}{TODOS_ENDPOINT}/{todo_id}/{TODO_PROJ_RELATIONSHIP}")
+    response = requests.head(f"{base_url}{TODOS_ENDPOINT}/{todo_id}/{TODO_PROJ_RELATIONSHIP}")
     assert response.status_code == 200
 
-def test_get_projects_for_todo():
+def test_get_projects_for_todo(base_url):
     todo_id = 2
-    response = requests.get(f"{BASE_URL}{TODOS_ENDPOINT}/{todo_id}/{TODO_PROJ_RELATIONSHIP}")
+    response = requests.get(f"{base_url}{TODOS_ENDPOINT}/{todo_id}/{TODO_PROJ_RELATIONSHIP}")
     assert response.status_code == 200
 
     expected = {
@@ -92,8 +48,8 @@ def test_get_projects_for_todo():
 
     assert response_projects == expected["projects"]
 
-def test_get_projects_for_nonexistent_todo():
-    response = requests.get(f"{BASE_URL}{TODOS_ENDPOINT}/{INVALID_ID}/{TODO_PROJ_RELATIONSHIP}")
+def test_get_projects_for_nonexistent_todo(base_url):
+    response = requests.get(f"{base_url}{TODOS_ENDPOINT}/{INVALID_ID}/{TODO_PROJ_RELATIONSHIP}")
     assert response.status_code == 200
 
     expected = {
@@ -132,14 +88,14 @@ def test_get_projects_for_nonexistent_todo():
 
     assert response_projects == expected["projects"]
 
-def test_create_relationship_between_todo_and_project():
+def test_create_relationship_between_todo_and_project(base_url):
     todo_id = 2
     body = {"id": "1"}
-    response = requests.post(f"{BASE_URL}{TODOS_ENDPOINT}/{todo_id}/{TODO_PROJ_RELATIONSHIP}", json=body)
+    response = requests.post(f"{base_url}{TODOS_ENDPOINT}/{todo_id}/{TODO_PROJ_RELATIONSHIP}", json=body)
     assert response.status_code == 201
 
     # Verify the relationship
-    created_relationship = requests.get(f"{BASE_URL}{TODOS_ENDPOINT}/{todo_id}/{TODO_PROJ_RELATIONSHIP}")
+    created_relationship = requests.get(f"{base_url}{TODOS_ENDPOINT}/{todo_id}/{TODO_PROJ_RELATIONSHIP}")
     expected = {
         "projects": [
             {
@@ -166,42 +122,42 @@ def test_create_relationship_between_todo_and_project():
     assert created_relationship.status_code == 200
     assert response_projects == expected["projects"]
 
-def test_create_relationship_with_nonexistent_todo():
+def test_create_relationship_with_nonexistent_todo(base_url):
     todo_id = INVALID_ID
     body = {"id": "1"}
     expected = {
         "errorMessages": [f"Could not find parent thing for relationship todos/{todo_id}/tasksof"],
     }
-    response = requests.post(f"{BASE_URL}{TODOS_ENDPOINT}/{todo_id}/{TODO_PROJ_RELATIONSHIP}", json=body)
+    response = requests.post(f"{base_url}{TODOS_ENDPOINT}/{todo_id}/{TODO_PROJ_RELATIONSHIP}", json=body)
     assert response.status_code == 404
     assert response.json() == expected
 
-def test_delete_relationship_between_todo_and_project():
+def test_delete_relationship_between_todo_and_project(base_url):
     todo_id = 2
     proj_id = 1
-    response = requests.delete(f"{BASE_URL}{TODOS_ENDPOINT}/{todo_id}/{TODO_PROJ_RELATIONSHIP}/{proj_id}")
+    response = requests.delete(f"{base_url}{TODOS_ENDPOINT}/{todo_id}/{TODO_PROJ_RELATIONSHIP}/{proj_id}")
     assert response.status_code == 200
 
     # Verify the deletion
-    proj_relationships_of_todo = requests.get(f"{BASE_URL}{TODOS_ENDPOINT}/{todo_id}/{TODO_PROJ_RELATIONSHIP}")
+    proj_relationships_of_todo = requests.get(f"{base_url}{TODOS_ENDPOINT}/{todo_id}/{TODO_PROJ_RELATIONSHIP}")
     expected = {"projects": []}
     assert proj_relationships_of_todo.status_code == 200
     assert proj_relationships_of_todo.json() == expected
 
-def test_delete_nonexistent_relationship_between_todo_and_project():
+def test_delete_nonexistent_relationship_between_todo_and_project(base_url):
     todo_id = 2
     proj_id = 1
-    response = requests.delete(f"{BASE_URL}{TODOS_ENDPOINT}/{todo_id}/{TODO_PROJ_RELATIONSHIP}/{proj_id}")
+    response = requests.delete(f"{base_url}{TODOS_ENDPOINT}/{todo_id}/{TODO_PROJ_RELATIONSHIP}/{proj_id}")
     assert response.status_code == 200
 
-    second_attempt_response = requests.delete(f"{BASE_URL}{TODOS_ENDPOINT}/{todo_id}/{TODO_PROJ_RELATIONSHIP}/{proj_id}")
+    second_attempt_response = requests.delete(f"{base_url}{TODOS_ENDPOINT}/{todo_id}/{TODO_PROJ_RELATIONSHIP}/{proj_id}")
     expected = {
         "errorMessages": [f"Could not find any instances with todos/{todo_id}/tasksof/{proj_id}"],
     }
     assert second_attempt_response.status_code == 404
     assert second_attempt_response.json() == expected
 
-def test_bidirectional_relationship_creation():
+def test_bidirectional_relationship_creation(base_url):
     body = {
         "title": "Important Errands and Tasks",
         "completed": False,
@@ -210,18 +166,18 @@ def test_bidirectional_relationship_creation():
     }
 
     # Create new project to make a relationship
-    proj_created = requests.post(f"{BASE_URL}{PROJECTS_ENDPOINT}", json=body)
+    proj_created = requests.post(f"{base_url}{PROJECTS_ENDPOINT}", json=body)
     assert proj_created.status_code == 201
 
     todo_id = 1
     proj_id_body = {"id": proj_created.json()["id"]}
 
     # Create todo-project relationship
-    response = requests.post(f"{BASE_URL}{TODOS_ENDPOINT}/{todo_id}/{TODO_PROJ_RELATIONSHIP}", json=proj_id_body)
+    response = requests.post(f"{base_url}{TODOS_ENDPOINT}/{todo_id}/{TODO_PROJ_RELATIONSHIP}", json=proj_id_body)
     assert response.status_code == 201
 
     # Verify todo-project side of the relationship
-    created_relationship = requests.get(f"{BASE_URL}{TODOS_ENDPOINT}/{todo_id}/{TODO_PROJ_RELATIONSHIP}")
+    created_relationship = requests.get(f"{base_url}{TODOS_ENDPOINT}/{todo_id}/{TODO_PROJ_RELATIONSHIP}")
     expected = {
         "projects": [
             {
@@ -263,7 +219,7 @@ def test_bidirectional_relationship_creation():
     assert response_projects == expected["projects"]
 
     # Verify project-todo side of the relationship
-    proj_todo_relationships = requests.get(f"{BASE_URL}{PROJECTS_ENDPOINT}/{proj_created.json()['id']}/{PROJ_TODO_RELATIONSHIP}")
+    proj_todo_relationships = requests.get(f"{base_url}{PROJECTS_ENDPOINT}/{proj_created.json()['id']}/{PROJ_TODO_RELATIONSHIP}")
     expected_proj_todo_relationships = {
         "todos": [
             {
@@ -292,16 +248,16 @@ def test_bidirectional_relationship_creation():
     assert proj_todo_relationships.status_code == 200
     assert response_todos == expected_proj_todo_relationships["todos"]
 
-def test_bidirectional_relationship_deletion():
+def test_bidirectional_relationship_deletion(base_url):
     todo_id = 1
     proj_id = 1
 
     # Delete existing todo-project relationship between todo with ID 1 and project with ID 1
-    response = requests.delete(f"{BASE_URL}{TODOS_ENDPOINT}/{todo_id}/{TODO_PROJ_RELATIONSHIP}/{proj_id}")
+    response = requests.delete(f"{base_url}{TODOS_ENDPOINT}/{todo_id}/{TODO_PROJ_RELATIONSHIP}/{proj_id}")
     assert response.status_code == 200
 
     # Check deletion of relationship from todo side
-    todo_proj_relationships = requests.get(f"{BASE_URL}{TODOS_ENDPOINT}/{todo_id}/{TODO_PROJ_RELATIONSHIP}")
+    todo_proj_relationships = requests.get(f"{base_url}{TODOS_ENDPOINT}/{todo_id}/{TODO_PROJ_RELATIONSHIP}")
     assert todo_proj_relationships.status_code == 200
 
     removed_project = {
@@ -325,7 +281,7 @@ def test_bidirectional_relationship_deletion():
     assert removed_project not in response_projects
 
     # Check deletion of relationship from project side
-    proj_todo_relationships = requests.get(f"{BASE_URL}{PROJECTS_ENDPOINT}/{proj_id}/{PROJ_TODO_RELATIONSHIP}")
+    proj_todo_relationships = requests.get(f"{base_url}{PROJECTS_ENDPOINT}/{proj_id}/{PROJ_TODO_RELATIONSHIP}")
     assert proj_todo_relationships.status_code == 200
 
     removed_todo = {
@@ -1,57 +1,13 @@
 import requests
 import pytest
-import time
-import subprocess
-import psutil
 
-BASE_URL = "http://localhost:4567"
 TODOS_ENDPOINT = "/todos"
 VALID_ID = 1
 INVALID_ID = 45
-JAR_PATH = "../../../runTodoManagerRestAPI-1.5.5.jar"
 
-@pytest.fixture(scope="function", autouse=True)
-def setup_and_teardown():
-
-    # Start the Java application in the background
-    process = subprocess.Popen(
-        ["java", "-jar", JAR_PATH],
-        stdout=subprocess.DEVNULL,  # Hide logs
-        stderr=subprocess.DEVNULL
-    )
-
-    # Wait for the server to be ready
-    max_retries = 5
-    for attempt in range(max_retries):
-        try:
-            response = requests.get(f"{BASE_URL}{TODOS_ENDPOINT}", timeout=2)
-            if response.status_code == 200:
-                break
-        except requests.exceptions.ConnectionError:
-            time.sleep(1)
-    else:
-        process.terminate()
-        raise RuntimeError("Server failed to start.")
-
-    # Tests are run here
-    yield
-
-    # Gracefully shut down the server
-    try:
-        requests.get(f"{BASE_URL}/shutdown")
-    except Exception:
-        print("Server did not respond to shutdown request.")
-
-    # Ensure the Java process is killed
-    parent = psutil.Process(process.pid)
-    for child in parent.children(recursive=True):  # Kill child processes
-        child.terminate()
-    process.terminate()
-    process.wait()
-
-def test_get_todo_by_id():
+def test_get_todo_by_id(base_url):
     todo_id = VALID_ID
-    response = requests.get(f"{BASE_URL}{TODOS_ENDPOINT}/{todo_id}")
+    response = requests.get(f"{base_url}{TODOS_ENDPOINT}/{todo_id}")
     expected = {
         "todos": [
             {
@@ -71,22 +27,23 @@ def test_get_todo_by_id():
     assert response.status_code == 200
     assert response.json() == expected
 
-def test_get_nonexistent_todo_by_id():
+def test_get_nonexistent_todo_by_id(base_url):
     todo_id = INVALID_ID
-    response = requests.get(f"{BASE_URL}{TODOS_ENDPOINT}/{todo_id}")
+    response = requests.get(f"{base_url}{TODOS_ENDPOINT}/{todo_id}")
     expected = {
         "errorMessages": [f"Could not find an instance with todos/{todo_id}"],
     }
     assert response.status_code == 404
     assert response.json() == expected
 
-def test_create_todo():
+# Asserts the id a new server gives the first created object
+def test_create_todo(fresh_server):
     body = {
         "title": "Wash Dishes",
         "doneStatus": False,
         "description": "Home Chore to be done",
     }
-    response = requests.post(f"{BASE_URL}{TODOS_ENDPOINT}", json=body)
+    response = requests.post(f"{fresh_server.base_url}{TODOS_ENDPOINT}", json=body)
     expected = {
         "id": "3",
         "title": "Wash Dishes",
@@ -96,13 +53,13 @@ def test_create_todo():
     assert response.status_code == 201
     assert response.json() == expected
 
-def test_update_todo_by_id():
+def test_update_todo_by_id(base_url):
     todo_id = VALID_ID
     body = {
         "doneStatus": True,
         "description": "all paperwork scanned",
     }
-    response = requests.post(f"{BASE_URL}{TODOS_ENDPOINT}/{todo_id}", json=body)
+    response = requests.post(f"{base_url}{TODOS_ENDPOINT}/{todo_id}", json=body)
     expected = {
         "id": "1",
         "title": "scan paperwork",
@@ -118,37 +75,37 @@ def test_update_todo_by_id():
     assert response.status_code == 200
     assert response.json() == expected
 
-def test_update_nonexistent_todo_by_id():
+def test_update_nonexistent_todo_by_id(base_url):
     todo_id = INVALID_ID
     body = {
         "doneStatus": True,
         "description": "all paperwork scanned",
     }
-    response = requests.post(f"{BASE_URL}{TODOS_ENDPOINT}/{todo_id}", json=body)
+    response = requests.post(f"{base_url}{TODOS_ENDPOINT}/{todo_id}", json=body)
     expected = {
         "errorMessages": [f"No such todo entity instance with GUID or ID {todo_id} found"],
     }
     assert response.status_code == 404
     assert response.json() == expected
 
-def test_head_todo_by_id():
+def test_head_todo_by_id(base_url):
     todo_id = VALID_ID
-    response = requests.head(f"{BASE_URL}{TODOS_ENDPOINT}/{todo_id}")
+    response = requests.head(f"{base_url}{TODOS_ENDPOINT}/{todo_id}")
     assert response.status_code == 200
 
-def test_head_nonexistent_todo_by_id():
+def test_head_nonexistent_todo_by_id(base_url):
     todo_id = INVALID_ID
-    response = requests.head(f"{BASE_URL}{TODOS_ENDPOINT}/{todo_id}")
+    response = requests.head(f"{base_url}{TODOS_ENDPOINT}/{todo_id}")
     assert response.status_code == 404
 
-def test_put_todo_by_id():
+def test_put_todo_by_id(base_url):
     todo_id = VALID_ID
     body = {
         "title": "Wash Dog",
         "doneStatus": False,
         "description": "giving him a bath",
     }
-    response = requests.put(f"{BASE_URL}{TODOS_ENDPOINT}/{todo_id}", json=body)
+    response = requests.put(f"{base_url}{TODOS_ENDPOINT}/{todo_id}", json=body)
     expected = {
         "id": "1",
         "title": "Wash Dog",
@@ -158,49 +115,49 @@ def test_put_todo_by_id():
     assert response.status_code == 200
     assert response.json() == expected
 
-def test_put_nonexistent_todo_by_id():
+def test_put_nonexistent_todo_by_id(base_url):
     todo_id = INVALID_ID
     body = {
         "title": "Wash Dog",
         "doneStatus": False,
         "description": "giving him a bath",
     }
-    response = requests.put(f"{BASE_URL}{TODOS_ENDPOINT}/{todo_id}", json=body)
+    response = requests.put(f"{base_url}{TODOS_ENDPOINT}/{todo_id}", json=body)
     expected = {
         "errorMessages": [f"Invalid GUID for {todo_id} entity todo"],
     }
     assert response.status_code == 404
     assert response.json() == expected
 
-def test_delete_todo_by_id():
+def test_delete_todo_by_id(base_url):
     todo_id = VALID_ID
-    response = requests.delete(f"{BASE_URL}{TODOS_ENDPOINT}/{todo_id}")
+    response = requests.delete(f"{base_url}{TODOS_ENDPOINT}/{todo_id}")
     assert response.status_code == 200
 
     # Verify deletion
-    proj_relationships_of_todo = requests.get(f"{BASE_URL}{TODOS_ENDPOINT}/{todo_id}")
+    proj_relationships_of_todo = requests.get(f"{base_url}{TODOS_ENDPOINT}/{todo_id}")
     expected = {
         "errorMessages": [f"Could not find an instance with todos/{todo_id}"],
     }
     assert proj_relationships_of_todo.status_code == 404
     assert proj_relationships_of_todo.json() == expected
 
-def test_delete_nonexistent_todo_by_id():
+def test_delete_nonexistent_todo_by_id(base_url):
     todo_id = INVALID_ID
-    response = requests.delete(f"{BASE_URL}{TODOS_ENDPOINT}/{todo_id}")
+    response = requests.delete(f"{base_url}{TODOS_ENDPOINT}/{todo_id}")
     expected = {
         "errorMessages": [f"Could not find any instances with todos/{todo_id}"],
     }
     assert response.status_code == 404
     assert response.json() == expected
 
-def test_delete_todo_already_deleted():
+def test_delete_todo_already_deleted(base_url):
     todo_id = VALID_ID
-    response = requests.delete(f"{BASE_URL}{TODOS_ENDPOINT}/{todo_id}")
+    response = requests.delete(f"{base_url}{TODOS_ENDPOINT}/{todo_id}")
     assert response.status_code == 200
 
     # Verify deletion
-    second_attempt_response = requests.delete(f"{BASE_URL}{TODOS_ENDPOINT}/{todo_id}")
+    second_attempt_response = requests.delete(f"{base_url}{TODOS_ENDPOINT}/{todo_id}")
     expected = {
         "errorMessages": [f"Could not find any instances with todos/{todo_id}"],
     }
@@ -1,53 +1,10 @@
 import requests
 import pytest
-import time
-import subprocess
-import psutil
 
-BASE_URL = "http://localhost:4567"
 CATEGORIES_ENDPOINT = "/categories"
-JAR_PATH = "../../runTodoManagerRestAPI-1.5.5.jar"
 
-@pytest.fixture(scope="function", autouse=True)
-def setup_and_teardown():
-
-    # Start the Java application in the background
-    process = subprocess.Popen(
-        ["java", "-jar", JAR_PATH],
-        stdout=subprocess.DEVNULL,  # Hide logs
-        stderr=subprocess.DEVNULL
-    )
-
-    # Wait for the server to be ready
-    max_retries = 5
-    for attempt in range(max_retries):
-        try:
-            response = requests.get(f"{BASE_URL}{CATEGORIES_ENDPOINT}", timeout=2)
-            if response.status_code == 200:
-                break
-        except requests.exceptions.ConnectionError:
-            time.sleep(1)
-    else:
-        process.terminate()
-        raise RuntimeError("Server failed to start.")
-
-    # Tests are run here
-    yield
-
-    # Gracefully shut down the server
-    try:
-        requests.get(f"{BASE_URL}/shutdown")
-    except Exception:
-        print("Server did not respond to shutdown request.")
-
-    # Ensure the Java process is killed
-    parent = psutil.Process(process.pid)
-    for child in parent.children(recursive=True):  # Kill child processes
-        child.terminate()
-    process.terminate()
-    process.wait()
-
-def test_create_category_without_id_with_title():
+# Asserts the id a new server gives the first created object
+def test_create_category_without_id_with_title(fresh_server):
     body = """
     <category>
         <title>University</title>
@@ -55,7 +12,7 @@ def test_create_category_without_id_with_title():
     </category>
     """
     headers = {"Content-Type": "application/xml"}
-    response = requests.post(f"{BASE_URL}{CATEGORIES_ENDPOINT}", data=body, headers=headers)
+    response = requests.post(f"{fresh_server.base_url}{CATEGORIES_ENDPOINT}", data=body, headers=headers)
     expected = {
         "id": "3",
         "title": "University",
@@ -64,7 +21,7 @@ def test_create_category_without_id_with_title():
     assert response.status_code == 201
     assert response.json() == expected
 
-def test_create_category_without_id_without_title():
+def test_create_category_without_id_without_title(base_url):
     body = """
     <category>
         <title></title>
@@ -72,14 +29,14 @@ def test_create_category_without_id_without_title():
     </category>
     """
     headers = {"Content-Type": "application/xml"}
-    response = requests.post(f"{BASE_URL}{CATEGORIES_ENDPOINT}", data=body, headers=headers)
+    response = requests.post(f"{base_url}{CATEGORIES_ENDPOINT}", data=body, headers=headers)
     expected = {
         "errorMessages": ["Failed Validation: title : can not be empty"],
     }
     assert response.status_code == 400
     assert response.json() == expected
 
-def test_head_categories():
+def test_head_categories(base_url):
     headers = {"Content-Type": "application/xml"}
-    response = requests.head(f"{BASE_URL}{CATEGORIES_ENDPOINT}", headers=headers)
+    response = requests.head(f"{base_url}{CATEGORIES_ENDPOINT}", headers=headers)
     assert response.status_code == 200
\ No newline at end of file
@@ -1,53 +1,10 @@
 import requests
 import pytest
-import time
-import subprocess
-import psutil
 
-BASE_URL = "http://localhost:4567"
 TODOS_ENDPOINT = "/todos"
-JAR_PATH = "../../runTodoManagerRestAPI-1.5.5.jar"
 
-@pytest.fixture(scope="function", autouse=True)
-def setup_and_teardown():
-
-    # Start the Java application in the background
-    process = subprocess.Popen(
-        ["java", "-jar", JAR_PATH],
-        stdout=subprocess.DEVNULL,  # Hide logs
-        stderr=subprocess.DEVNULL
-    )
-
-    # Wait for the server to be ready
-    max_retries = 5
-    for attempt in range(max_retries):
-        try:
-            response = requests.get(f"{BASE_URL}{TODOS_ENDPOINT}", timeout=2)
-            if response.status_code == 200:
-                break
-        except requests.exceptions.ConnectionError:
-            time.sleep(1)
-    else:
-        process.terminate()
-        raise RuntimeError("Server failed to start.")
-
-    # Tests are run here
-    yield
-
-    # Gracefully shut down the server
-    try:
-        requests.get(f"{BASE_URL}/shutdown")
-    except Exception:
-        print("Server did not respond to shutdown request.")
-
-    # Ensure the Java process is killed
-    parent = psutil.Process(process.pid)
-    for child in parent.children(recursive=True):  # Kill child processes
-        child.terminate()
-    process.terminate()
-    process.wait()
-
-def test_create_todo_without_id():
+# Asserts the id a new server gives the first created object
+def test_create_todo_without_id(fresh_server):
     body = """
     <todo>
         <title>Clean Cupboard</title>
@@ -56,7 +13,7 @@ def test_create_todo_without_id():
     </todo>
     """
     headers = {"Content-Type": "application/xml"}
-    response = requests.post(f"{BASE_URL}{TODOS_ENDPOINT}", data=body, headers=headers)
+    response = requests.post(f"{fresh_server.base_url}{TODOS_ENDPOINT}", data=body, headers=headers)
     expected = {
         "id": "3",
         "title": "Clean Cupboard",
@@ -66,7 +23,7 @@ def test_create_todo_without_id():
     assert response.status_code == 201
     assert response.json() == expected
 
-def test_create_todo_without_id_missing_title():
+def test_create_todo_without_id_missing_title(base_url):
     body = """
     <todo>
         <doneStatus>false</doneStatus>
@@ -77,11 +34,11 @@ def test_create_todo_without_id_missing_title():
     expected = {
         "errorMessages": ["title : field is mandatory"],
     }
-    response = requests.post(f"{BASE_URL}{TODOS_ENDPOINT}", data=body, headers=headers)
+    response = requests.post(f"{base_url}{TODOS_ENDPOINT}", data=body, headers=headers)
     assert response.status_code == 400
     assert response.json() == expected
 
-def test_create_todo_with_extra_attribute():
+def test_create_todo_with_extra_attribute(base_url):
     body = """
     <todo>
         <title>Clean Cupboard</title>
@@ -94,11 +51,11 @@ def test_create_todo_with_extra_attribute():
     expected = {
         "errorMessages": ["Could not find field: monthCreated"],
     }
-    response = requests.post(f"{BASE_URL}{TODOS_ENDPOINT}", data=body, headers=headers)
+    response = requests.post(f"{base_url}{TODOS_ENDPOINT}", data=body, headers=headers)
     assert response.status_code == 400
     assert response.json() == expected
 
-def test_head_todos():
+def test_head_todos(base_url):
     headers = {"Content-Type": "application/xml"}
-    response = requests.head(f"{BASE_URL}{TODOS_ENDPOINT}", headers=headers)
+    response = requests.head(f"{base_url}{TODOS_ENDPOINT}", headers=headers)
     assert response.status_code == 200
\ No newline at end of file
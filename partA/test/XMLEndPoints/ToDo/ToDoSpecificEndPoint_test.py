@@ -1,55 +1,12 @@
 import requests
 import pytest
-import time
-import subprocess
-import psutil
 
-BASE_URL = "http://localhost:4567"
 TODOS_ENDPOINT = "/todos"
 VALID_ID = 1
 INVALID_ID = 45
-JAR_PATH = "../../runTodoManagerRestAPI-1.5.5.jar"
 
-@pytest.fixture(scope="function", autouse=True)
-def setup_and_teardown():
-
-    # Start the Java application in the background
-    process = subprocess.Popen(
-        ["java", "-jar", JAR_PATH],
-        stdout=subprocess.DEVNULL,  # Hide logs
-        stderr=subprocess.DEVNULL
-    )
-
-    # Wait for the server to be ready
-    max_retries = 5
-    for attempt in range(max_retries):
-        try:
-            response = requests.get(f"{BASE_URL}{TODOS_ENDPOINT}", timeout=2)
-            if response.status_code == 200:
-                break
-        except requests.exceptions.ConnectionError:
-            time.sleep(1)
-    else:
-        process.terminate()
-        raise RuntimeError("Server failed to start.")
-
-    # Tests are run here
-    yield
-
-    # Gracefully shut down the server
-    try:
-        requests.get(f"{BASE_URL}/shutdown")
-    except Exception:
-        print("Server did not respond to shutdown request.")
-
-    # Ensure the Java process is killed
-    parent = psutil.Process(process.pid)
-    for child in parent.children(recursive=True):  # Kill child processes
-        child.terminate()
-    process.terminate()
-    process.wait()
-
-def test_create_todo():
+# Asserts the id a new server gives the first created object
+def test_create_todo(fresh_server):
     body = """
     <todo>
         <title>Wash Dishes</title>
@@ -58,7 +15,7 @@ def test_create_todo():
     </todo>
     """
     headers = {"Content-Type": "application/xml"}
-    response = requests.post(f"{BASE_URL}{TODOS_ENDPOINT}", data=body, headers=headers)
+    response = requests.post(f"{fresh_server.base_url}{TODOS_ENDPOINT}", data=body, headers=headers)
     expected = {
         "id": "3",
         "title": "Wash Dishes",
@@ -68,7 +25,7 @@ def test_create_todo():
     assert response.status_code == 201
     assert response.json() == expected
 
-def test_update_todo_by_id():
+def test_update_todo_by_id(base_url):
     todo_id = VALID_ID
     body = """
     <todo>
@@ -77,7 +34,7 @@ def test_update_todo_by_id():
     </todo>
     """
     headers = {"Content-Type": "application/xml"}
-    response = requests.post(f"{BASE_URL}{TODOS_ENDPOINT}/{todo_id}", data=body, headers=headers)
+    response = requests.post(f"{base_url}{TODOS_ENDPOINT}/{todo_id}", data=body, headers=headers)
     expected = {
         "id": "1",
         "title": "scan paperwork",
@@ -93,7 +50,7 @@ def test_update_todo_by_id():
     assert response.status_code == 200
     assert response.json() == expected
 
-def test_update_nonexistent_todo_by_id():
+def test_update_nonexistent_todo_by_id(base_url):
     todo_id = INVALID_ID
     body = """
     <todo>
@@ -102,26 +59,26 @@ def test_update_nonexistent_todo_by_id():
     </todo>
     """
     headers = {"Content-Type": "application/xml"}
-    response = requests.post(f"{BASE_URL}{TODOS_ENDPOINT}/{todo_id}", data=body, headers=headers)
+    response = requests.post(f"{base_url}{TODOS_ENDPOINT}/{todo_id}", data=body, headers=headers)
     expected = {
         "errorMessages": [f"No such todo entity instance with GUID or ID {todo_id} found"],
     }
     assert response.status_code == 404
     assert response.json() == expected
 
-def test_head_todo_by_id():
+def test_head_todo_by_id(base_url):
     todo_id = VALID_ID
     headers = {"Content-Type": "application/xml"}
-    response = requests.head(f"{BASE_URL}{TODOS_ENDPOINT}/{todo_id}", headers=headers)
+    response = requests.head(f"{base_url}{TODOS_ENDPOINT}/{todo_id}", headers=headers)
     assert response.status_code == 200
 
-def test_head_nonexistent_todo_by_id():
+def test_head_nonexistent_todo_by_id(base_url):
     todo_id = INVALID_ID
     headers = {"Content-Type": "application/xml"}
-    response = requests.head(f"{BASE_URL}{TODOS_ENDPOINT}/{todo_id}", headers=headers)
+    response = requests.head(f"{base_url}{TODOS_ENDPOINT}/{todo_id}", headers=headers)
     assert response.status_code == 404
 
-def test_put_todo_by_id():
+def test_put_todo_by_id(base_url):
     todo_id = VALID_ID
     body = """
     <todo>
@@ -131,7 +88,7 @@ def test_put_todo_by_id():
     </todo>
     """
     headers = {"Content-Type": "application/xml"}
-    response = requests.put(f"{BASE_URL}{TODOS_ENDPOINT}/{todo_id}", data=body, headers=headers)
+    response = requests.put(f"{base_url}{TODOS_ENDPOINT}/{todo_id}", data=body, headers=headers)
     expected = {
         "id": "1",
         "title": "Wash Dog",
@@ -141,7 +98,7 @@ def test_put_todo_by_id():
     assert response.status_code == 200
     assert response.json() == expected
 
-def test_put_nonexistent_todo_by_id():
+def test_put_nonexistent_todo_by_id(base_url):
     todo_id = INVALID_ID
     body = """
     <todo>
@@ -151,45 +108,45 @@ def test_put_nonexistent_todo_by_id():
     </todo>
     """
     headers = {"Content-Type": "application/xml"}
-    response = requests.put(f"{BASE_URL}{TODOS_ENDPOINT}/{todo_id}", data=body, headers=headers)
+    response = requests.put(f"{base_url}{TODOS_ENDPOINT}/{todo_id}", data=body, headers=headers)
     expected = {
         "errorMessages": [f"Invalid GUID for {todo_id} entity todo"],
     }
     assert response.status_code == 404
     assert response.json() == expected
 
-def test_delete_todo_by_id():
+def test_delete_todo_by_id(base_url):
     todo_id = VALID_ID
     headers = {"Content-Type": "application/xml"}
-    response = requests.delete(f"{BASE_URL}{TODOS_ENDPOINT}/{todo_id}", headers=headers)
+    response = requests.delete(f"{base_url}{TODOS_ENDPOINT}/{todo_id}", headers=headers)
     assert response.status_code == 200
 
     # Verify deletion
-    proj_relationships_of_todo = requests.get(f"{BASE_URL}{TODOS_ENDPOINT}/{todo_id}", headers=headers)
+    proj_relationships_of_todo = requests.get(f"{base_url}{TODOS_ENDPOINT}/{todo_id}", headers=headers)
     expected = {
         "errorMessages": [f"Could not find an instance with todos/{todo_id}"],
     }
     assert proj_relationships_of_todo.status_code == 404
     assert proj_relationships_of_todo.json() == expected
 
-def test_delete_nonexistent_todo_by_id():
+def test_delete_nonexistent_todo_by_id(base_url):
     todo_id = INVALID_ID
     headers = {"Content-Type": "application/xml"}
-    response = requests.delete(f"{BASE_URL}{TODOS_ENDPOINT}/{todo_id}", headers=headers)
+    response = requests.delete(f"{base_url}{TODOS_ENDPOINT}/{todo_id}", headers=headers)
     expected = {
         "errorMessages": [f"Could not find any instances with todos/{todo_id}"],
     }
     assert response.status_code == 404
     assert response.json() == expected
 
-def test_delete_todo_already_deleted():
+def test_delete_todo_already_deleted(base_url):
     todo_id = VALID_ID
     headers = {"Content-Type": "application/xml"}
-    response = requests.delete(f"{BASE_URL}{TODOS_ENDPOINT}/{todo_id}", headers=headers)
+    response = requests.delete(f"{base_url}{TODOS_ENDPOINT}/{todo_id}", headers=headers)
     assert response.status_code == 200
 
     # Verify deletion
-    second_attempt_response = requests.delete(f"{BASE_URL}{TODOS_ENDPOINT}/{todo_id}", headers=headers)
+    second_attempt_response = requests.delete(f"{base_url}{TODOS_ENDPOINT}/{todo_id}", headers=headers)
     expected = {
         "errorMessages": [f"Could not find any instances with todos/{todo_id}"],
     }
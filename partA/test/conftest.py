@@ -0,0 +1,91 @@
+import os
+
+import pytest
+
+from todo_server import ServerPool, reset_state, snapshot, startup_flags
+
+
+class SharedServer:
+    """One server per session (per xdist worker), put back to its startup data between tests."""
+
+    def __init__(self, pool):
+        self.pool = pool
+        self.server = None
+        self.baseline = None
+        # True until a test has run against the current process
+        self.pristine = False
+        self.resets = 0
+        self.restarts = 0
+
+    def start(self):
+        self.server = self.pool.acquire()
+        self.baseline = snapshot(self.server.base_url)
+        self.pristine = True
+
+    # Swap in a pooled server; tests pick up its base_url from the fixture
+    def restart(self):
+        self.pool.release(self.server)
+        self.start()
+        self.restarts += 1
+
+    # Reset to the startup snapshot, restarting when that cannot be verified
+    def prepare(self):
+        if self.pristine and self.server.running:
+            pass
+        elif not self.server.running:
+            self.restart()
+        elif reset_state(self.server.base_url, self.baseline):
+            self.resets += 1
+        else:
+            self.restart()
+        self.pristine = False
+
+    def stop(self):
+        self.pool.release(self.server)
+
+
+# Parallel workers each keep one spare server unless TODO_SERVER_POOL_SIZE says otherwise
+def _pool_size():
+    if os.environ.get("PYTEST_XDIST_WORKER") and "TODO_SERVER_POOL_SIZE" not in os.environ:
+        return 1
+    return None
+
+
+@pytest.fixture(scope="session")
+def server_pool():
+    # Every server listens on a free port, so xdist workers never collide.
+    # The startup flags (and the AppCDS archive, dumped on the first run)
+    # cut the JVM startup paid for every restart
+    with ServerPool(size=_pool_size(), jvm_flags=startup_flags()) as pool:
+        yield pool
+
+
+@pytest.fixture(scope="session")
+def shared_server(server_pool):
+    shared = SharedServer(server_pool)
+    shared.start()
+    yield shared
+    shared.stop()
+    print(f"\nTodo Manager server: {shared.resets} resets, {shared.restarts} restarts")
+
+
+@pytest.fixture(scope="function", autouse=True)
+def setup_and_teardown(shared_server):
+    shared_server.prepare()
+    yield shared_server.server
+
+
+# Root URL of the API for the current test, e.g. "http://localhost:41237"
+@pytest.fixture(scope="function")
+def base_url(setup_and_teardown):
+    return setup_and_teardown.base_url
+
+
+@pytest.fixture(scope="function")
+def fresh_server(server_pool):
+    # A server nothing has run against yet, for tests whose assertions
+    # depend on the ids a new server hands out ("id": "3" for the first
+    # created todo). Address it through its base_url.
+    server = server_pool.acquire()
+    yield server
+    server_pool.release(server)
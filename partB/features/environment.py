@@ -1,38 +1,27 @@
-import subprocess
 import requests
-import time
-import psutil
+
+from todo_server import TodoServer, is_ready, startup_flags
 
 BASE_URL = "http://localhost:4567"
-JAR_PATH = "../../runTodoManagerRestAPI-1.5.5.jar"
+PORT = 4567
 
 def before_all(context):
     print("🚀 Checking if Todo Manager API is started...")
-    # Start the Java application in the background
-    # context.process = subprocess.Popen(
-    #     ["java", "-jar", JAR_PATH],
-    #     stdout=subprocess.DEVNULL,  # Hide logs
-    #     stderr=subprocess.DEVNULL
-    # )
-
-    # Wait for the server to be ready
-    max_retries = 2
-    for attempt in range(max_retries):
-        try:
-            response = requests.get(f"{BASE_URL}/projects", timeout=2)
-            if response.status_code == 200:
-                break
-        except requests.exceptions.ConnectionError:
-            time.sleep(1)
-    else:
-        raise RuntimeError("Server not started.")
+    context.server = None
+    if not is_ready("localhost", PORT, "/projects"):
+        # Start the Java application in the background
+        print("🚀 Starting the Todo Manager API...")
+        context.server = TodoServer(port=PORT, jvm_flags=startup_flags()).start()
 
     print("✅ Todo Manager API is ready!")
 
 def after_all(context):
     # Gracefully shut down the server
-    try: 
-      print("🛑 Shutting down the Todo Manager API...")
-      response = requests.get(f"{BASE_URL}/shutdown")
+    print("🛑 Shutting down the Todo Manager API...")
+    if context.server is not None:
+        context.server.stop()
+        return
+    try:
+        requests.get(f"{BASE_URL}/shutdown")
     except requests.exceptions.ConnectionError:
-      pass
+        pass
@@ -0,0 +1,211 @@
+"""Resource-generic performance benchmark engine for the Todo Manager API.
+
+Every benchmarked resource is described declaratively as an ``Entity`` so
+that seeding, measurement and reporting are written once and shared by the
+todos, projects and categories runs.
+"""
+
+from .config import (
+    BASE_URL,
+    DEFAULT_CONNECTION_REQUESTS,
+    DEFAULT_CONNECTIONS,
+    DEFAULT_DEGRADATION_THRESHOLD,
+    DEFAULT_DURATION,
+    DEFAULT_FANOUT_SIZES,
+    DEFAULT_FILTER_SIZES,
+    DEFAULT_LEAK_THRESHOLD,
+    DEFAULT_POOL_SIZES,
+    DEFAULT_PREDICTION_SIZE,
+    DEFAULT_RATE,
+    DEFAULT_RELATIONSHIP_POPULATIONS,
+    DEFAULT_RETRIES,
+    DEFAULT_SAMPLES,
+    DEFAULT_SELECTIVITIES,
+    DEFAULT_SOAK_DURATION,
+    DEFAULT_SOAK_WINDOW,
+    DEFAULT_TEST_SIZES,
+    DEFAULT_WORKERS,
+    BenchmarkConfig,
+)
+from .entities import (
+    CATEGORIES,
+    ENTITIES,
+    PROJECTS,
+    RELATIONSHIPS,
+    TODOS,
+    Entity,
+    Relationship,
+    generate_random_category,
+    generate_random_project,
+    generate_random_todo,
+    get_entity,
+    get_relationship,
+)
+from .crud import clear_all, create_n, delete_ids, link_pairs, list_ids, restore_population, seed
+from .sessions import WorkerSessions, single_connection_session
+from .phased import FORMATS, PHASES, PhasedClient, PhasedResponse
+from .measure import METRIC_KEYS, measure_operation
+from .telemetry import ServerMonitor, find_listening_process
+from .sampler import ResourceSampler
+from .server import launch_server, server_monitor, stop_server
+from .runner import (
+    SWEEP_MODES,
+    TIMING_MODES,
+    aggregate_samples,
+    measure_performance,
+    measuring_client,
+    prepare_population,
+    run_benchmark,
+)
+from .plotting import (
+    plot_connection_results,
+    plot_filter_results,
+    plot_format_results,
+    plot_listing_results,
+    plot_load_results,
+    plot_relationship_results,
+    plot_results,
+    plot_saturation_results,
+    plot_soak_results,
+    save_results,
+    write_results,
+)
+from .histogram import LatencyHistogram
+from .loadgen import (
+    LOAD_OPERATIONS,
+    LoadRecorder,
+    build_report,
+    drive_load,
+    generate_load,
+    load_targets,
+    prepare_pools,
+    print_report,
+    run_load,
+)
+from .stats import PERCENTILES, summarize
+from .saturation import find_knee, run_saturation, search_max_rate
+from .filters import FILTERS, find_crossovers, measure_filters, run_filters
+from .soak import analyze_soak, run_soak
+from .connections import connection_strategies, measure_connections, run_connections
+from .formats import compare_formats, measure_formats, run_formats
+from .listing import measure_listing, run_listing
+from .relationships import measure_relationship, run_relationship_benchmark
+from .workload import (
+    WORKLOAD_OPERATIONS,
+    WorkloadOperation,
+    WorkloadSpec,
+    load_workload,
+    parse_workload,
+    run_workload,
+)
+
+__all__ = [
+    "BASE_URL",
+    "DEFAULT_CONNECTION_REQUESTS",
+    "DEFAULT_CONNECTIONS",
+    "DEFAULT_DEGRADATION_THRESHOLD",
+    "DEFAULT_DURATION",
+    "DEFAULT_FANOUT_SIZES",
+    "DEFAULT_FILTER_SIZES",
+    "DEFAULT_LEAK_THRESHOLD",
+    "DEFAULT_POOL_SIZES",
+    "DEFAULT_PREDICTION_SIZE",
+    "DEFAULT_RATE",
+    "DEFAULT_RELATIONSHIP_POPULATIONS",
+    "DEFAULT_RETRIES",
+    "DEFAULT_SAMPLES",
+    "DEFAULT_SELECTIVITIES",
+    "DEFAULT_SOAK_DURATION",
+    "DEFAULT_SOAK_WINDOW",
+    "DEFAULT_TEST_SIZES",
+    "DEFAULT_WORKERS",
+    "BenchmarkConfig",
+    "CATEGORIES",
+    "ENTITIES",
+    "PROJECTS",
+    "RELATIONSHIPS",
+    "TODOS",
+    "Entity",
+    "Relationship",
+    "generate_random_category",
+    "generate_random_project",
+    "generate_random_todo",
+    "get_entity",
+    "get_relationship",
+    "clear_all",
+    "create_n",
+    "delete_ids",
+    "link_pairs",
+    "list_ids",
+    "restore_population",
+    "seed",
+    "WorkerSessions",
+    "single_connection_session",
+    "FORMATS",
+    "PHASES",
+    "PhasedClient",
+    "PhasedResponse",
+    "METRIC_KEYS",
+    "measure_operation",
+    "ServerMonitor",
+    "find_listening_process",
+    "ResourceSampler",
+    "launch_server",
+    "server_monitor",
+    "stop_server",
+    "SWEEP_MODES",
+    "TIMING_MODES",
+    "aggregate_samples",
+    "measure_performance",
+    "measuring_client",
+    "prepare_population",
+    "run_benchmark",
+    "plot_results",
+    "save_results",
+    "write_results",
+    "plot_load_results",
+    "plot_saturation_results",
+    "plot_relationship_results",
+    "plot_listing_results",
+    "plot_filter_results",
+    "plot_format_results",
+    "plot_connection_results",
+    "plot_soak_results",
+    "LatencyHistogram",
+    "LOAD_OPERATIONS",
+    "LoadRecorder",
+    "build_report",
+    "drive_load",
+    "generate_load",
+    "load_targets",
+    "prepare_pools",
+    "print_report",
+    "run_load",
+    "PERCENTILES",
+    "summarize",
+    "find_knee",
+    "run_saturation",
+    "search_max_rate",
+    "measure_listing",
+    "FILTERS",
+    "find_crossovers",
+    "measure_filters",
+    "run_filters",
+    "compare_formats",
+    "measure_formats",
+    "run_formats",
+    "analyze_soak",
+    "run_soak",
+    "connection_strategies",
+    "measure_connections",
+    "run_connections",
+    "run_listing",
+    "measure_relationship",
+    "run_relationship_benchmark",
+    "WORKLOAD_OPERATIONS",
+    "WorkloadOperation",
+    "WorkloadSpec",
+    "load_workload",
+    "parse_workload",
+    "run_workload",
+]
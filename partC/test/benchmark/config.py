@@ -0,0 +1,120 @@
+from dataclasses import dataclass, field
+
+# Base URL for the API
+BASE_URL = "http://localhost:4567"
+
+# Population sizes swept by the CRUD benchmark
+DEFAULT_TEST_SIZES = [1, 10, 50, 100, 200, 300, 400, 500, 600, 700, 800, 900, 1000, 2000, 3000, 4000, 5000, 6000]
+
+# Concurrent connections used to seed and clear the population
+DEFAULT_WORKERS = 8
+
+# Timed samples of every operation at each population size
+DEFAULT_SAMPLES = 5
+
+# Open-loop load generation defaults
+DEFAULT_RATE = 100.0  # requests per second
+DEFAULT_DURATION = 30.0  # seconds
+DEFAULT_CONNECTIONS = 64
+
+# Saturation search defaults
+DEFAULT_SLO_P99_MS = 50.0
+DEFAULT_SATURATION_SIZES = [100, 1000, 5000]
+
+# Relationship benchmark: links per measured parent and objects per collection
+DEFAULT_FANOUT_SIZES = [1, 10, 100, 1000, 10000]
+DEFAULT_RELATIONSHIP_POPULATIONS = [100, 1000]
+
+# Population the collection GET benchmark extrapolates its fits to
+DEFAULT_PREDICTION_SIZE = 100000
+
+# Filter benchmark: populations and percentages of objects matching the filter
+DEFAULT_FILTER_SIZES = [100, 500, 1000, 2000, 5000]
+DEFAULT_SELECTIVITIES = [0, 1, 50, 100]
+
+# Connection benchmark: requests per strategy and concurrent pool sizes
+DEFAULT_CONNECTION_REQUESTS = 2000
+DEFAULT_POOL_SIZES = [2, 4, 8]
+
+# Soak test defaults: run length and reporting window in seconds, and the
+# regression slopes above which memory growth or p99 drift is flagged
+DEFAULT_SOAK_DURATION = 4 * 3600.0
+DEFAULT_SOAK_WINDOW = 60.0
+DEFAULT_LEAK_THRESHOLD = 10.0  # MB of server RSS per hour
+DEFAULT_DEGRADATION_THRESHOLD = 1.0  # ms of p99 per hour
+
+# Extra attempts for failed deletes when clearing a collection
+DEFAULT_RETRIES = 3
+
+
+@dataclass
+class BenchmarkConfig:
+    """Settings shared by every benchmark run."""
+
+    base_url: str = BASE_URL
+    test_sizes: list = field(default_factory=lambda: list(DEFAULT_TEST_SIZES))
+    workers: int = DEFAULT_WORKERS
+    sweep: str = "incremental"
+    timing: str = "wall"
+    # Body format of measured requests: "json" or "xml" (XML always goes
+    # through the phased client)
+    format: str = "json"
+    samples: int = DEFAULT_SAMPLES
+    # Adaptive warm-up before the first timed sample: repeat the measured
+    # operation until the medians of two consecutive windows agree within
+    # warmup_tolerance and show no trend, for at most warmup_max_seconds
+    warmup: bool = True
+    warmup_window: int = 20
+    warmup_tolerance: float = 0.1
+    warmup_max_seconds: float = 60.0
+    # Server process to monitor: explicit PID, else the one listening on the
+    # base URL's port, else launched from jar_path
+    server_pid: int = None
+    jar_path: str = None
+    # Seconds between background resource samples, 0 disables the sampler
+    sample_interval: float = 0.05
+    # Load generator: offered rate, run length, connection cap (per worker
+    # process), worker processes, operation mix and objects seeded per
+    # entity before the run
+    rate: float = DEFAULT_RATE
+    duration: float = DEFAULT_DURATION
+    connections: int = DEFAULT_CONNECTIONS
+    processes: int = 1
+    operations: list = field(default_factory=lambda: ["create", "read", "update", "delete"])
+    load_population: int = 100
+    request_timeout: float = 30.0
+    # Saturation search: p99 budget and error threshold every step must
+    # meet, seconds per step, ramp start and cap, binary-search tolerance
+    # and dataset sizes to search at
+    slo_p99_ms: float = DEFAULT_SLO_P99_MS
+    max_error_rate: float = 0.01
+    step_duration: float = 5.0
+    start_rate: float = 50.0
+    max_rate: float = 20000.0
+    search_tolerance: float = 0.05
+    saturation_sizes: list = field(default_factory=lambda: list(DEFAULT_SATURATION_SIZES))
+    # Relationship benchmark: links on the measured parent, swept at every
+    # population of the parent and child collections
+    fanout_sizes: list = field(default_factory=lambda: list(DEFAULT_FANOUT_SIZES))
+    relationship_populations: list = field(default_factory=lambda: list(DEFAULT_RELATIONSHIP_POPULATIONS))
+    # Collection GET benchmark: population its per-object fits predict
+    prediction_size: int = DEFAULT_PREDICTION_SIZE
+    # Filter benchmark: populations, each rebuilt at every selectivity (% matching)
+    filter_sizes: list = field(default_factory=lambda: list(DEFAULT_FILTER_SIZES))
+    selectivities: list = field(default_factory=lambda: list(DEFAULT_SELECTIVITIES))
+    # Connection benchmark: requests issued per strategy and the numbers of
+    # concurrent connections compared with and without keep-alive
+    connection_requests: int = DEFAULT_CONNECTION_REQUESTS
+    pool_sizes: list = field(default_factory=lambda: list(DEFAULT_POOL_SIZES))
+    # Soak test: churn length, window per latency/resource point, windows
+    # left out of the fits while the JVM settles, and flag thresholds
+    soak_duration: float = DEFAULT_SOAK_DURATION
+    soak_window: float = DEFAULT_SOAK_WINDOW
+    soak_warmup: float = 300.0
+    leak_threshold: float = DEFAULT_LEAK_THRESHOLD
+    degradation_threshold: float = DEFAULT_DEGRADATION_THRESHOLD
+    results_dir: str = "results"
+    plots_dir: str = "plots"
+
+    def url(self, path):
+        return f"{self.base_url}{path}"
@@ -0,0 +1,171 @@
+import http.client
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from .config import BenchmarkConfig
+from .crud import clear_all, seed
+from .entities import ENTITIES
+from .loadgen import LoadRecorder
+from .phased import PhasedClient
+from .plotting import plot_connection_results, write_results
+from .server import server_monitor
+
+# Requests of one churn cycle; every cycle leaves the population unchanged
+CYCLE = ["create", "read", "update", "delete"]
+
+
+# Strategies compared: (label, concurrent connections, keep-alive)
+def connection_strategies(config):
+    strategies = [("per_request", 1, False), ("session", 1, True)]
+    for size in config.pool_sizes:
+        strategies.append((f"per_request_x{size}", size, False))
+        strategies.append((f"pool_{size}", size, True))
+    return strategies
+
+
+class _ThreadTotals:
+    """Per-thread counters, merged once the threads are done."""
+
+    def __init__(self):
+        self.recorder = LoadRecorder()
+        self.transaction_ns = 0
+        self.connect_ns = 0
+        self.requests = 0
+        self.new_connections = 0
+        self.errors = 0
+
+
+# One worker: run churn cycles on its own client until the shared budget is spent
+def _worker(entity, config, client, budget, lock):
+    totals = _ThreadTotals()
+
+    def claim():
+        with lock:
+            if budget[0] < len(CYCLE):
+                return False
+            budget[0] -= len(CYCLE)
+            return True
+
+    def timed(operation, method, path, payload=None):
+        start_ns = time.perf_counter_ns()
+        try:
+            response = client.request(method, config.url(path), json=payload)
+        except (OSError, http.client.HTTPException):
+            totals.errors += 1
+            client.close()
+            return None
+        end_ns = time.perf_counter_ns()
+        ok = response.status_code < 400
+        totals.recorder.record(operation, start_ns, start_ns, end_ns, ok)
+        totals.transaction_ns += end_ns - start_ns
+        totals.connect_ns += int(response.timings["connect_time"] * 1e6)
+        totals.requests += 1
+        totals.new_connections += not response.timings["connection_reused"]
+        totals.errors += not ok
+        return response if ok else None
+
+    while claim():
+        response = timed("create", "POST", entity.endpoint, entity.generate())
+        if response is None:
+            continue
+        object_id = response.json()["id"]
+        timed("read", "GET", entity.item_endpoint(object_id))
+        timed("update", "PUT", entity.item_endpoint(object_id), entity.update_payload())
+        timed("delete", "DELETE", entity.item_endpoint(object_id))
+    client.close()
+    return totals
+
+
+# Issue `config.connection_requests` requests with one strategy and summarize them
+def _run_strategy(entity, config, label, concurrency, keep_alive, monitor=None):
+    clients = [PhasedClient(config.base_url, timeout=config.request_timeout, keep_alive=keep_alive)
+               for _ in range(concurrency)]
+    budget = [config.connection_requests]
+    lock = threading.Lock()
+
+    before = monitor.snapshot() if monitor else None
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        all_totals = list(executor.map(lambda client: _worker(entity, config, client, budget, lock), clients))
+    elapsed = time.perf_counter() - start
+    # Server CPU, memory, threads and descriptors over the whole strategy
+    resources = monitor.delta(before, monitor.snapshot()) if monitor else {}
+
+    recorder = LoadRecorder()
+    for totals in all_totals:
+        recorder.merge(totals.recorder)
+    _, latency = recorder.totals()
+    requests_done = sum(t.requests for t in all_totals)
+    transaction_ns = sum(t.transaction_ns for t in all_totals)
+    connect_ns = sum(t.connect_ns for t in all_totals)
+
+    row = {
+        "strategy": label,
+        "concurrency": concurrency,
+        "keep_alive": keep_alive,
+        "requests": requests_done,
+        "errors": sum(t.errors for t in all_totals),
+        "seconds": elapsed,
+        "throughput": requests_done / elapsed if elapsed > 0 else 0.0,
+        "latency": latency.summary(),
+        # Share of all request time spent opening connections
+        "connect_share": connect_ns / transaction_ns if transaction_ns else 0.0,
+        "mean_connect_time": connect_ns / requests_done / 1e6 if requests_done else 0.0,
+        "new_connection_rate": sum(t.new_connections for t in all_totals) / requests_done if requests_done else 0.0,
+        "operations": recorder.report(elapsed),
+        **resources,
+    }
+    print(f"  {label:>16}: {row['throughput']:8.1f} req/s, median {row['latency'].get('median', 0):.2f} ms, "
+          f"p99 {row['latency'].get('p99', 0):.2f} ms, connect {row['connect_share']:.1%} of time "
+          f"({row['new_connection_rate']:.0%} new connections), errors {row['errors']}")
+    if resources:
+        print(f"  {'':>16}  server CPU {row['cpu_usage']:.1f}%, RSS {row['memory_rss']:.1f} MB, "
+              f"{row['threads']} threads, {row['open_fds']} fds")
+    return row
+
+
+# Run the same churn with every connection strategy
+def measure_connections(entity, session, config=None, monitor=None):
+    """Compare per-request connections, one keep-alive session and pools.
+
+    Every strategy issues ``config.connection_requests`` create/read/
+    update/delete requests against a population of
+    ``config.load_population`` objects. ``per_request`` opens a new TCP
+    connection for every request like module-level ``requests`` calls,
+    ``session`` reuses one keep-alive connection, and for every size in
+    ``config.pool_sizes`` that many threads run either with keep-alive
+    connections (``pool_N``) or without (``per_request_xN``). The phased
+    client's connect time gives the share of latency spent on setup.
+    With a ``ServerMonitor`` every strategy also records the server's CPU
+    usage, RSS, threads and open descriptors over its run.
+    """
+    config = config or BenchmarkConfig()
+    clear_all(entity, session, config.base_url, config.workers)
+    seed(entity, config.load_population, config.base_url, config.workers)
+
+    print(f"\n=== Connection strategies on {entity.name} ({config.connection_requests} requests each) ===")
+    rows = [_run_strategy(entity, config, *strategy, monitor=monitor) for strategy in connection_strategies(config)]
+    return {"strategies": rows}
+
+
+# Run the connection benchmark for the given entities and save plots and results
+def run_connections(entities=None, config=None):
+    config = config or BenchmarkConfig()
+    entities = list(ENTITIES.values()) if entities is None else entities
+    session = requests.Session()
+    all_results = {}
+    with server_monitor(config) as monitor:
+        for entity in ENTITIES.values():
+            clear_all(entity, session, config.base_url, config.workers)
+
+        for entity in entities:
+            results = measure_connections(entity, session, config, monitor)
+            write_results(f"connections_{entity.name}_results.json", results, config)
+            plot_connection_results(entity, results, config)
+            all_results[entity.name] = results
+
+    print(f"\nConnection testing completed. Results saved to {config.plots_dir}/connections/ directory.")
+    return all_results
@@ -0,0 +1,174 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from .config import BASE_URL, DEFAULT_RETRIES, DEFAULT_WORKERS
+from .sessions import WorkerSessions
+
+# Pause before retrying failed creates and deletes, multiplied by the attempt number
+RETRY_BACKOFF = 0.1
+
+
+# IDs of every object currently in the collection
+def list_ids(entity, session, base_url=BASE_URL):
+    response = session.get(f"{base_url}{entity.endpoint}")
+    response.raise_for_status()
+    return [obj['id'] for obj in response.json().get(entity.name, [])]
+
+
+def _delete_one(entity, session, base_url, object_id):
+    try:
+        response = session.delete(f"{base_url}{entity.item_endpoint(object_id)}")
+    except requests.RequestException:
+        return False
+    # 404 means another attempt already removed it
+    return response.status_code in [200, 204, 404]
+
+
+# Delete the given IDs concurrently and return the ones that still failed
+def delete_ids(entity, ids, base_url=BASE_URL, workers=DEFAULT_WORKERS, retries=DEFAULT_RETRIES):
+    pending = list(ids)
+    if not pending:
+        return pending
+
+    workers = max(1, min(workers, len(pending)))
+    with WorkerSessions() as sessions, ThreadPoolExecutor(max_workers=workers) as executor:
+        for attempt in range(retries + 1):
+            if attempt:
+                time.sleep(RETRY_BACKOFF * attempt)
+            outcomes = list(executor.map(
+                lambda object_id: _delete_one(entity, sessions.get(), base_url, object_id), pending))
+            pending = [object_id for object_id, ok in zip(pending, outcomes) if not ok]
+            if not pending:
+                break
+    return pending
+
+
+# Delete every object of the given entity and verify the collection is empty
+def clear_all(entity, session, base_url=BASE_URL, workers=DEFAULT_WORKERS, retries=DEFAULT_RETRIES):
+    """Bulk-delete the whole collection with bounded parallelism.
+
+    Failed deletes are retried by ``delete_ids``, and the collection is
+    listed again afterwards so the clear only succeeds once a final GET
+    comes back empty. Returns a stats dict with the achieved deletes per
+    second.
+    """
+    print(f"Clearing all {entity.name}...")
+    start_time = time.perf_counter()
+
+    ids = list_ids(entity, session, base_url)
+    failed = delete_ids(entity, ids, base_url, workers, retries)
+    deleted = len(ids) - len(failed)
+
+    remaining = list_ids(entity, session, base_url)
+    if remaining:
+        raise RuntimeError(f"Could not clear {entity.name}: {len(remaining)} objects left after {retries + 1} attempts")
+
+    elapsed = time.perf_counter() - start_time
+    stats = {
+        "deleted": deleted,
+        "workers": workers,
+        "seconds": elapsed,
+        "per_second": deleted / elapsed if elapsed > 0 else 0.0,
+    }
+    if deleted:
+        print(f"Cleared {deleted} {entity.name} in {elapsed:.2f} s ({stats['per_second']:.0f}/s)")
+    return stats
+
+
+def _create_one(entity, session, base_url):
+    try:
+        response = session.post(f"{base_url}{entity.endpoint}", json=entity.generate())
+    except requests.RequestException:
+        return None
+    if response.status_code in [200, 201]:
+        return response.json()['id']
+    return None
+
+
+# Create N random objects concurrently and report the seeding throughput
+def seed(entity, n, base_url=BASE_URL, workers=DEFAULT_WORKERS, retries=DEFAULT_RETRIES):
+    """Create ``n`` objects with a pool of ``workers`` threads.
+
+    Failed creates are retried up to ``retries`` times and a RuntimeError
+    is raised if fewer than ``n`` objects exist afterwards. Returns the
+    created IDs together with a stats dict holding the achieved throughput
+    in objects per second.
+    """
+    workers = max(1, min(workers, n)) if n > 0 else 1
+    start_time = time.perf_counter()
+
+    ids = []
+    with WorkerSessions() as sessions, ThreadPoolExecutor(max_workers=workers) as executor:
+        for attempt in range(retries + 1):
+            missing = n - len(ids)
+            if missing <= 0:
+                break
+            if attempt:
+                time.sleep(RETRY_BACKOFF * attempt)
+            created = executor.map(lambda _: _create_one(entity, sessions.get(), base_url), range(missing))
+            ids += [object_id for object_id in created if object_id is not None]
+
+    if len(ids) < n:
+        raise RuntimeError(f"Could only create {len(ids)}/{n} {entity.name} after {retries + 1} attempts")
+
+    elapsed = time.perf_counter() - start_time
+    stats = {
+        "requested": n,
+        "created": len(ids),
+        "workers": workers,
+        "seconds": elapsed,
+        "per_second": len(ids) / elapsed if elapsed > 0 else 0.0,
+    }
+    if n > 0:
+        print(f"Seeded {len(ids)} {entity.name} in {elapsed:.2f} s "
+              f"({stats['per_second']:.0f}/s, {workers} workers)")
+    return ids, stats
+
+
+# Bring an ID pool back to exactly `target` objects, in place
+def restore_population(entity, pool, target, base_url=BASE_URL, workers=DEFAULT_WORKERS):
+    if len(pool) > target:
+        failed = delete_ids(entity, pool[target:], base_url, workers)
+        del pool[target:]
+        pool.extend(failed)
+    elif len(pool) < target:
+        ids, _ = seed(entity, target - len(pool), base_url, workers)
+        pool.extend(ids)
+
+    # Like a sweep step, a measurement only runs against the exact population
+    if len(pool) != target:
+        raise RuntimeError(f"Prepared {len(pool)} {entity.name} instead of {target}")
+
+
+# Create N random objects of the given entity and return their IDs
+def create_n(entity, n, base_url=BASE_URL, workers=DEFAULT_WORKERS):
+    ids, _ = seed(entity, n, base_url, workers)
+    return ids
+
+
+def _link_one(relationship, session, base_url, parent_id, child_id):
+    try:
+        response = session.post(f"{base_url}{relationship.endpoint(parent_id)}", json={"id": child_id})
+    except requests.RequestException:
+        return False
+    return response.status_code in [200, 201]
+
+
+# Create (parent, child) links concurrently and return the pairs that failed
+def link_pairs(relationship, pairs, base_url=BASE_URL, workers=DEFAULT_WORKERS):
+    pairs = list(pairs)
+    if not pairs:
+        return []
+
+    start_time = time.perf_counter()
+    workers = max(1, min(workers, len(pairs)))
+    with WorkerSessions() as sessions, ThreadPoolExecutor(max_workers=workers) as executor:
+        outcomes = list(executor.map(
+            lambda pair: _link_one(relationship, sessions.get(), base_url, *pair), pairs))
+    elapsed = time.perf_counter() - start_time
+
+    failed = [pair for pair, ok in zip(pairs, outcomes) if not ok]
+    print(f"Linked {len(pairs) - len(failed)}/{len(pairs)} {relationship.key} in {elapsed:.2f} s")
+    return failed
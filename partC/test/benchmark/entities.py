@@ -0,0 +1,124 @@
+import random
+import string
+from dataclasses import dataclass
+
+
+def random_string(k):
+    return ''.join(random.choices(string.ascii_letters + string.digits, k=k))
+
+
+# Function to generate random todo data
+def generate_random_todo():
+    return {
+        "title": random_string(10),
+        "description": random_string(20),
+        "doneStatus": random.choice([True, False]),
+    }
+
+
+# Generate random project data
+def generate_random_project():
+    return {
+        "title": random_string(10),
+        "description": random_string(25),
+        "completed": random.choice([True, False]),
+    }
+
+
+# Generate random category data
+def generate_random_category():
+    return {
+        "title": random_string(10),
+        "description": random_string(25),
+    }
+
+
+@dataclass(frozen=True)
+class Entity:
+    """Declarative description of a top-level API resource.
+
+    ``name`` is both the collection path segment and the key under which the
+    API lists the collection (``GET /todos`` -> ``{"todos": [...]}``).
+    """
+
+    name: str
+    singular: str
+    label: str
+    generate: object
+
+    @property
+    def endpoint(self):
+        return f"/{self.name}"
+
+    def item_endpoint(self, object_id):
+        return f"/{self.name}/{object_id}"
+
+    def update_payload(self):
+        # Updates send a full random body for every entity so the measured
+        # PUT does the same amount of work across resources
+        return self.generate()
+
+
+TODOS = Entity("todos", "todo", "Todos", generate_random_todo)
+PROJECTS = Entity("projects", "project", "Projects", generate_random_project)
+CATEGORIES = Entity("categories", "category", "Categories", generate_random_category)
+
+ENTITIES = {entity.name: entity for entity in (TODOS, PROJECTS, CATEGORIES)}
+
+
+def get_entity(name):
+    try:
+        return ENTITIES[name]
+    except KeyError:
+        raise ValueError(f"Unknown entity '{name}', expected one of {sorted(ENTITIES)}") from None
+
+
+@dataclass(frozen=True)
+class Relationship:
+    """Declarative description of a relationship sub-collection route.
+
+    ``name`` is the route segment under the parent (``/projects/:id/tasks``);
+    the API lists the linked objects under the child collection key.
+    """
+
+    parent: Entity
+    name: str
+    child: Entity
+    reverse: str = None
+
+    @property
+    def key(self):
+        return f"{self.parent.name}.{self.name}"
+
+    def endpoint(self, parent_id):
+        return f"/{self.parent.name}/{parent_id}/{self.name}"
+
+    def link_endpoint(self, parent_id, child_id):
+        return f"/{self.parent.name}/{parent_id}/{self.name}/{child_id}"
+
+
+PROJECT_TASKS = Relationship(PROJECTS, "tasks", TODOS, reverse="todos.tasksof")
+TODO_TASKSOF = Relationship(TODOS, "tasksof", PROJECTS, reverse="projects.tasks")
+TODO_CATEGORIES = Relationship(TODOS, "categories", CATEGORIES, reverse="categories.todos")
+CATEGORY_TODOS = Relationship(CATEGORIES, "todos", TODOS, reverse="todos.categories")
+PROJECT_CATEGORIES = Relationship(PROJECTS, "categories", CATEGORIES, reverse="categories.projects")
+CATEGORY_PROJECTS = Relationship(CATEGORIES, "projects", PROJECTS, reverse="projects.categories")
+
+RELATIONSHIPS = {
+    relationship.key: relationship
+    for relationship in (
+        PROJECT_TASKS,
+        TODO_TASKSOF,
+        TODO_CATEGORIES,
+        CATEGORY_TODOS,
+        PROJECT_CATEGORIES,
+        CATEGORY_PROJECTS,
+    )
+}
+
+
+def get_relationship(key):
+    try:
+        return RELATIONSHIPS[key]
+    except KeyError:
+        raise ValueError(f"Unknown relationship '{key}', expected one of {sorted(RELATIONSHIPS)}") from None
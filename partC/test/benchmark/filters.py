@@ -0,0 +1,197 @@
+import dataclasses
+import time
+from urllib.parse import urlencode
+
+import requests
+
+from .config import BenchmarkConfig
+from .crud import clear_all, seed
+from .entities import ENTITIES, TODOS, generate_random_todo
+from .measure import measure_operation
+from .phased import PhasedClient
+from .plotting import plot_filter_results, write_results
+from .runner import aggregate_samples
+from .server import server_monitor
+from .warmup import warm_up
+
+# Title shared by every todo that should match the title filter
+MATCH_TITLE = "filter-benchmark-match"
+
+# Query filters used by the behave stories, as query parameters
+FILTERS = {
+    "doneStatus": {"doneStatus": "true"},
+    "title": {"title": MATCH_TITLE},
+}
+
+# server: the API filters via the query string
+# client: GET the whole collection and filter the decoded objects
+APPROACHES = ["server", "client"]
+
+# Matching todos satisfy every filter at once, the rest none of them, so a
+# single population serves all filters at a given selectivity
+MATCHING_TODOS = dataclasses.replace(
+    TODOS, generate=lambda: {**generate_random_todo(), "title": MATCH_TITLE, "doneStatus": True})
+OTHER_TODOS = dataclasses.replace(
+    TODOS, generate=lambda: {**generate_random_todo(), "doneStatus": False})
+
+
+# The API returns booleans as strings, so compare the string forms
+def _matches(obj, query):
+    return all(str(obj.get(key)).lower() == str(value).lower() for key, value in query.items())
+
+
+# Rebuild the todos with exactly `matching` of `size` objects matching the filters
+def _prepare_todos(session, config, size, matching):
+    clear_all(TODOS, session, config.base_url, config.workers)
+    seed(MATCHING_TODOS, matching, config.base_url, config.workers)
+    seed(OTHER_TODOS, size - matching, config.base_url, config.workers)
+
+
+# Time one filtered fetch either way; returns the metrics with the match count
+def _measure_filter(client, config, query, approach, monitor):
+    if approach == "server":
+        url = config.url(f"{TODOS.endpoint}?{urlencode(query)}")
+    else:
+        url = config.url(TODOS.endpoint)
+
+    def list_operation():
+        return client.get(url)
+
+    response, metrics = measure_operation(list_operation, monitor=monitor)
+    objects = (response.json() or {}).get(TODOS.name, [])
+    if approach == "client":
+        # The client-side filter is part of the cost of getting the answer
+        start = time.perf_counter_ns()
+        objects = [obj for obj in objects if _matches(obj, query)]
+        metrics["filter_time"] = (time.perf_counter_ns() - start) / 1e6
+        metrics["transaction_time"] += metrics["filter_time"]
+    metrics["matched"] = len(objects)
+    return response, metrics
+
+
+# x positions where `first - second` changes sign, linearly interpolated
+def _crossovers(xs, first, second):
+    points = []
+    for i in range(1, len(xs)):
+        before, after = first[i - 1] - second[i - 1], first[i] - second[i]
+        if before == 0:
+            points.append(xs[i - 1])
+        elif before * after < 0:
+            points.append(xs[i - 1] + (xs[i] - xs[i - 1]) * before / (before - after))
+    return points
+
+
+def _median(rows, name, approach, size, selectivity):
+    for row in rows:
+        if (row["filter"], row["approach"], row["size"], row["selectivity"]) == (name, approach, size, selectivity):
+            return row["transaction_time"]
+    return None
+
+
+# Where server-side filtering stops (or starts) beating client-side filtering
+def find_crossovers(rows, sizes, selectivities):
+    """Crossovers of the server and client medians, per filter.
+
+    ``by_size`` holds, for each selectivity, the populations at which the
+    faster approach flips; ``by_selectivity`` the same along selectivity for
+    each population. ``faster`` names the winner at every grid point.
+    """
+    crossovers = {}
+    for name in FILTERS:
+        result = {"by_size": {}, "by_selectivity": {}, "faster": {}}
+        for selectivity in selectivities:
+            server = [_median(rows, name, "server", size, selectivity) for size in sizes]
+            client = [_median(rows, name, "client", size, selectivity) for size in sizes]
+            if None not in server + client:
+                result["by_size"][str(selectivity)] = _crossovers(sizes, server, client)
+        for size in sizes:
+            server = [_median(rows, name, "server", size, s) for s in selectivities]
+            client = [_median(rows, name, "client", size, s) for s in selectivities]
+            if None not in server + client:
+                result["by_selectivity"][str(size)] = _crossovers(selectivities, server, client)
+                result["faster"][str(size)] = {
+                    str(s): "server" if server_time <= client_time else "client"
+                    for s, server_time, client_time in zip(selectivities, server, client)}
+        crossovers[name] = result
+    return crossovers
+
+
+# Sweep population and selectivity comparing server- and client-side filtering
+def measure_filters(session, config=None, monitor=None):
+    """Time ``?doneStatus=`` and ``?title=`` filters on todos.
+
+    For every population in ``config.filter_sizes`` and every selectivity
+    in ``config.selectivities`` (percent of todos matching) the collection
+    is rebuilt, then each filter is sampled ``config.samples`` times
+    server-side (query string) and client-side (full GET, decode and filter
+    in Python). Requests go through a ``PhasedClient`` so payload size and
+    decode cost are recorded as well. The filters are warmed up on the
+    first population before any timed sample.
+    """
+    config = config or BenchmarkConfig()
+    client = PhasedClient(config.base_url, timeout=config.request_timeout)
+    sizes = sorted(set(config.filter_sizes))
+    selectivities = sorted(set(config.selectivities))
+    rows = []
+    warmup = None
+
+    # One untimed round of every filter and approach
+    def warm_up_filters():
+        total = 0.0
+        for query in FILTERS.values():
+            for approach in APPROACHES:
+                response, metrics = _measure_filter(client, config, query, approach, None)
+                if response.status_code != 200:
+                    return None
+                total += metrics["transaction_time"]
+        return total
+
+    for size in sizes:
+        for selectivity in selectivities:
+            matching = round(size * selectivity / 100)
+            print(f"\n=== {size} todos, {selectivity}% matching ({matching}) ===")
+            _prepare_todos(session, config, size, matching)
+            if warmup is None:
+                warmup = warm_up(warm_up_filters, config, "filter warm-up") or {}
+
+            for name, query in FILTERS.items():
+                for approach in APPROACHES:
+                    samples = []
+                    for _ in range(config.samples):
+                        response, metrics = _measure_filter(client, config, query, approach, monitor)
+                        if response.status_code != 200:
+                            print(f"Error filtering todos by {name}: {response.status_code}")
+                            continue
+                        if metrics["matched"] != matching:
+                            print(f"  {name} ({approach}) matched {metrics['matched']} todos, expected {matching}")
+                        samples.append(metrics)
+                    if samples:
+                        row = aggregate_samples(f"{name} ({approach})", size, samples)
+                        row.update(filter=name, approach=approach, selectivity=selectivity,
+                                   matched=samples[-1]["matched"])
+                        rows.append(row)
+
+    client.close()
+
+    crossovers = find_crossovers(rows, sizes, selectivities)
+    for name, result in crossovers.items():
+        for selectivity, points in result["by_size"].items():
+            if points:
+                print(f"  {name} at {selectivity}% matching: server and client cross at "
+                      + ", ".join(f"{p:.0f}" for p in points) + " todos")
+    return {"rows": rows, "crossovers": crossovers, "warmup": warmup, "sizes": sizes, "selectivities": selectivities}
+
+
+# Run the filter benchmark and save plots and results
+def run_filters(config=None):
+    config = config or BenchmarkConfig()
+    session = requests.Session()
+    with server_monitor(config) as monitor:
+        for entity in ENTITIES.values():
+            clear_all(entity, session, config.base_url, config.workers)
+        results = measure_filters(session, config, monitor)
+
+    write_results("filter_results.json", results, config)
+    plot_filter_results(results, config)
+    print(f"\nFilter testing completed. Results saved to {config.plots_dir}/filters/ directory.")
+    return results
@@ -0,0 +1,91 @@
+import dataclasses
+
+import requests
+
+from .config import BenchmarkConfig
+from .crud import clear_all
+from .entities import ENTITIES
+from .listing import measure_listing
+from .phased import FORMATS
+from .plotting import plot_format_results, write_results
+from .runner import measure_performance
+from .server import server_monitor
+
+# Metrics compared between formats: latency, server time (TTFB), client
+# encode and parse cost, and bytes on the wire each way
+COMPARE_METRICS = ["transaction_time", "ttfb", "build_time", "decode_time", "request_bytes", "response_bytes"]
+
+FORMAT_OPERATIONS = ["create", "update", "delete", "list"]
+
+
+# Pair the per-size rows of both formats into side-by-side comparison rows
+def compare_formats(results):
+    comparison = {}
+    for operation in FORMAT_OPERATIONS:
+        by_size = {fmt: {row["size"]: row for row in results[fmt][operation]} for fmt in FORMATS}
+        rows = []
+        for size in sorted(set.intersection(*(set(rows) for rows in by_size.values()))):
+            row = {"size": size}
+            for fmt in FORMATS:
+                row[fmt] = {key: by_size[fmt][size][key] for key in COMPARE_METRICS if key in by_size[fmt][size]}
+            row["xml_over_json"] = {
+                key: row["xml"][key] / row["json"][key]
+                for key in COMPARE_METRICS if row["json"].get(key) and key in row["xml"]}
+            rows.append(row)
+        comparison[operation] = rows
+    return comparison
+
+
+def _print_comparison(comparison):
+    for operation, rows in comparison.items():
+        for row in rows:
+            json_row, xml_row = row["json"], row["xml"]
+            print(f"  {operation} @ {row['size']}: server {json_row['ttfb']:.2f} / {xml_row['ttfb']:.2f} ms, "
+                  f"total {json_row['transaction_time']:.2f} / {xml_row['transaction_time']:.2f} ms, "
+                  f"response {json_row['response_bytes']:.0f} / {xml_row['response_bytes']:.0f} B, "
+                  f"parse {json_row['decode_time']:.3f} / {xml_row['decode_time']:.3f} ms (json / xml)")
+
+
+# Run the CRUD and collection GET sweeps once per wire format
+def measure_formats(entity, session, config=None, monitor=None):
+    """Measure every operation with JSON and with XML bodies.
+
+    The CRUD sweep and the collection GET sweep run once per format with
+    phased timing, so each sample carries TTFB (server time), encode and
+    decode cost and the request and response sizes. The formats run one
+    after the other over the same ``config.test_sizes``.
+    """
+    config = config or BenchmarkConfig()
+    results = {}
+    for fmt in FORMATS:
+        print(f"\n##### {entity.name} as {fmt} #####")
+        format_config = dataclasses.replace(config, format=fmt, timing="phased")
+        crud = measure_performance(entity, session, format_config, monitor)
+        listing = measure_listing(entity, session, format_config, monitor)
+        results[fmt] = {operation: crud[operation] for operation in ("create", "update", "delete")}
+        results[fmt]["list"] = listing["list"]
+
+    results["comparison"] = compare_formats(results)
+    print(f"\n{entity.label}: JSON vs XML")
+    _print_comparison(results["comparison"])
+    return results
+
+
+# Run the JSON vs XML comparison for the given entities and save plots and results
+def run_formats(entities=None, config=None):
+    config = config or BenchmarkConfig()
+    entities = list(ENTITIES.values()) if entities is None else entities
+    session = requests.Session()
+    all_results = {}
+    with server_monitor(config) as monitor:
+        for entity in ENTITIES.values():
+            clear_all(entity, session, config.base_url, config.workers)
+
+        for entity in entities:
+            results = measure_formats(entity, session, config, monitor)
+            write_results(f"formats_{entity.name}_results.json", results, config)
+            plot_format_results(entity, results["comparison"], config)
+            all_results[entity.name] = results
+
+    print(f"\nFormat comparison completed. Results saved to {config.plots_dir}/formats/ directory.")
+    return all_results
@@ -0,0 +1,199 @@
+import math
+from array import array
+
+import numpy as np
+
+# Histograms record integer microseconds
+US_PER_MS = 1000
+
+# Track latencies up to one minute with 3 significant digits by default
+DEFAULT_HIGHEST_US = 60 * 1000 * 1000
+DEFAULT_SIGNIFICANT_FIGURES = 3
+
+# Percentile ticks per halving of the remaining distance to 100%
+TICKS_PER_HALF_DISTANCE = 5
+
+
+class LatencyHistogram:
+    """Fixed-memory, log-bucketed latency histogram in the style of HdrHistogram.
+
+    Values are integer microseconds. Every power-of-two bucket is split into
+    linear sub-buckets so any recorded value is reproduced within
+    ``significant_figures`` decimal digits. The layout depends only on
+    ``highest`` and ``significant_figures``, so histograms built with the
+    same settings can be merged by adding their counts.
+    """
+
+    def __init__(self, highest=DEFAULT_HIGHEST_US, significant_figures=DEFAULT_SIGNIFICANT_FIGURES):
+        if not 1 <= significant_figures <= 5:
+            raise ValueError("significant_figures must be between 1 and 5")
+        self.highest = highest
+        self.significant_figures = significant_figures
+
+        largest_single_unit = 2 * 10 ** significant_figures
+        sub_bucket_count_magnitude = math.ceil(math.log2(largest_single_unit))
+        self.sub_bucket_half_count_magnitude = sub_bucket_count_magnitude - 1
+        self.sub_bucket_count = 1 << sub_bucket_count_magnitude
+        self.sub_bucket_half_count = self.sub_bucket_count // 2
+        self.sub_bucket_mask = self.sub_bucket_count - 1
+
+        smallest_untrackable = self.sub_bucket_count
+        self.bucket_count = 1
+        while smallest_untrackable <= highest:
+            smallest_untrackable <<= 1
+            self.bucket_count += 1
+
+        self.counts = array('q', bytes(8 * (self.bucket_count + 1) * self.sub_bucket_half_count))
+        self.total_count = 0
+        self.min_value = None
+        self.max_value = 0
+        self.clamped = 0
+        self._sum = 0
+        self._sum_squares = 0
+
+    # --- layout -----------------------------------------------------------
+
+    def _bucket_index(self, value):
+        return (value | self.sub_bucket_mask).bit_length() - self.sub_bucket_half_count_magnitude - 1
+
+    def _counts_index(self, value):
+        bucket_index = self._bucket_index(value)
+        sub_bucket_index = value >> bucket_index
+        return ((bucket_index + 1) << self.sub_bucket_half_count_magnitude) + (sub_bucket_index - self.sub_bucket_half_count)
+
+    def _value_from_index(self, index):
+        bucket_index = (index >> self.sub_bucket_half_count_magnitude) - 1
+        sub_bucket_index = (index & (self.sub_bucket_half_count - 1)) + self.sub_bucket_half_count
+        if bucket_index < 0:
+            sub_bucket_index -= self.sub_bucket_half_count
+            bucket_index = 0
+        return sub_bucket_index << bucket_index
+
+    def _highest_equivalent(self, value):
+        bucket_index = self._bucket_index(value)
+        sub_bucket_index = value >> bucket_index
+        if sub_bucket_index >= self.sub_bucket_count:
+            bucket_index += 1
+        lowest = (value >> bucket_index) << bucket_index
+        return lowest + (1 << bucket_index) - 1
+
+    def _compatible(self, other):
+        return self.highest == other.highest and self.significant_figures == other.significant_figures
+
+    # --- recording --------------------------------------------------------
+
+    def record(self, value, count=1):
+        value = int(value)
+        if value < 0:
+            value = 0
+        if value > self.highest:
+            # Out of range: count it at the top so percentiles stay honest
+            self.clamped += count
+            value = self.highest
+        self.counts[self._counts_index(value)] += count
+        self.total_count += count
+        self._sum += value * count
+        self._sum_squares += value * value * count
+        self.max_value = max(self.max_value, value)
+        self.min_value = value if self.min_value is None else min(self.min_value, value)
+
+    def record_ns(self, nanoseconds):
+        self.record(nanoseconds // 1000)
+
+    def merge(self, other):
+        if not self._compatible(other):
+            raise ValueError("Cannot merge histograms with different ranges or precision")
+        for index, count in enumerate(other.counts):
+            if count:
+                self.counts[index] += count
+        self.total_count += other.total_count
+        self.clamped += other.clamped
+        self._sum += other._sum
+        self._sum_squares += other._sum_squares
+        self.max_value = max(self.max_value, other.max_value)
+        if other.min_value is not None:
+            self.min_value = other.min_value if self.min_value is None else min(self.min_value, other.min_value)
+        return self
+
+    # --- queries ----------------------------------------------------------
+
+    def value_at_percentile(self, percentile):
+        if not self.total_count:
+            return 0
+        target = max(1, math.ceil(min(percentile, 100.0) / 100.0 * self.total_count))
+        cumulative = np.cumsum(np.frombuffer(self.counts, dtype=np.int64))
+        index = int(np.searchsorted(cumulative, target))
+        return min(self._highest_equivalent(self._value_from_index(index)), self.max_value)
+
+    def mean(self):
+        return self._sum / self.total_count if self.total_count else 0.0
+
+    def stddev(self):
+        if not self.total_count:
+            return 0.0
+        mean = self.mean()
+        return math.sqrt(max(0.0, self._sum_squares / self.total_count - mean * mean))
+
+    def percentile_spectrum(self, ticks_per_half_distance=TICKS_PER_HALF_DISTANCE):
+        """Percentile/value pairs that get denser toward the tail, ending at 100%."""
+        spectrum = []
+        if not self.total_count:
+            return spectrum
+        # Stop once the remaining tail holds less than a single sample
+        last = 100.0 * (1.0 - 1.0 / self.total_count)
+        step = 0
+        while True:
+            percentile = 100.0 * (1.0 - 0.5 ** (step / ticks_per_half_distance))
+            if percentile > last:
+                break
+            spectrum.append({"percentile": percentile,
+                             "value": self.value_at_percentile(percentile) / US_PER_MS})
+            step += 1
+        spectrum.append({"percentile": 100.0, "value": self.max_value / US_PER_MS})
+        return spectrum
+
+    def summary(self):
+        """Headline statistics in milliseconds."""
+        if not self.total_count:
+            return {"count": 0}
+        return {
+            "count": self.total_count,
+            "min": self.min_value / US_PER_MS,
+            "median": self.value_at_percentile(50) / US_PER_MS,
+            "mean": self.mean() / US_PER_MS,
+            "p90": self.value_at_percentile(90) / US_PER_MS,
+            "p99": self.value_at_percentile(99) / US_PER_MS,
+            "p999": self.value_at_percentile(99.9) / US_PER_MS,
+            "max": self.max_value / US_PER_MS,
+            "stddev": self.stddev() / US_PER_MS,
+            "clamped": self.clamped,
+        }
+
+    # --- serialization ----------------------------------------------------
+
+    def to_dict(self):
+        """Sparse, JSON-friendly form that from_dict() restores exactly."""
+        return {
+            "highest": self.highest,
+            "significant_figures": self.significant_figures,
+            "total_count": self.total_count,
+            "min": self.min_value,
+            "max": self.max_value,
+            "clamped": self.clamped,
+            "sum": self._sum,
+            "sum_squares": self._sum_squares,
+            "counts": {str(index): count for index, count in enumerate(self.counts) if count},
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        histogram = cls(data["highest"], data["significant_figures"])
+        for index, count in data["counts"].items():
+            histogram.counts[int(index)] = count
+        histogram.total_count = data["total_count"]
+        histogram.min_value = data["min"]
+        histogram.max_value = data["max"]
+        histogram.clamped = data["clamped"]
+        histogram._sum = data["sum"]
+        histogram._sum_squares = data["sum_squares"]
+        return histogram
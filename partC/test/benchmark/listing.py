@@ -0,0 +1,115 @@
+import numpy as np
+import requests
+
+from .config import BenchmarkConfig
+from .crud import clear_all
+from .entities import ENTITIES
+from .measure import measure_operation
+from .phased import PhasedClient
+from .plotting import plot_listing_results, write_results
+from .runner import aggregate_samples, prepare_population
+from .server import server_monitor
+from .warmup import warm_up
+
+# Per-object costs fitted for a full collection GET: response size plus the
+# whole transaction and its server (TTFB), transfer and decode phases
+FIT_METRICS = ["response_bytes", "transaction_time", "ttfb", "transfer_time", "decode_time"]
+
+
+# Least-squares line through the medians: per-object cost, fixed cost and prediction
+def _fit(rows, key, prediction_size):
+    if len(rows) < 2:
+        return None
+    sizes = np.array([r["size"] for r in rows], dtype=float)
+    values = np.array([r[key] for r in rows], dtype=float)
+    per_object, fixed = np.polyfit(sizes, values, 1)
+    return {
+        "per_object": float(per_object),
+        "fixed": float(fixed),
+        "prediction_size": prediction_size,
+        "predicted": float(per_object * prediction_size + fixed),
+    }
+
+
+# Measure GET of the whole collection for increasing number of objects
+def measure_listing(entity, session, config=None, monitor=None):
+    """Sweep ``config.test_sizes`` timing a full GET of the collection.
+
+    Requests go through a ``PhasedClient`` so every sample records the
+    response size and splits the time into TTFB (request send plus server
+    work), body transfer and client decode of ``config.format``. The
+    population grows between sizes as in the CRUD sweep, and the listing
+    is warmed up on the first one. Per-object costs
+    are fitted over the medians and extrapolated to
+    ``config.prediction_size`` objects.
+    """
+    config = config or BenchmarkConfig()
+    client = PhasedClient(config.base_url, timeout=config.request_timeout, format=config.format)
+    rows = []
+    seeding = []
+    clearing = []
+
+    clear_all(entity, session, config.base_url, config.workers)
+    population = []
+    warmup = None
+
+    def list_operation():
+        return client.get(config.url(entity.endpoint))
+
+    def warm_up_list():
+        response, metrics = measure_operation(list_operation)
+        return metrics["transaction_time"] if response.status_code == 200 else None
+
+    for size in config.test_sizes:
+        print(f"\n=== GET /{entity.name} with {size} {entity.name} ===")
+        population = prepare_population(entity, session, config, population, size, seeding, clearing, size)
+        if warmup is None:
+            # Warm up on the first population, before its timed samples
+            warmup = warm_up(warm_up_list, config, f"GET /{entity.name} warm-up") or {}
+
+        samples = []
+        for _ in range(config.samples):
+            response, metrics = measure_operation(list_operation, monitor=monitor)
+            if response.status_code != 200:
+                print(f"Error listing {entity.name}: {response.status_code}")
+                continue
+            metrics["returned"] = len((response.json() or {}).get(entity.name, []))
+            samples.append(metrics)
+
+        if samples:
+            row = aggregate_samples("List", size, samples)
+            row["returned"] = samples[-1]["returned"]
+            print(f"  List response: {row['response_bytes'] / 1024:.1f} KiB for {row['returned']} {entity.name}")
+            rows.append(row)
+
+    client.close()
+
+    fits = {key: _fit(rows, key, config.prediction_size) for key in FIT_METRICS}
+    if fits["response_bytes"]:
+        print(f"\n{entity.label}: {fits['response_bytes']['per_object']:.1f} bytes/object, "
+              f"{fits['transaction_time']['per_object'] * 1000:.2f} us/object; at {config.prediction_size} "
+              f"objects a full GET is ~{fits['response_bytes']['predicted'] / 2 ** 20:.1f} MiB in "
+              f"~{fits['transaction_time']['predicted']:.0f} ms "
+              f"(server {fits['ttfb']['predicted']:.0f} ms, transfer {fits['transfer_time']['predicted']:.0f} ms, "
+              f"decode {fits['decode_time']['predicted']:.0f} ms)")
+    return {"list": rows, "fit": fits, "warmup": warmup, "seeding": seeding, "clearing": clearing}
+
+
+# Run the collection GET benchmark for the given entities and save plots and results
+def run_listing(entities=None, config=None):
+    config = config or BenchmarkConfig()
+    entities = list(ENTITIES.values()) if entities is None else entities
+    session = requests.Session()
+    all_results = {}
+    with server_monitor(config) as monitor:
+        for entity in ENTITIES.values():
+            clear_all(entity, session, config.base_url, config.workers)
+
+        for entity in entities:
+            results = measure_listing(entity, session, config, monitor)
+            write_results(f"listing_{entity.name}_results.json", results, config)
+            plot_listing_results(entity, results, config)
+            all_results[entity.name] = results
+
+    print(f"\nListing testing completed. Results saved to {config.plots_dir}/listing/ directory.")
+    return all_results
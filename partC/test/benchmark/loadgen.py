@@ -0,0 +1,292 @@
+import asyncio
+import json
+import multiprocessing
+import queue as queue_module
+import random
+import time
+
+import aiohttp
+
+from .config import BenchmarkConfig
+from .crud import clear_all, seed
+from .histogram import LatencyHistogram
+from .plotting import plot_load_results, write_results
+
+# CRUD operations the load generator can issue
+LOAD_OPERATIONS = ["create", "read", "update", "delete"]
+
+
+class LoadRecorder:
+    """Collects per-request outcomes of a load run, keyed by entity and operation.
+
+    Each key keeps two fixed-size histograms: ``service`` measures from the
+    actual send, while ``latency`` measures from the intended send time and
+    so includes the queueing a stalled server caused (coordinated omission
+    correction).
+    """
+
+    def __init__(self):
+        self.service = {}
+        self.latency = {}
+        self.errors = {}
+        self.skipped = {}
+
+    def skip(self, key):
+        self.skipped[key] = self.skipped.get(key, 0) + 1
+
+    def record(self, key, intended_ns, start_ns, end_ns, ok):
+        if key not in self.latency:
+            self.service[key] = LatencyHistogram()
+            self.latency[key] = LatencyHistogram()
+        self.service[key].record_ns(end_ns - start_ns)
+        self.latency[key].record_ns(end_ns - intended_ns)
+        if not ok:
+            self.errors[key] = self.errors.get(key, 0) + 1
+
+    # Fold another recorder (e.g. from a worker process) into this one
+    def merge(self, other):
+        for key in other.latency:
+            if key not in self.latency:
+                self.service[key] = LatencyHistogram()
+                self.latency[key] = LatencyHistogram()
+            self.service[key].merge(other.service[key])
+            self.latency[key].merge(other.latency[key])
+        for key, count in other.errors.items():
+            self.errors[key] = self.errors.get(key, 0) + count
+        for key, count in other.skipped.items():
+            self.skipped[key] = self.skipped.get(key, 0) + count
+        return self
+
+    def totals(self):
+        service = LatencyHistogram()
+        latency = LatencyHistogram()
+        for key in self.latency:
+            service.merge(self.service[key])
+            latency.merge(self.latency[key])
+        return service, latency
+
+    def report(self, elapsed):
+        operations = {}
+        for key in sorted(set(self.latency) | set(self.skipped)):
+            latency = self.latency.get(key, LatencyHistogram())
+            service = self.service.get(key, LatencyHistogram())
+            operations[key] = {
+                "count": latency.total_count,
+                "errors": self.errors.get(key, 0),
+                "skipped": self.skipped.get(key, 0),
+                "throughput": latency.total_count / elapsed if elapsed > 0 else 0.0,
+                "latency": latency.summary(),
+                "service_time": service.summary(),
+                "percentiles": latency.percentile_spectrum(),
+                "histogram": latency.to_dict(),
+            }
+        return operations
+
+
+# Issue one request of the given operation and record its latency
+async def _fire(http, config, entity, operation, pool, recorder, intended_ns):
+    key = f"{entity.name}.{operation}"
+    if operation != "create" and not pool:
+        # Nothing left to read, update or delete
+        recorder.skip(key)
+        return
+
+    if operation == "create":
+        method, path, payload = "POST", entity.endpoint, entity.generate()
+    elif operation == "delete":
+        # Take the ID out of the pool so no other request touches it
+        index = random.randrange(len(pool))
+        pool[index], pool[-1] = pool[-1], pool[index]
+        method, path, payload = "DELETE", entity.item_endpoint(pool.pop()), None
+    else:
+        object_id = random.choice(pool)
+        if operation == "read":
+            method, path, payload = "GET", entity.item_endpoint(object_id), None
+        else:
+            method, path, payload = "PUT", entity.item_endpoint(object_id), entity.update_payload()
+
+    start_ns = time.perf_counter_ns()
+    try:
+        async with http.request(method, config.url(path), json=payload) as response:
+            content = await response.read()
+            ok = response.status < 400
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        content, ok = None, False
+    recorder.record(key, intended_ns, start_ns, time.perf_counter_ns(), ok)
+
+    if ok and operation == "create":
+        pool.append(json.loads(content)["id"])
+
+
+# Send requests at a constant arrival rate, independent of response times
+async def generate_load(config, targets, pools, recorder, rate=None, duration=None, offset=0.0):
+    """Fire ``rate`` requests/s for ``duration`` seconds; returns the elapsed time.
+
+    ``offset`` delays the whole schedule by that many seconds so several
+    worker processes can interleave their arrivals evenly.
+    """
+    rate = rate or config.rate
+    duration = duration or config.duration
+    connector = aiohttp.TCPConnector(limit=config.connections)
+    timeout = aiohttp.ClientTimeout(total=config.request_timeout)
+    total = int(rate * duration)
+    interval_ns = 1e9 / rate
+
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as http:
+        in_flight = set()
+        start_ns = time.perf_counter_ns()
+        first_ns = start_ns + int(offset * 1e9)
+        for i in range(total):
+            intended_ns = first_ns + int(i * interval_ns)
+            delay = (intended_ns - time.perf_counter_ns()) / 1e9
+            if delay > 0:
+                await asyncio.sleep(delay)
+            # When behind schedule the request fires immediately; its lag
+            # against the intended send time is recorded
+            entity, operation = random.choice(targets)
+            task = asyncio.create_task(
+                _fire(http, config, entity, operation, pools[entity.name], recorder, intended_ns))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+        await asyncio.gather(*in_flight)
+        elapsed = (time.perf_counter_ns() - start_ns) / 1e9
+    return elapsed
+
+
+# Entry point of one load worker process
+def _load_worker(index, processes, config, targets, pools, rate, duration, barrier, queue):
+    recorder = LoadRecorder()
+    # Start all workers together; worker k is shifted by k / rate so the
+    # merged arrivals stay evenly spaced
+    barrier.wait()
+    elapsed = asyncio.run(generate_load(config, targets, pools, recorder,
+                                        rate=rate / processes, duration=duration, offset=index / rate))
+    queue.put((index, recorder, elapsed))
+
+
+def _process_context():
+    # fork is cheapest where available; other platforms fall back to spawn
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("fork" if "fork" in methods else "spawn")
+
+
+# Split the load over worker processes and merge their recorders
+def drive_load(config, targets, pools, rate=None, duration=None):
+    """Run one load phase and return ``(recorder, elapsed)``.
+
+    With ``config.processes > 1`` every worker process gets its own
+    connection pool, an equal share of the rate and a disjoint slice of the
+    ID pools; the parent merges their histograms and counters.
+    """
+    rate = rate or config.rate
+    duration = duration or config.duration
+    processes = max(1, config.processes)
+    if processes == 1:
+        recorder = LoadRecorder()
+        return recorder, asyncio.run(generate_load(config, targets, pools, recorder, rate, duration))
+
+    context = _process_context()
+    barrier = context.Barrier(processes)
+    queue = context.Queue()
+    workers = []
+    for index in range(processes):
+        worker_pools = {name: ids[index::processes] for name, ids in pools.items()}
+        worker = context.Process(
+            target=_load_worker,
+            args=(index, processes, config, targets, worker_pools, rate, duration, barrier, queue),
+            name=f"load-worker-{index}", daemon=True)
+        worker.start()
+        workers.append(worker)
+
+    recorder = LoadRecorder()
+    elapsed = 0.0
+    try:
+        for _ in range(processes):
+            # Generous deadline: the run itself plus the request timeout
+            _, worker_recorder, worker_elapsed = queue.get(timeout=duration + config.request_timeout + 30)
+            recorder.merge(worker_recorder)
+            elapsed = max(elapsed, worker_elapsed)
+    except queue_module.Empty:
+        raise RuntimeError("A load worker process did not report back") from None
+    finally:
+        for worker in workers:
+            worker.join(timeout=5)
+            if worker.is_alive():
+                worker.terminate()
+    return recorder, elapsed
+
+
+# (entity, operation) pairs driven by a load run, rejecting unknown operations
+def load_targets(entities, operations):
+    for operation in operations:
+        if operation not in LOAD_OPERATIONS:
+            raise ValueError(f"Unknown load operation '{operation}', expected one of {LOAD_OPERATIONS}")
+    return [(entity, operation) for entity in entities for operation in operations]
+
+
+# Seed every entity with the configured population and return the ID pools
+def prepare_pools(entities, session, config):
+    pools = {}
+    for entity in entities:
+        clear_all(entity, session, config.base_url, config.workers)
+        pools[entity.name], _ = seed(entity, config.load_population, config.base_url, config.workers)
+    return pools
+
+
+# Summarize a recorder into the JSON load report
+def build_report(recorder, elapsed, config, rate=None):
+    operations = recorder.report(elapsed)
+    service, latency = recorder.totals()
+    completed = latency.total_count
+    return {
+        "offered_rate": rate or config.rate,
+        "duration": elapsed,
+        "connections": config.connections,
+        "processes": config.processes,
+        "requests": completed,
+        "errors": sum(op["errors"] for op in operations.values()),
+        "achieved_throughput": completed / elapsed if elapsed > 0 else 0.0,
+        "latency": latency.summary(),
+        "service_time": service.summary(),
+        "percentiles": latency.percentile_spectrum(),
+        "service_percentiles": service.percentile_spectrum(),
+        "operations": operations,
+    }
+
+
+def print_report(report):
+    print(f"Achieved {report['achieved_throughput']:.1f} req/s "
+          f"({report['requests']} requests, {report['errors']} errors)")
+    for key, op in report["operations"].items():
+        latency = op["latency"]
+        if not op["count"]:
+            print(f"  {key}: no requests sent ({op['skipped']} skipped)")
+            continue
+        print(f"  {key}: {op['throughput']:.1f} req/s, median {latency['median']:.2f} ms, "
+              f"p99 {latency['p99']:.2f} ms (service p99 {op['service_time']['p99']:.2f} ms), "
+              f"errors {op['errors']}")
+
+
+# Run an open-loop load test against the given entities and save the report
+def run_load(entities, session, config=None):
+    """Drive ``config.rate`` requests/s for ``config.duration`` seconds.
+
+    Requests are spread uniformly over the selected entities and
+    ``config.operations``. Latency is measured from each request's
+    intended send time so server stalls are not hidden; the service time
+    from the actual send is reported alongside.
+    """
+    config = config or BenchmarkConfig()
+    targets = load_targets(entities, config.operations)
+    pools = prepare_pools(entities, session, config)
+
+    print(f"\n=== Open-loop load: {config.rate:g} req/s for {config.duration:g} s "
+          f"on {', '.join(e.name for e in entities)} ({config.processes} process(es)) ===")
+    recorder, elapsed = drive_load(config, targets, pools)
+
+    report = build_report(recorder, elapsed, config)
+    print_report(report)
+
+    write_results("load_results.json", report, config)
+    plot_load_results(report, config)
+    return report
@@ -0,0 +1,67 @@
+import os
+import time
+from datetime import datetime
+
+import psutil
+
+from .phased import PHASES
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+# Numeric metrics returned by measure_operation, summarized across samples.
+# cpu_usage, cpu_time, memory_rss, threads and open_fds describe the server
+# process and are only present when a ServerMonitor is given; the phase
+# timings and body sizes are only present for responses of a PhasedClient.
+# filter_time is added by the filter benchmark for client-side filtering.
+METRIC_KEYS = [
+    "transaction_time",
+    *PHASES,
+    "connection_reused",
+    "request_bytes",
+    "response_bytes",
+    "filter_time",
+    "cpu_usage",
+    "cpu_time",
+    "memory_rss",
+    "threads",
+    "open_fds",
+    "client_cpu_usage",
+    "available_memory",
+]
+
+
+# Measure a single operation: wall time plus server and client resource usage
+def measure_operation(operation_func, *args, monitor=None):
+    # Client process measurements
+    process = psutil.Process(os.getpid())
+
+    # Measure initial CPU to establish baseline
+    process.cpu_percent()  # First call initializes monitoring but returns meaningless value
+    server_before = monitor.snapshot() if monitor else None
+
+    start_time = time.perf_counter_ns()
+
+    # Perform the operation
+    result = operation_func(*args)
+
+    # Take end measurements
+    end_time = time.perf_counter_ns()
+    server_after = monitor.snapshot() if monitor else None
+    client_cpu_usage = process.cpu_percent()  # Get CPU usage since last call
+    end_memory = psutil.virtual_memory().available / (1024 * 1024)  # MB
+
+    # Calculate metrics
+    transaction_time = (end_time - start_time) / 1e6  # Convert to ms
+
+    metrics = {
+        "transaction_time": transaction_time,
+        "client_cpu_usage": client_cpu_usage,
+        "available_memory": end_memory,
+        "timestamp": datetime.now().strftime(TIMESTAMP_FORMAT)
+    }
+    if monitor:
+        metrics.update(monitor.delta(server_before, server_after))
+    timings = getattr(result, "timings", None)
+    if timings:
+        metrics.update(timings)
+    return result, metrics
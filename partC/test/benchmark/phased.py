@@ -0,0 +1,202 @@
+import http.client
+import json
+import time
+import xml.etree.ElementTree as ElementTree
+from urllib.parse import urlsplit
+
+from .entities import ENTITIES
+
+# Per-transaction phases, in the order they happen
+PHASES = ["build_time", "connect_time", "ttfb", "transfer_time", "decode_time"]
+
+# Wire formats for request and response bodies
+FORMATS = ["json", "xml"]
+CONTENT_TYPES = {"json": "application/json", "xml": "application/xml"}
+
+# Errors raised when the server closed a kept-alive connection in between
+STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError)
+
+
+class PhasedResponse:
+    """Minimal requests-like response that also carries the phase timings."""
+
+    def __init__(self, status_code, headers, content, data, timings):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self._data = data
+        self.timings = timings
+
+    def json(self):
+        return self._data
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise http.client.HTTPException(f"HTTP {self.status_code}")
+
+
+class PhasedClient:
+    """Keep-alive HTTP client that times every transaction phase with perf_counter_ns.
+
+    A transaction is split into request build (JSON encoding and headers),
+    connect or reuse, time to first byte (send, server time, response
+    headers), body transfer, and response decode. Exposes get/post/put/
+    delete like a ``requests.Session`` so operations can use either.
+
+    With ``keep_alive=False`` every request asks the server to close the
+    connection and opens a new one, like module-level ``requests`` calls.
+    With ``format="xml"`` bodies are sent and accepted as application/xml,
+    wrapped in ``xml_root`` (e.g. "todo"; a request can pass its own);
+    ``json()`` still returns the decoded document as dicts and lists so
+    callers do not care which format was on the wire.
+    """
+
+    def __init__(self, base_url, timeout=30, format="json", keep_alive=True, xml_root=None):
+        if format not in FORMATS:
+            raise ValueError(f"Unknown format '{format}', expected one of {FORMATS}")
+        self.format = format
+        self.keep_alive = keep_alive
+        self.xml_root = xml_root
+        parts = urlsplit(base_url)
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.timeout = timeout
+        self._conn = None
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _connect(self):
+        reused = self._conn is not None and self._conn.sock is not None
+        if not reused:
+            self.close()
+            self._conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+            self._conn.connect()
+        return reused
+
+    def request(self, method, url, json=None, headers=None, xml_root=None):
+        start = time.perf_counter_ns()
+
+        # 1. Request build
+        parts = urlsplit(url)
+        path = parts.path + (f"?{parts.query}" if parts.query else "")
+        body = _encode(json, self.format, xml_root or self.xml_root)
+        request_headers = {"Accept": CONTENT_TYPES[self.format]}
+        if body is not None:
+            request_headers["Content-Type"] = CONTENT_TYPES[self.format]
+        if not self.keep_alive:
+            request_headers["Connection"] = "close"
+        request_headers.update(headers or {})
+        built = time.perf_counter_ns()
+
+        try:
+            # 2. Connect or reuse, retrying once if a reused connection went stale
+            for attempt in range(2):
+                reused = self._connect()
+                connected = time.perf_counter_ns()
+                try:
+                    # 3. Send and wait for the status line and headers
+                    self._conn.request(method, path, body=body, headers=request_headers)
+                    response = self._conn.getresponse()
+                    break
+                except STALE_CONNECTION_ERRORS:
+                    self.close()
+                    if not reused or attempt:
+                        raise
+            first_byte = time.perf_counter_ns()
+
+            # 4. Body transfer
+            content = response.read()
+            transferred = time.perf_counter_ns()
+        except Exception:
+            # Whatever failed (timeout, reset, truncated body), the connection
+            # is in an unknown state: the next request opens a new one
+            self.close()
+            raise
+
+        # 5. Decode
+        data = _decode(content, self.format)
+        decoded = time.perf_counter_ns()
+
+        if response.will_close or not self.keep_alive:
+            self.close()
+
+        timings = {
+            "build_time": (built - start) / 1e6,
+            "connect_time": (connected - built) / 1e6,
+            "ttfb": (first_byte - connected) / 1e6,
+            "transfer_time": (transferred - first_byte) / 1e6,
+            "decode_time": (decoded - transferred) / 1e6,
+            "connection_reused": reused,
+            "request_bytes": len(body) if body else 0,
+            "response_bytes": len(content),
+        }
+        return PhasedResponse(response.status, dict(response.getheaders()), content, data, timings)
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request("DELETE", url, **kwargs)
+
+
+# Booleans go over the wire the way the API prints them
+def _xml_text(value):
+    return str(value).lower() if isinstance(value, bool) else str(value)
+
+
+# XML bodies are wrapped in `root`: <todo><title>...</title></todo>. The
+# server unwraps the root, so a bare <id>2</id> would arrive as a string
+def _encode(payload, format="json", root=None):
+    if payload is None:
+        return None
+    if format == "json":
+        return json.dumps(payload).encode("utf-8")
+    if not root:
+        raise ValueError("XML bodies need a root element")
+    element = ElementTree.Element(root)
+    for key, value in payload.items():
+        ElementTree.SubElement(element, key).text = _xml_text(value)
+    return ElementTree.tostring(element, encoding="utf-8")
+
+
+# Leaf elements become strings, repeated tags become lists
+def _element_to_dict(element):
+    data = {}
+    for child in element:
+        value = _element_to_dict(child) if len(child) else (child.text or "")
+        if child.tag in data:
+            if not isinstance(data[child.tag], list):
+                data[child.tag] = [data[child.tag]]
+            data[child.tag].append(value)
+        else:
+            data[child.tag] = value
+    return data
+
+
+def _decode_xml(content):
+    root = ElementTree.fromstring(content)
+    children = list(root)
+    # <todos><todo>...</todo>...</todos> lists the collection like the JSON form
+    if root.tag in ENTITIES and all(len(child) for child in children):
+        return {root.tag: [_element_to_dict(child) for child in children]}
+    return _element_to_dict(root)
+
+
+def _decode(content, format="json"):
+    if not content:
+        return None
+    try:
+        if format == "xml":
+            return _decode_xml(content)
+        return json.loads(content)
+    except (ValueError, ElementTree.ParseError):
+        return None
@@ -0,0 +1,484 @@
+import json
+import os
+from datetime import datetime
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+from .config import BenchmarkConfig
+from .measure import TIMESTAMP_FORMAT
+from .phased import PHASES
+
+# (operation, marker, color) for every plotted CRUD series
+SERIES = [
+    ("Create", 'o-', 'blue'),
+    ("Update", 's-', 'green'),
+    ("Delete", '^-', 'red'),
+]
+
+# (metric key, axis label, title prefix, file prefix)
+METRICS = [
+    ("transaction_time", "Transaction Time (ms)", "Transaction Time", "transaction_time"),
+    ("cpu_usage", "Server CPU Usage (%)", "Server CPU Usage", "cpu_usage"),
+    ("memory_rss", "Server Memory RSS (MB)", "Server Memory RSS", "server_memory"),
+]
+
+
+def _add_elapsed_time(time_series_data):
+    # Calculate elapsed time in ms for each operation
+    start_time = datetime.strptime(time_series_data[0]["timestamp"], TIMESTAMP_FORMAT)
+    for item in time_series_data:
+        current_time = datetime.strptime(item["timestamp"], TIMESTAMP_FORMAT)
+        item["elapsed_time"] = (current_time - start_time).total_seconds() * 1000
+
+
+# Write a results document to results/<filename>
+def write_results(filename, data, config=None):
+    config = config or BenchmarkConfig()
+    os.makedirs(config.results_dir, exist_ok=True)
+    path = os.path.join(config.results_dir, filename)
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2, default=str)
+    return path
+
+
+# Save the raw results of a run to results/<entity>_results.json
+def save_results(entity, results, config=None):
+    return write_results(f"{entity.name}_results.json", results, config)
+
+
+# Open-loop reports are labelled by offered rate, closed-loop ones carry a label
+def _load_label(report):
+    return report.get("label") or f'{report["offered_rate"]:g} req/s offered'
+
+
+# Bar chart of median/p90/p99 latency and throughput per load operation
+def plot_load_results(report, config=None, name="load"):
+    config = config or BenchmarkConfig()
+    plot_dir = os.path.join(config.plots_dir, name)
+    os.makedirs(plot_dir, exist_ok=True)
+
+    operations = {key: op for key, op in report["operations"].items() if op["count"]}
+    if not operations:
+        return
+    keys = list(operations)
+    positions = range(len(keys))
+    width = 0.25
+
+    fig, (latency_ax, throughput_ax) = plt.subplots(2, 1, figsize=(14, 9), sharex=True)
+    for offset, (stat, color) in enumerate([("median", 'blue'), ("p90", 'green'), ("p99", 'red')]):
+        latency_ax.bar([p + (offset - 1) * width for p in positions],
+                       [operations[key]["latency"][stat] for key in keys],
+                       width, label=stat, color=color)
+    latency_ax.set_ylabel('Latency (ms)')
+    latency_ax.set_title(f'Latency at {_load_label(report)} '
+                         f'({report["achieved_throughput"]:.1f} req/s achieved)')
+    latency_ax.legend()
+    latency_ax.grid(True, axis='y')
+
+    throughput_ax.bar(positions, [operations[key]["throughput"] for key in keys], color='grey')
+    throughput_ax.set_ylabel('Throughput (req/s)')
+    throughput_ax.set_xticks(list(positions))
+    throughput_ax.set_xticklabels(keys, rotation=45, ha='right')
+    throughput_ax.grid(True, axis='y')
+
+    fig.tight_layout()
+    fig.savefig(os.path.join(plot_dir, 'latency_by_operation.png'))
+    plt.close(fig)
+
+    if report.get("percentiles"):
+        plot_percentile_spectrum(report, os.path.join(plot_dir, 'latency_percentiles.png'))
+
+
+# HDR-style percentile plot: the x axis stretches the tail as 1/(1 - p)
+def plot_percentile_spectrum(report, path):
+    plt.figure(figsize=(12, 6))
+    for key, label, style in [("percentiles", "Latency (from intended send)", 'r-'),
+                              ("service_percentiles", "Service time (from actual send)", 'b--')]:
+        points = [p for p in report.get(key, []) if p["percentile"] < 100.0]
+        if points:
+            plt.plot([1.0 / (1.0 - p["percentile"] / 100.0) for p in points],
+                     [p["value"] for p in points], style, label=label)
+    plt.xscale('log')
+    ticks = [1, 2, 10, 100, 1000, 10000, 100000]
+    plt.xticks(ticks, ['0%', '50%', '90%', '99%', '99.9%', '99.99%', '99.999%'])
+    plt.xlabel('Percentile')
+    plt.ylabel('Latency (ms)')
+    plt.title(f'Latency by Percentile at {_load_label(report)}')
+    plt.legend()
+    plt.grid(True)
+    plt.savefig(path)
+    plt.close()
+
+
+# (column, axis label) for the stacked resource timeline
+TIMELINE = [
+    ("server_cpu_usage", "Server CPU (%)"),
+    ("server_rss", "Server RSS (MB)"),
+    ("client_cpu_usage", "Client CPU (%)"),
+]
+
+
+# Plot the continuous resource samples with seeding phases and sizes overlaid
+def plot_resource_timeline(series, path):
+    columns = series["columns"]
+    elapsed = columns["elapsed"]
+    fig, axes = plt.subplots(len(TIMELINE), 1, figsize=(14, 9), sharex=True)
+
+    prepare_start = None
+    spans = []
+    size_marks = []
+    for marker in series["markers"]:
+        if marker["kind"] == "prepare_start":
+            prepare_start = marker["elapsed"]
+        elif marker["kind"] == "prepare_end":
+            spans.append((prepare_start, marker["elapsed"]))
+            size_marks.append(marker)
+
+    for ax, (column, ylabel) in zip(axes, TIMELINE):
+        ax.plot(elapsed, columns[column], linewidth=0.8)
+        for start, end in spans:
+            ax.axvspan(start, end, color='grey', alpha=0.15)
+        for marker in size_marks:
+            ax.axvline(marker["elapsed"], color='red', linewidth=0.5, alpha=0.5)
+        ax.set_ylabel(ylabel)
+        ax.grid(True)
+
+    for marker in size_marks:
+        axes[0].annotate(marker["label"], (marker["elapsed"], 1), xycoords=('data', 'axes fraction'),
+                         rotation=90, fontsize=7, va='top')
+    axes[-1].set_xlabel('Elapsed Time (s) - shaded: seeding/clearing')
+    axes[0].set_title(f'Resource usage sampled every {series["interval"] * 1000:.0f} ms')
+    fig.tight_layout()
+    fig.savefig(path)
+    plt.close(fig)
+
+
+# Stack the median phase timings of every operation against population size
+def plot_phases(entity, results, path):
+    fig, axes = plt.subplots(1, len(SERIES), figsize=(18, 6), sharey=True)
+    for ax, (operation, _, _) in zip(axes, SERIES):
+        rows = results[operation.lower()]
+        sizes = [r["size"] for r in rows]
+        ax.stackplot(sizes, *[[r.get(phase, 0.0) for r in rows] for phase in PHASES], labels=PHASES)
+        ax.set_xscale('log')
+        ax.set_xlabel(f'Number of {entity.label}')
+        ax.set_title(f'{operation} phases (median)')
+        ax.grid(True)
+    axes[0].set_ylabel('Time (ms)')
+    axes[-1].legend(loc='upper left')
+    fig.tight_layout()
+    fig.savefig(path)
+    plt.close(fig)
+
+
+# Plot metrics against population size and elapsed time, then save the results
+def plot_results(entity, results, config=None):
+    config = config or BenchmarkConfig()
+    plot_dir = os.path.join(config.plots_dir, entity.name)
+    os.makedirs(plot_dir, exist_ok=True)
+
+    time_series_data = results["time_series"]
+    if time_series_data:
+        _add_elapsed_time(time_series_data)
+
+    for key, ylabel, title, prefix in METRICS:
+        if not any(key in r for r in results["create"]):
+            # Server metrics are missing when no monitor was attached
+            continue
+
+        # 1. Plots vs. Number of Objects
+        plt.figure(figsize=(12, 6))
+        for operation, style, color in SERIES:
+            rows = results[operation.lower()]
+            sizes = [r["size"] for r in rows]
+            plt.plot(sizes, [r["stats"][key]["median"] for r in rows], style,
+                     label=f'{operation} (median)', color=color)
+            plt.fill_between(sizes,
+                             [r["stats"][key]["p10"] for r in rows],
+                             [r["stats"][key]["p90"] for r in rows],
+                             color=color, alpha=0.2, label=f'{operation} p10-p90')
+        plt.xscale('log')
+        plt.xlabel(f'Number of {entity.label}')
+        plt.ylabel(ylabel)
+        plt.title(f'{title} vs. Number of {entity.label}')
+        plt.legend()
+        plt.grid(True)
+        plt.savefig(os.path.join(plot_dir, f'{prefix}_vs_objects.png'))
+        plt.close()
+
+        # 2. Time Series Plots
+        plt.figure(figsize=(12, 6))
+        for operation, style, color in SERIES:
+            data = [d for d in time_series_data if d["operation"] == operation]
+            if data:
+                plt.plot([d["elapsed_time"] for d in data],
+                         [d[key] for d in data],
+                         style, label=operation, color=color)
+        plt.xlabel('Elapsed Time (ms)')
+        plt.ylabel(ylabel)
+        plt.title(f'{title} vs Elapsed Time')
+        plt.legend()
+        plt.grid(True)
+        plt.savefig(os.path.join(plot_dir, f'{prefix}_vs_elapsed_time.png'))
+        plt.close()
+
+    if any("ttfb" in r for r in results["create"]):
+        plot_phases(entity, results, os.path.join(plot_dir, 'phases_vs_objects.png'))
+
+    if results.get("resource_series"):
+        plot_resource_timeline(results["resource_series"], os.path.join(plot_dir, 'resource_timeline.png'))
+
+    save_results(entity, results, config)
+
+
+# Median time vs fan-out of each relationship operation, one line per population
+def plot_relationship_results(relationship, results, config=None):
+    config = config or BenchmarkConfig()
+    plot_dir = os.path.join(config.plots_dir, "relationships")
+    os.makedirs(plot_dir, exist_ok=True)
+
+    operations = [operation for operation in ("list", "link", "unlink") if results.get(operation)]
+    if not operations:
+        return
+    fig, axes = plt.subplots(1, len(operations), figsize=(6 * len(operations), 5), squeeze=False)
+    for ax, operation in zip(axes[0], operations):
+        rows = results[operation]
+        for population in sorted({r["population"] for r in rows}):
+            data = [r for r in rows if r["population"] == population]
+            fanouts = [r["fanout"] for r in data]
+            stats = [r["stats"]["transaction_time"] for r in data]
+            line, = ax.plot(fanouts, [s["median"] for s in stats], 'o-', label=f'{population} objects (median)')
+            ax.fill_between(fanouts, [s["p10"] for s in stats], [s["p90"] for s in stats],
+                            color=line.get_color(), alpha=0.2)
+        ax.set_xscale('log')
+        ax.set_xlabel(f'{relationship.child.label} linked to one {relationship.parent.singular}')
+        ax.set_ylabel('Transaction Time (ms)')
+        ax.set_title(f'{operation.capitalize()} {relationship.endpoint(":id")}')
+        ax.legend()
+        ax.grid(True)
+    fig.tight_layout()
+    fig.savefig(os.path.join(plot_dir, f'{relationship.parent.name}_{relationship.name}_vs_fanout.png'))
+    plt.close(fig)
+
+
+# Response size and the phases of a full collection GET vs population, with fits
+def plot_listing_results(entity, results, config=None):
+    config = config or BenchmarkConfig()
+    plot_dir = os.path.join(config.plots_dir, "listing")
+    os.makedirs(plot_dir, exist_ok=True)
+
+    rows = results["list"]
+    if not rows:
+        return
+    sizes = [r["size"] for r in rows]
+    fits = results.get("fit", {})
+
+    fig, (bytes_ax, time_ax) = plt.subplots(1, 2, figsize=(16, 6))
+    bytes_ax.plot(sizes, [r["response_bytes"] / 1024 for r in rows], 'o', label='Response size')
+    if fits.get("response_bytes"):
+        fit = fits["response_bytes"]
+        bytes_ax.plot(sizes, [(fit["per_object"] * s + fit["fixed"]) / 1024 for s in sizes], '--',
+                      label=f'{fit["per_object"]:.0f} bytes/object')
+    bytes_ax.set_xlabel(f'Number of {entity.label}')
+    bytes_ax.set_ylabel('Response size (KiB)')
+    bytes_ax.set_title(f'GET /{entity.name} Response Size')
+    bytes_ax.legend()
+    bytes_ax.grid(True)
+
+    for key, label, color in [("ttfb", "Server (TTFB)", 'tab:red'), ("transfer_time", "Transfer", 'tab:green'),
+                              ("decode_time", "Decode", 'tab:blue'), ("transaction_time", "Total", 'black')]:
+        time_ax.plot(sizes, [r[key] for r in rows], 'o', color=color, label=label)
+        if fits.get(key):
+            fit = fits[key]
+            time_ax.plot(sizes, [fit["per_object"] * s + fit["fixed"] for s in sizes], '--', color=color,
+                         label=f'{label}: {fit["per_object"] * 1000:.2f} us/object')
+    time_ax.set_xlabel(f'Number of {entity.label}')
+    time_ax.set_ylabel('Median time (ms)')
+    time_ax.set_title(f'GET /{entity.name} Time Split')
+    time_ax.legend()
+    time_ax.grid(True)
+
+    fig.tight_layout()
+    fig.savefig(os.path.join(plot_dir, f'{entity.name}_get_collection.png'))
+    plt.close(fig)
+
+
+# Server- vs client-side filtering time vs population, one panel per selectivity
+def plot_filter_results(results, config=None):
+    config = config or BenchmarkConfig()
+    plot_dir = os.path.join(config.plots_dir, "filters")
+    os.makedirs(plot_dir, exist_ok=True)
+
+    rows = results["rows"]
+    selectivities = results["selectivities"]
+    for name in sorted({r["filter"] for r in rows}):
+        fig, axes = plt.subplots(1, len(selectivities), figsize=(5 * len(selectivities), 5),
+                                 squeeze=False, sharey=True)
+        for ax, selectivity in zip(axes[0], selectivities):
+            for approach, color in [("server", 'tab:blue'), ("client", 'tab:orange')]:
+                data = sorted((r for r in rows if r["filter"] == name and r["approach"] == approach
+                               and r["selectivity"] == selectivity), key=lambda r: r["size"])
+                sizes = [r["size"] for r in data]
+                stats = [r["stats"]["transaction_time"] for r in data]
+                ax.plot(sizes, [s["median"] for s in stats], 'o-', color=color, label=f'{approach}-side (median)')
+                ax.fill_between(sizes, [s["p10"] for s in stats], [s["p90"] for s in stats],
+                                color=color, alpha=0.2)
+            for point in results["crossovers"][name]["by_size"].get(str(selectivity), []):
+                ax.axvline(point, color='grey', linestyle=':')
+            ax.set_xscale('log')
+            ax.set_xlabel('Number of Todos')
+            ax.set_title(f'{selectivity}% matching')
+            ax.grid(True)
+        axes[0][0].set_ylabel('Transaction Time (ms)')
+        axes[0][0].legend()
+        fig.suptitle(f'GET /todos?{name}= server- vs client-side filtering')
+        fig.tight_layout()
+        fig.savefig(os.path.join(plot_dir, f'{name}_server_vs_client.png'))
+        plt.close(fig)
+
+
+# JSON (solid) vs XML (dashed) per operation: server time, latency, size and parse cost
+def plot_format_results(entity, comparison, config=None):
+    config = config or BenchmarkConfig()
+    plot_dir = os.path.join(config.plots_dir, "formats")
+    os.makedirs(plot_dir, exist_ok=True)
+
+    panels = [("ttfb", "Server time (TTFB, ms)"), ("transaction_time", "Transaction Time (ms)"),
+              ("response_bytes", "Response size (bytes)"), ("decode_time", "Client parse time (ms)")]
+    colors = {"create": 'blue', "update": 'green', "delete": 'red', "list": 'purple'}
+    fig, axes = plt.subplots(2, 2, figsize=(16, 10))
+    for ax, (key, ylabel) in zip(axes.flat, panels):
+        for operation, rows in comparison.items():
+            sizes = [r["size"] for r in rows]
+            for fmt, style in [("json", '-'), ("xml", '--')]:
+                if rows and key in rows[0][fmt]:
+                    ax.plot(sizes, [r[fmt][key] for r in rows], style, color=colors.get(operation),
+                            label=f'{operation.capitalize()} ({fmt})')
+        ax.set_xscale('log')
+        ax.set_xlabel(f'Number of {entity.label}')
+        ax.set_ylabel(ylabel)
+        ax.grid(True)
+    axes[0][0].legend(ncol=2, fontsize='small')
+    fig.suptitle(f'{entity.label}: JSON vs XML')
+    fig.tight_layout()
+    fig.savefig(os.path.join(plot_dir, f'{entity.name}_json_vs_xml.png'))
+    plt.close(fig)
+
+
+# Throughput and mean latency split into connection setup and the rest, per strategy
+def plot_connection_results(entity, results, config=None):
+    config = config or BenchmarkConfig()
+    plot_dir = os.path.join(config.plots_dir, "connections")
+    os.makedirs(plot_dir, exist_ok=True)
+
+    rows = [r for r in results["strategies"] if r["requests"]]
+    if not rows:
+        return
+    labels = [r["strategy"] for r in rows]
+    positions = range(len(rows))
+    colors = ['tab:orange' if not r["keep_alive"] else 'tab:blue' for r in rows]
+
+    fig, (throughput_ax, latency_ax) = plt.subplots(2, 1, figsize=(12, 9), sharex=True)
+    throughput_ax.bar(positions, [r["throughput"] for r in rows], color=colors)
+    throughput_ax.set_ylabel('Throughput (req/s)')
+    throughput_ax.set_title(f'{entity.label}: connection strategies (orange: new connection per request)')
+    throughput_ax.grid(True, axis='y')
+
+    connect = [r["mean_connect_time"] for r in rows]
+    rest = [max(r["latency"]["mean"] - c, 0.0) for r, c in zip(rows, connect)]
+    latency_ax.bar(positions, connect, color='tab:red', label='Connection setup')
+    latency_ax.bar(positions, rest, bottom=connect, color='grey', label='Request')
+    for position, row in zip(positions, rows):
+        latency_ax.annotate(f'{row["connect_share"]:.0%}', (position, row["latency"]["mean"]),
+                            ha='center', va='bottom')
+    latency_ax.set_ylabel('Mean latency (ms)')
+    latency_ax.set_xticks(list(positions))
+    latency_ax.set_xticklabels(labels, rotation=30, ha='right')
+    latency_ax.legend()
+    latency_ax.grid(True, axis='y')
+
+    fig.tight_layout()
+    fig.savefig(os.path.join(plot_dir, f'{entity.name}_connection_strategies.png'))
+    plt.close(fig)
+
+
+# Server RSS, window latency and throughput over a soak run, with the fitted trends
+def plot_soak_results(results, config=None):
+    config = config or BenchmarkConfig()
+    plot_dir = os.path.join(config.plots_dir, "soak")
+    os.makedirs(plot_dir, exist_ok=True)
+
+    windows = results["windows"]
+    if not windows:
+        return
+    hours = [w["elapsed"] / 3600 for w in windows]
+    analysis = results.get("analysis", {})
+
+    fig, (memory_ax, latency_ax, throughput_ax) = plt.subplots(3, 1, figsize=(12, 11), sharex=True)
+    if all("memory_rss" in w for w in windows):
+        memory_ax.plot(hours, [w["memory_rss"] for w in windows], 'b-', label='Server RSS')
+    latency_ax.plot(hours, [w["p99"] for w in windows], 'r-', label='p99')
+    latency_ax.plot(hours, [w["median"] for w in windows], 'g-', label='median')
+    for ax, key, flag in [(memory_ax, "memory_rss", "leak"), (latency_ax, "p99", "degradation")]:
+        trend = analysis.get(key)
+        if trend:
+            ax.plot(hours, [trend["slope_per_hour"] * h + trend["intercept"] for h in hours], 'k--',
+                    label=f'trend {trend["slope_per_hour"]:+.2f}/h'
+                          f'{" - " + flag.upper() if analysis.get(flag) else ""}')
+    memory_ax.set_ylabel('Server RSS (MB)')
+    latency_ax.set_ylabel('Window latency (ms)')
+    throughput_ax.plot(hours, [w["throughput"] for w in windows], color='grey')
+    throughput_ax.set_ylabel('Throughput (req/s)')
+    throughput_ax.set_xlabel('Elapsed time (h)')
+    for ax in (memory_ax, latency_ax, throughput_ax):
+        ax.grid(True)
+    memory_ax.legend()
+    latency_ax.legend()
+    memory_ax.set_title(f'Soak at {results["rate"]:g} req/s, {results["population"]} objects per entity')
+
+    fig.tight_layout()
+    fig.savefig(os.path.join(plot_dir, 'soak_timeline.png'))
+    plt.close(fig)
+
+
+# Max sustainable rate vs dataset size, and p99 vs offered rate per operation
+def plot_saturation_results(results, config=None):
+    config = config or BenchmarkConfig()
+    plot_dir = os.path.join(config.plots_dir, "saturation")
+    os.makedirs(plot_dir, exist_ok=True)
+    slo = results["slo"]["p99_ms"]
+
+    for entity_name, operations in results["entities"].items():
+        plt.figure(figsize=(12, 6))
+        for operation, by_size in operations.items():
+            sizes = sorted(by_size, key=int)
+            plt.plot([int(size) for size in sizes],
+                     [by_size[size]["max_sustainable_rate"] or 0 for size in sizes], 'o-', label=operation)
+        plt.xscale('log')
+        plt.xlabel(f'Number of {entity_name.capitalize()}')
+        plt.ylabel('Max Sustainable Rate (req/s)')
+        plt.title(f'Max Sustainable Rate under p99 <= {slo:g} ms: {entity_name}')
+        plt.legend()
+        plt.grid(True)
+        plt.savefig(os.path.join(plot_dir, f'{entity_name}_max_rate_vs_objects.png'))
+        plt.close()
+
+        fig, axes = plt.subplots(1, len(operations), figsize=(5 * len(operations), 5), squeeze=False)
+        for ax, (operation, by_size) in zip(axes[0], operations.items()):
+            for size in sorted(by_size, key=int):
+                steps = sorted(by_size[size]["steps"], key=lambda s: s["rate"])
+                ax.plot([s["rate"] for s in steps], [s["p99"] for s in steps], 'o-', label=f'{size} objects')
+                if by_size[size]["knee_rate"]:
+                    ax.axvline(by_size[size]["knee_rate"], linestyle=':', alpha=0.5)
+            ax.axhline(slo, color='red', linestyle='--', label='SLO')
+            ax.set_xscale('log')
+            ax.set_xlabel('Offered Rate (req/s)')
+            ax.set_title(f'{entity_name}.{operation}')
+            ax.grid(True)
+        axes[0][0].set_ylabel('p99 Latency (ms)')
+        axes[0][-1].legend()
+        fig.tight_layout()
+        fig.savefig(os.path.join(plot_dir, f'{entity_name}_p99_vs_rate.png'))
+        plt.close(fig)
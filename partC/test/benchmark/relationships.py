@@ -0,0 +1,176 @@
+import numpy as np
+import requests
+
+from .config import BenchmarkConfig
+from .crud import clear_all, link_pairs, seed
+from .entities import ENTITIES, RELATIONSHIPS
+from .measure import measure_operation
+from .plotting import plot_relationship_results, write_results
+from .runner import TIMING_MODES, aggregate_samples, measuring_client
+from .server import server_monitor
+from .warmup import warm_up
+
+# Operations measured on the relationship route of one parent
+OPERATIONS = ["List", "Link", "Unlink"]
+
+
+# List, link and unlink one spare child on the hub parent, timing each step
+def _measure_cycle(relationship, client, config, hub, spare, monitor):
+    metrics = {}
+
+    # 1. Measure GET of the hub's linked children
+    def list_operation():
+        return client.get(config.url(relationship.endpoint(hub)))
+
+    response, metrics["List"] = measure_operation(list_operation, monitor=monitor)
+    if response.status_code != 200:
+        print(f"Error listing {relationship.key} of {hub}: {response.status_code}")
+
+    # 2. Measure POST of one more link
+    def link_operation():
+        return client.post(config.url(relationship.endpoint(hub)), json={"id": spare})
+
+    response, metrics["Link"] = measure_operation(link_operation, monitor=monitor)
+    if response.status_code not in [200, 201]:
+        print(f"Error linking {relationship.key} {hub} -> {spare}: {response.status_code}")
+        return metrics
+
+    # 3. Measure DELETE of that link, bringing the fan-out back
+    def unlink_operation():
+        return client.delete(config.url(relationship.link_endpoint(hub, spare)))
+
+    response, metrics["Unlink"] = measure_operation(unlink_operation, monitor=monitor)
+    if response.status_code not in [200, 204]:
+        raise RuntimeError(f"Could not unlink {relationship.key} {hub} -> {spare}: {response.status_code}")
+
+    return metrics
+
+
+# One untimed link/unlink, so a route or body format the server rejects
+# fails fast instead of spinning through the warm-up
+def _check_link(relationship, client, config, hub, spare):
+    response = client.post(config.url(relationship.endpoint(hub)), json={"id": spare})
+    if response.status_code not in [200, 201]:
+        raise RuntimeError(f"The server rejected {config.format.upper()} links on {relationship.key} "
+                           f"with {response.status_code}; try --format json")
+    client.delete(config.url(relationship.link_endpoint(hub, spare)))
+
+
+# Fit median time against fan-out: ms per link and the growth exponent
+def _fit(rows):
+    points = [(r["fanout"], r["transaction_time"]) for r in rows if r["fanout"] > 0]
+    if len(points) < 2:
+        return None
+    fanouts, times = (np.array(values, dtype=float) for values in zip(*points))
+    slope, intercept = np.polyfit(fanouts, times, 1)
+    # log-log slope: ~0 means flat, ~1 means linear in the link count
+    exponent, _ = np.polyfit(np.log(fanouts), np.log(np.maximum(times, 1e-6)), 1)
+    return {"ms_per_link": float(slope), "intercept_ms": float(intercept), "exponent": float(exponent)}
+
+
+# Sweep fan-out on one parent at every population size
+def measure_relationship(relationship, session, config=None, monitor=None):
+    """Time list/link/unlink on one relationship route as its fan-out grows.
+
+    For every population in ``config.relationship_populations`` the parent
+    and child collections are rebuilt with that many objects. A single hub
+    parent is then linked to each size in ``config.fanout_sizes`` (ascending,
+    only the delta is linked) and every operation is sampled
+    ``config.samples`` times. The link/unlink cycle uses a spare child so
+    the fan-out stays exact; more children are seeded when the fan-out
+    outgrows the population. Untimed cycles at the first point warm the
+    route up until its latency is steady.
+    """
+    config = config or BenchmarkConfig()
+    if config.timing not in TIMING_MODES:
+        raise ValueError(f"Unknown timing mode '{config.timing}', expected one of {TIMING_MODES}")
+    parent, child = relationship.parent, relationship.child
+    # In XML a link body is the child reference: <category><id>2</id></category>
+    client = measuring_client(config, session, xml_root=child.singular)
+    fanouts = sorted(set(config.fanout_sizes))
+
+    results = {operation.lower(): [] for operation in OPERATIONS}
+    results["warmup"] = None
+    for population in config.relationship_populations:
+        print(f"\n=== {relationship.key}: {population} {parent.name} and {child.name} ===")
+        clear_all(parent, session, config.base_url, config.workers)
+        clear_all(child, session, config.base_url, config.workers)
+        parents, _ = seed(parent, max(population, 1), config.base_url, config.workers)
+        children, _ = seed(child, population, config.base_url, config.workers)
+        hub = parents[0]
+        linked = 0
+
+        for fanout in fanouts:
+            # One spare child beyond the linked ones for the link/unlink cycle
+            if len(children) < fanout + 1:
+                more, _ = seed(child, fanout + 1 - len(children), config.base_url, config.workers)
+                children += more
+            if fanout > linked:
+                failed = link_pairs(relationship, [(hub, c) for c in children[linked:fanout]],
+                                    config.base_url, config.workers)
+                if failed:
+                    raise RuntimeError(f"Could not link {len(failed)} {child.name} to {parent.singular} {hub}")
+                linked = fanout
+
+            if results["warmup"] is None:
+                _check_link(relationship, client, config, hub, children[fanout])
+
+                def warm_up_cycle():
+                    metrics = _measure_cycle(relationship, client, config, hub, children[fanout], None)
+                    if len(metrics) < len(OPERATIONS):
+                        return None
+                    return sum(m["transaction_time"] for m in metrics.values())
+
+                results["warmup"] = warm_up(warm_up_cycle, config, f"{relationship.key} warm-up") or {}
+
+            print(f"Measuring {relationship.key} at fan-out {fanout} ({config.samples} samples)...")
+            samples = {operation: [] for operation in OPERATIONS}
+            for _ in range(config.samples):
+                cycle = _measure_cycle(relationship, client, config, hub, children[fanout], monitor)
+                for operation, metrics in cycle.items():
+                    samples[operation].append(metrics)
+
+            for operation in OPERATIONS:
+                if samples[operation]:
+                    row = aggregate_samples(operation, fanout, samples[operation])
+                    row.update(fanout=fanout, population=population, children=len(children))
+                    results[operation.lower()].append(row)
+
+    if client is not session:
+        client.close()
+
+    results["fit"] = {
+        operation.lower(): {
+            str(population): _fit([r for r in results[operation.lower()] if r["population"] == population])
+            for population in config.relationship_populations
+        }
+        for operation in OPERATIONS
+    }
+    for operation, fits in results["fit"].items():
+        for population, fit in fits.items():
+            if fit:
+                print(f"  {operation} at population {population}: {fit['ms_per_link'] * 1000:.3f} us/link, "
+                      f"growth exponent {fit['exponent']:.2f}")
+    return results
+
+
+# Run the relationship scaling benchmark on the given routes
+def run_relationship_benchmark(relationships=None, config=None):
+    """Measure every relationship route (all six by default) and save plots and results."""
+    config = config or BenchmarkConfig()
+    relationships = relationships or list(RELATIONSHIPS.values())
+    session = requests.Session()
+    all_results = {}
+    with server_monitor(config) as monitor:
+        for entity in ENTITIES.values():
+            clear_all(entity, session, config.base_url, config.workers)
+
+        for relationship in relationships:
+            results = measure_relationship(relationship, session, config, monitor)
+            write_results(f"relationship_{relationship.parent.name}_{relationship.name}_results.json",
+                          results, config)
+            plot_relationship_results(relationship, results, config)
+            all_results[relationship.key] = results
+
+    print(f"\nRelationship testing completed. Results saved to {config.plots_dir}/relationships/ directory.")
+    return all_results
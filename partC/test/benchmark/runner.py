@@ -0,0 +1,224 @@
+import requests
+
+from .config import BenchmarkConfig
+from .crud import clear_all, delete_ids, seed
+from .entities import CATEGORIES, PROJECTS, TODOS
+from .measure import METRIC_KEYS, measure_operation
+from .phased import FORMATS, PHASES, PhasedClient
+from .plotting import plot_results
+from .sampler import ResourceSampler
+from .server import server_monitor
+from .stats import summarize
+from .warmup import warm_up
+
+OPERATIONS = ["Create", "Update", "Delete"]
+
+# Population handling between sweep steps
+SWEEP_MODES = ["incremental", "rebuild"]
+
+# wall: one perf_counter_ns span around a requests call
+# phased: PhasedClient breakdown into build/connect/TTFB/transfer/decode
+TIMING_MODES = ["wall", "phased"]
+
+
+# Client for the measured requests: the phased one for phased timing or XML,
+# sending XML bodies wrapped in `xml_root`
+def measuring_client(config, session, xml_root=None):
+    if config.timing == "phased" or config.format != "json":
+        return PhasedClient(config.base_url, timeout=config.request_timeout, format=config.format,
+                            xml_root=xml_root)
+    return session
+
+
+# Aggregate the K samples of one operation at one size into a result row
+def aggregate_samples(operation, size, samples):
+    row = {"size": size, "samples": len(samples), "timestamp": samples[0]["timestamp"]}
+    keys = [key for key in METRIC_KEYS if key in samples[0]]
+    row["stats"] = {key: summarize([m[key] for m in samples]) for key in keys}
+    row["distribution"] = {key: [m[key] for m in samples] for key in keys}
+    # Keep the medians as the headline values
+    for key in keys:
+        row[key] = row["stats"][key]["median"]
+
+    time_stats = row["stats"]["transaction_time"]
+    print(f"  {operation} transaction time: median {time_stats['median']:.2f} ms "
+          f"(p90 {time_stats['p90']:.2f} ms, n={len(samples)})")
+    if "ttfb" in row:
+        print(f"  {operation} phases: " + ", ".join(f"{phase} {row[phase]:.3f} ms" for phase in PHASES))
+    if "cpu_usage" in row:
+        print(f"  {operation} server CPU usage: {row['cpu_usage']:.2f}% ({row['cpu_time']:.2f} ms CPU)")
+        print(f"  {operation} server memory: {row['memory_rss']:.2f} MB RSS, "
+              f"{row['threads']:.0f} threads, {row['open_fds']:.0f} fds")
+    return row
+
+
+# Create, update and delete one object, timing each step
+def _measure_cycle(entity, client, config, population, monitor, mark):
+    metrics = {}
+
+    # 1. Measure CREATE performance
+    new_object = entity.generate()
+
+    def create_operation():
+        return client.post(config.url(entity.endpoint), json=new_object)
+
+    mark("Create")
+    response, metrics["Create"] = measure_operation(create_operation, monitor=monitor)
+    if response.status_code not in [200, 201]:
+        print(f"Error creating test {entity.singular}: {response.status_code}")
+        return metrics
+
+    # Get the ID of the newly created object for update and delete operations
+    object_id = response.json()['id']
+
+    # 2. Measure UPDATE performance
+    update_payload = entity.update_payload()
+
+    def update_operation():
+        return client.put(config.url(entity.item_endpoint(object_id)), json=update_payload)
+
+    mark("Update")
+    response, metrics["Update"] = measure_operation(update_operation, monitor=monitor)
+
+    # 3. Measure DELETE performance
+    def delete_operation():
+        return client.delete(config.url(entity.item_endpoint(object_id)))
+
+    mark("Delete")
+    response, metrics["Delete"] = measure_operation(delete_operation, monitor=monitor)
+    if response.status_code not in [200, 204]:
+        # Keep the population exact: the object is still there
+        print(f"Error deleting test {entity.singular}: {response.status_code}")
+        population.append(object_id)
+
+    return metrics
+
+
+# Bring the population to exactly `target` objects and return the tracked IDs
+def prepare_population(entity, session, config, population, target, seeding, clearing, size):
+    if config.sweep == "rebuild":
+        # Clear all existing objects and build the base set from scratch
+        clear_stats = clear_all(entity, session, config.base_url, config.workers)
+        clearing.append({"size": size, **clear_stats})
+        population = []
+
+    if target > len(population):
+        # Only create the delta to the next size
+        ids, seed_stats = seed(entity, target - len(population), config.base_url, config.workers)
+        seeding.append({"size": size, **seed_stats})
+        population = population + ids
+    elif target < len(population):
+        # Sizes are not ascending: drop the surplus objects
+        failed = delete_ids(entity, population[target:], config.base_url, config.workers)
+        population = population[:target] + failed
+
+    # Every size is measured against exactly `target` objects or not at all
+    if len(population) != target:
+        raise RuntimeError(f"Prepared {len(population)} {entity.name} instead of {target} for size {size}")
+    return population
+
+
+# Measure create/update/delete performance for increasing number of objects
+def measure_performance(entity, session, config=None, monitor=None, sampler=None):
+    """Sweep ``config.test_sizes`` measuring CRUD operations at each size.
+
+    In ``incremental`` sweep mode the population is kept between steps and
+    only the delta to the next size is created; the measured object is
+    created and deleted again so the population stays exact. ``rebuild``
+    clears and reseeds the whole population for every size.
+
+    Every operation is sampled ``config.samples`` times per size; result rows
+    carry the median as headline value plus full statistics and samples.
+    Server CPU and memory are recorded when a ``ServerMonitor`` is given,
+    and seeding and operation markers are overlaid on ``sampler``. With
+    ``config.timing == "phased"`` every sample also carries its phase split;
+    ``config.format == "xml"`` sends and accepts XML bodies instead of JSON.
+    Before the first size an adaptive warm-up repeats untimed cycles until
+    their latency is steady; its length is returned under ``warmup``.
+    """
+    config = config or BenchmarkConfig()
+    if config.sweep not in SWEEP_MODES:
+        raise ValueError(f"Unknown sweep mode '{config.sweep}', expected one of {SWEEP_MODES}")
+    if config.timing not in TIMING_MODES:
+        raise ValueError(f"Unknown timing mode '{config.timing}', expected one of {TIMING_MODES}")
+    if config.format not in FORMATS:
+        raise ValueError(f"Unknown format '{config.format}', expected one of {FORMATS}")
+
+    # Measured operations go through the phased client when requested or
+    # when they speak XML; seeding and clearing always use the regular session
+    client = measuring_client(config, session, entity.singular)
+
+    results = {operation.lower(): [] for operation in OPERATIONS}
+    seeding = []
+    clearing = []
+    time_series_data = []
+
+    # Start every sweep from an empty collection
+    clear_all(entity, session, config.base_url, config.workers)
+    population = []
+    mark = sampler.mark if sampler else (lambda label, kind="operation": None)
+
+    # Run untimed cycles until JIT and caches settle so the first sizes
+    # are not dominated by warm-up
+    def warm_up_cycle():
+        metrics = _measure_cycle(entity, client, config, population, None, lambda label: None)
+        if len(metrics) < len(OPERATIONS):
+            return None
+        return sum(m["transaction_time"] for m in metrics.values())
+
+    results["warmup"] = warm_up(warm_up_cycle, config, f"{entity.name} warm-up", mark)
+
+    for size in config.test_sizes:
+        print(f"\n=== Testing with {size} pre-existing {entity.name} ===")
+
+        # Create the base set minus 1 (since we'll measure the last creation)
+        mark(f"prepare {size}", "prepare_start")
+        population = prepare_population(entity, session, config, population, max(size - 1, 0),
+                                         seeding, clearing, size)
+        mark(f"size {size}", "prepare_end")
+
+        # Sample every operation K times; each cycle leaves the population unchanged
+        print(f"Measuring CREATE/UPDATE/DELETE performance ({config.samples} samples)...")
+        samples = {operation: [] for operation in OPERATIONS}
+        for _ in range(config.samples):
+            for operation, metrics in _measure_cycle(entity, client, config, population, monitor, mark).items():
+                metrics["size"] = size
+                samples[operation].append(metrics)
+                time_series_data.append({"operation": operation, **metrics})
+
+        for operation in OPERATIONS:
+            if samples[operation]:
+                results[operation.lower()].append(aggregate_samples(operation, size, samples[operation]))
+
+    if client is not session:
+        client.close()
+
+    results["time_series"] = time_series_data
+    results["seeding"] = seeding
+    results["clearing"] = clearing
+    return results
+
+
+# Run the full CRUD benchmark for one entity and write its plots and results
+def run_benchmark(entity, config=None):
+    config = config or BenchmarkConfig()
+    print(f"Starting performance measurements for {entity.name}...")
+    session = requests.Session()
+    with server_monitor(config) as monitor:
+        for other in (CATEGORIES, PROJECTS, TODOS):
+            clear_all(other, session, config.base_url, config.workers)
+
+        sampler = ResourceSampler(monitor, config.sample_interval) if config.sample_interval else None
+        if sampler:
+            sampler.start()
+        try:
+            results = measure_performance(entity, session, config, monitor, sampler)
+        finally:
+            if sampler:
+                sampler.stop()
+        if sampler:
+            results["resource_series"] = sampler.to_dict()
+    plot_results(entity, results, config)
+
+    print(f"\nTesting completed. Results saved to {config.plots_dir}/{entity.name}/ directory.")
+    return results
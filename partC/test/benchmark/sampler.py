@@ -0,0 +1,106 @@
+import os
+import threading
+import time
+from array import array
+
+import psutil
+
+from .telemetry import MB
+
+# Columns recorded on every tick, in order
+COLUMNS = [
+    "elapsed",           # s since the sampler started
+    "server_cpu_usage",  # % of one core since the previous tick
+    "server_rss",        # MB
+    "server_threads",
+    "server_fds",
+    "client_cpu_usage",  # %
+    "available_memory",  # MB, system-wide
+]
+
+
+class ResourceSampler:
+    """Background thread that samples server and client resources at a fixed rate.
+
+    Every column is an ``array('d')`` so a multi-hour run at 50 ms costs a
+    few MB. ``mark()`` overlays operation markers on the same clock.
+    """
+
+    def __init__(self, monitor=None, interval=0.05):
+        self.monitor = monitor
+        self.interval = interval
+        self.columns = {name: array('d') for name in COLUMNS}
+        self.markers = []
+        self._client = psutil.Process(os.getpid())
+        self._stop = threading.Event()
+        self._thread = None
+        self._start_ns = None
+
+    def elapsed(self):
+        return (time.perf_counter_ns() - self._start_ns) / 1e9
+
+    def mark(self, label, kind="operation"):
+        if self._start_ns is not None:
+            self.markers.append({"elapsed": self.elapsed(), "label": label, "kind": kind})
+
+    def _run(self):
+        previous = self.monitor.snapshot() if self.monitor else None
+        self._client.cpu_percent()
+        next_tick = time.perf_counter() + self.interval
+        while not self._stop.wait(max(0.0, next_tick - time.perf_counter())):
+            # Schedule from the previous deadline so the rate does not drift
+            next_tick += self.interval
+            try:
+                previous = self._sample(previous)
+            except psutil.NoSuchProcess:
+                # The server went away; keep what was recorded so far
+                break
+
+    # Append one row and return the server snapshot for the next delta
+    def _sample(self, previous):
+        snapshot = None
+        cpu_usage = rss = threads = fds = float("nan")
+        if self.monitor:
+            snapshot = self.monitor.snapshot()
+            metrics = self.monitor.delta(previous, snapshot)
+            cpu_usage = metrics["cpu_usage"]
+            rss = metrics["memory_rss"]
+            threads = metrics["threads"]
+            fds = metrics["open_fds"]
+
+        row = (
+            self.elapsed(),
+            cpu_usage,
+            rss,
+            threads,
+            fds,
+            self._client.cpu_percent(),
+            psutil.virtual_memory().available / MB,
+        )
+        for name, value in zip(COLUMNS, row):
+            self.columns[name].append(value)
+        return snapshot
+
+    def start(self):
+        self._start_ns = time.perf_counter_ns()
+        self._thread = threading.Thread(target=self._run, name="resource-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def to_dict(self):
+        return {
+            "interval": self.interval,
+            "columns": {name: values.tolist() for name, values in self.columns.items()},
+            "markers": self.markers,
+        }
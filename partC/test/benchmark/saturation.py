@@ -0,0 +1,143 @@
+import math
+import time
+
+import numpy as np
+
+from .config import BenchmarkConfig
+from .crud import clear_all, list_ids, restore_population
+from .loadgen import build_report, drive_load, load_targets
+from .plotting import plot_saturation_results, write_results
+
+# Pause between load steps so queued work drains before the next rate
+COOLDOWN = 1.0
+
+# Give up ramping down below this offered rate
+MIN_RATE = 1.0
+
+
+# Offer `rate` requests/s of one operation and judge the step against the SLO
+def _run_step(entity, operation, session, pool, size, rate, config):
+    # Deletes consume objects: give the step enough of them on top of the population
+    reserve = math.ceil(rate * config.step_duration) if operation == "delete" else 0
+    restore_population(entity, pool, size + reserve, config.base_url, config.workers)
+
+    recorder, elapsed = drive_load(config, [(entity, operation)], {entity.name: pool},
+                                   rate=rate, duration=config.step_duration)
+    report = build_report(recorder, elapsed, config, rate=rate)
+    requests = max(report["requests"], 1)
+    error_rate = report["errors"] / requests
+    p99 = report["latency"].get("p99", float("inf"))
+    passed = p99 <= config.slo_p99_ms and error_rate <= config.max_error_rate
+    print(f"    {rate:8.1f} req/s -> p99 {p99:8.2f} ms, errors {error_rate:6.2%}, "
+          f"achieved {report['achieved_throughput']:.1f} req/s: {'ok' if passed else 'SLO violated'}")
+
+    # Worker processes mutate copies of the pool: resync with the server
+    # before restoring the population for the next step
+    pool[:] = list_ids(entity, session, config.base_url)
+    restore_population(entity, pool, size, config.base_url, config.workers)
+    time.sleep(COOLDOWN)
+
+    return {
+        "rate": rate,
+        "achieved_throughput": report["achieved_throughput"],
+        "p99": p99,
+        "median": report["latency"].get("median"),
+        "error_rate": error_rate,
+        "passed": passed,
+    }
+
+
+# Knee of the p99-vs-rate curve: the point farthest below the chord
+def find_knee(steps):
+    """Return the offered rate where p99 latency starts to climb steeply.
+
+    Uses the maximum-distance-to-chord rule on the normalized
+    (rate, p99) curve of all steps run at one dataset size.
+    """
+    points = sorted((s["rate"], s["p99"]) for s in steps if math.isfinite(s["p99"]))
+    if len(points) < 3:
+        return points[-1][0] if points else None
+
+    rates = np.array([p[0] for p in points], dtype=float)
+    latencies = np.array([p[1] for p in points], dtype=float)
+    x = (rates - rates[0]) / (rates[-1] - rates[0] or 1.0)
+    y = (latencies - latencies.min()) / (np.ptp(latencies) or 1.0)
+    # Distance below the straight line from the first to the last point
+    distance = (x * (y[-1] - y[0]) + y[0]) - y
+    return float(rates[int(np.argmax(distance))])
+
+
+# Ramp the offered rate, then binary-search the highest rate inside the SLO
+def search_max_rate(entity, operation, session, pool, size, config):
+    steps = []
+    last_good, first_bad = None, None
+
+    # 1. Ramp: double the rate until the SLO breaks or the cap is reached;
+    # halve it instead while even the start rate is too much
+    rate = config.start_rate
+    while True:
+        step = _run_step(entity, operation, session, pool, size, rate, config)
+        steps.append(step)
+        if step["passed"]:
+            last_good = rate
+            if first_bad is not None or rate * 2 > config.max_rate:
+                break
+            rate *= 2
+        else:
+            first_bad = rate
+            if last_good is not None or rate / 2 < MIN_RATE:
+                break
+            rate /= 2
+
+    # 2. Binary search between the last passing and the first failing rate
+    if last_good is not None and first_bad is not None:
+        low, high = last_good, first_bad
+        while (high - low) / low > config.search_tolerance:
+            rate = (low + high) / 2
+            step = _run_step(entity, operation, session, pool, size, rate, config)
+            steps.append(step)
+            if step["passed"]:
+                low = rate
+            else:
+                high = rate
+        last_good = low
+
+    return {
+        "max_sustainable_rate": last_good,
+        "capped": first_bad is None,
+        "knee_rate": find_knee(steps),
+        "steps": steps,
+    }
+
+
+# Find the max sustainable throughput of every entity operation at every size
+def run_saturation(entities, session, config=None):
+    """Search, per entity, operation and dataset size, the highest offered
+    rate whose corrected p99 stays within ``config.slo_p99_ms`` and whose
+    error rate stays within ``config.max_error_rate``."""
+    config = config or BenchmarkConfig()
+    load_targets(entities, config.operations)
+    results = {
+        "slo": {"p99_ms": config.slo_p99_ms, "max_error_rate": config.max_error_rate},
+        "step_duration": config.step_duration,
+        "processes": config.processes,
+        "entities": {},
+    }
+
+    for entity in entities:
+        clear_all(entity, session, config.base_url, config.workers)
+        pool = []
+        entity_results = results["entities"].setdefault(entity.name, {})
+        for size in config.saturation_sizes:
+            restore_population(entity, pool, size, config.base_url, config.workers)
+            for operation in config.operations:
+                print(f"\n=== Saturation search: {entity.name}.{operation} with {size} objects ===")
+                outcome = search_max_rate(entity, operation, session, pool, size, config)
+                entity_results.setdefault(operation, {})[str(size)] = outcome
+                print(f"  max sustainable rate: {outcome['max_sustainable_rate']} req/s"
+                      f"{' (cap reached)' if outcome['capped'] else ''}, knee at {outcome['knee_rate']} req/s")
+        clear_all(entity, session, config.base_url, config.workers)
+
+    write_results("saturation_results.json", results, config)
+    plot_saturation_results(results, config)
+    return results
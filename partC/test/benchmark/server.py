@@ -0,0 +1,55 @@
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+import psutil
+from todo_server import TodoServer
+
+from .telemetry import ServerMonitor, find_listening_process
+
+
+def url_port(base_url):
+    parsed = urlparse(base_url)
+    return parsed.port or (443 if parsed.scheme == "https" else 80)
+
+
+# Start the Todo Manager jar and wait until it answers on base_url
+def launch_server(jar_path, base_url):
+    parsed = urlparse(base_url)
+    return TodoServer(port=url_port(base_url), jar=jar_path, host=parsed.hostname or "localhost").start()
+
+
+# Shut down a server started by launch_server, killing it if it hangs
+def stop_server(server):
+    server.stop()
+
+
+@contextmanager
+def server_monitor(config):
+    """Yield a ServerMonitor for the process serving ``config.base_url``.
+
+    The process is taken from ``config.server_pid``, found by the port it
+    listens on, or launched from ``config.jar_path`` (and stopped again on
+    exit) when nothing is listening yet. When no local process can be
+    found, e.g. for a remote server, a warning is printed and None is
+    yielded so only client-side metrics are recorded.
+    """
+    launched = None
+    if config.server_pid:
+        process = psutil.Process(config.server_pid)
+    else:
+        process = find_listening_process(url_port(config.base_url))
+        if process is None and config.jar_path:
+            launched = launch_server(config.jar_path, config.base_url)
+            process = psutil.Process(launched.pid)
+
+    if process is None:
+        print(f"Warning: no local server process is listening for {config.base_url}; "
+              "recording client-side metrics only (start the jar, or pass --server-pid or --jar)")
+    else:
+        print(f"Monitoring server process {process.pid}")
+
+    try:
+        yield ServerMonitor(process) if process is not None else None
+    finally:
+        if launched is not None:
+            stop_server(launched)
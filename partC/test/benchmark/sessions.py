@@ -0,0 +1,47 @@
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+# Create a session that keeps exactly one pooled keep-alive connection
+def single_connection_session():
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class WorkerSessions:
+    """Hands every worker thread its own single-connection session.
+
+    Used as a context manager around a thread pool so that each worker
+    reuses one keep-alive connection and all of them are closed afterwards.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._sessions = []
+
+    def get(self):
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = single_connection_session()
+            self._local.session = session
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def close(self):
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,135 @@
+import time
+
+import numpy as np
+
+from .config import BenchmarkConfig
+from .crud import clear_all, list_ids, restore_population
+from .loadgen import build_report, drive_load, load_targets
+from .plotting import plot_soak_results, write_results
+from .server import server_monitor
+
+# Per-window series fitted against elapsed time: (window key, flag, threshold attribute)
+TRENDS = [
+    ("memory_rss", "leak", "leak_threshold"),
+    ("p99", "degradation", "degradation_threshold"),
+]
+
+# Only flag slopes of fits that explain at least this much of the variance,
+# so window-to-window noise is not extrapolated into an hourly trend
+MIN_R_SQUARED = 0.5
+
+
+# Least-squares slope per hour of one series, with its fit quality
+def _trend(hours, values):
+    if len(hours) < 3:
+        return None
+    hours = np.array(hours, dtype=float)
+    values = np.array(values, dtype=float)
+    slope, intercept = np.polyfit(hours, values, 1)
+    residual = values - (slope * hours + intercept)
+    total = np.sum((values - values.mean()) ** 2)
+    return {
+        "slope_per_hour": float(slope),
+        "intercept": float(intercept),
+        "r_squared": float(1.0 - np.sum(residual ** 2) / total) if total > 0 else 0.0,
+        "windows": int(len(hours)),
+    }
+
+
+# Fit memory and p99 against time after the warm-up and flag steep slopes
+def analyze_soak(windows, config):
+    """Regression slopes of server RSS (MB/h) and window p99 (ms/h).
+
+    Windows that end within ``config.soak_warmup`` seconds are left out
+    while heaps and caches settle. A slope above ``config.leak_threshold``
+    flags a leak, one above ``config.degradation_threshold`` a latency
+    degradation, as long as the fit has an r^2 of at least MIN_R_SQUARED.
+    """
+    steady = [w for w in windows if w["elapsed"] > config.soak_warmup] or windows
+    hours = [w["elapsed"] / 3600 for w in steady]
+    analysis = {}
+    for key, flag, threshold_name in TRENDS:
+        # Server RSS is missing when no monitor was attached
+        trend = _trend(hours, [w[key] for w in steady]) if all(key in w for w in steady) else None
+        threshold = getattr(config, threshold_name)
+        analysis[key] = trend
+        analysis[flag] = bool(trend and trend["slope_per_hour"] > threshold
+                              and trend["r_squared"] >= MIN_R_SQUARED)
+        analysis[f"{flag}_threshold"] = threshold
+    return analysis
+
+
+# Churn the population for hours, one load window at a time
+def run_soak(entities, session, config=None):
+    """Hold a steady churn for ``config.soak_duration`` seconds.
+
+    Every ``config.soak_window`` seconds of open-loop load at ``config.rate``
+    (spread over the entities and ``config.operations``) becomes one
+    window with its latency percentiles and, when the server process is
+    local, its RSS, threads, file descriptors and CPU. Between windows each population is brought
+    back to ``config.load_population`` so it stays constant however the
+    mix drifts. Results are rewritten after every window and the run can
+    be stopped early with Ctrl+C; the trend analysis covers the windows
+    completed so far.
+    """
+    config = config or BenchmarkConfig()
+    targets = load_targets(entities, config.operations)
+    windows = []
+    results = {"rate": config.rate, "window": config.soak_window, "population": config.load_population,
+               "operations": config.operations, "windows": windows}
+
+    with server_monitor(config) as monitor:
+        pools = {}
+        for entity in entities:
+            clear_all(entity, session, config.base_url, config.workers)
+            pools[entity.name] = []
+            restore_population(entity, pools[entity.name], config.load_population,
+                               config.base_url, config.workers)
+
+        print(f"\n=== Soak: {config.rate:g} req/s for {config.soak_duration / 3600:g} h "
+              f"on {', '.join(e.name for e in entities)} ===")
+        start = time.perf_counter()
+        try:
+            while time.perf_counter() - start < config.soak_duration:
+                before = monitor.snapshot() if monitor else None
+                recorder, elapsed = drive_load(config, targets, pools, duration=config.soak_window)
+                resources = monitor.delta(before, monitor.snapshot()) if monitor else {}
+                report = build_report(recorder, elapsed, config)
+
+                window = {
+                    "elapsed": time.perf_counter() - start,
+                    "throughput": report["achieved_throughput"],
+                    "requests": report["requests"],
+                    "errors": report["errors"],
+                    "median": report["latency"].get("median", 0.0),
+                    "p99": report["latency"].get("p99", 0.0),
+                    "max": report["latency"].get("max", 0.0),
+                    **resources,
+                }
+                windows.append(window)
+                server = (f"RSS {window['memory_rss']:.1f} MB, {window['threads']} threads, "
+                          if resources else "")
+                print(f"  {window['elapsed'] / 60:7.1f} min: p99 {window['p99']:.2f} ms, "
+                      f"{window['throughput']:.1f} req/s, {server}errors {window['errors']}")
+
+                # Worker processes churn copies of the pools: resync, then
+                # put the population back to its size
+                for entity in entities:
+                    pools[entity.name] = list_ids(entity, session, config.base_url)
+                    restore_population(entity, pools[entity.name], config.load_population,
+                                       config.base_url, config.workers)
+
+                results["analysis"] = analyze_soak(windows, config)
+                write_results("soak_results.json", results, config)
+        except KeyboardInterrupt:
+            print("\nSoak interrupted, analyzing the completed windows")
+
+    analysis = results["analysis"] = analyze_soak(windows, config)
+    for key, flag, _ in TRENDS:
+        trend = analysis[key]
+        if trend:
+            print(f"{key}: {trend['slope_per_hour']:+.3f}/h (r^2 {trend['r_squared']:.2f}) -> "
+                  f"{flag.upper() if analysis[flag] else 'ok'} (threshold {analysis[flag + '_threshold']:g}/h)")
+    write_results("soak_results.json", results, config)
+    plot_soak_results(results, config)
+    return results
@@ -0,0 +1,25 @@
+import numpy as np
+
+# Percentiles reported for every sampled metric
+PERCENTILES = [10, 50, 90, 99]
+
+
+# Summarize a list of samples into the distribution statistics we report
+def summarize(values):
+    """Return min, p10, median, mean, p90, p99, max and stddev of ``values``."""
+    if not values:
+        return {"count": 0}
+
+    data = np.asarray(values, dtype=float)
+    p10, median, p90, p99 = np.percentile(data, PERCENTILES)
+    return {
+        "count": int(data.size),
+        "min": float(data.min()),
+        "p10": float(p10),
+        "median": float(median),
+        "mean": float(data.mean()),
+        "p90": float(p90),
+        "p99": float(p99),
+        "max": float(data.max()),
+        "stddev": float(data.std(ddof=1)) if data.size > 1 else 0.0,
+    }
@@ -0,0 +1,111 @@
+import os
+import time
+
+import psutil
+
+MB = 1024 * 1024
+
+
+def _task_dir(pid):
+    return f"/proc/{pid}/task"
+
+
+# Precise CPU time of the live threads of a process, in nanoseconds
+def _thread_cpu_time_ns(process):
+    # On Linux the per-thread schedstat counters have nanosecond resolution,
+    # whereas cpu_times() only advances in clock ticks (usually 10 ms)
+    task_dir = _task_dir(process.pid)
+    if not os.path.isdir(task_dir):
+        return None
+    total = 0
+    for tid in os.listdir(task_dir):
+        try:
+            with open(f"{task_dir}/{tid}/schedstat") as f:
+                total += int(f.read().split()[0])
+        except (OSError, ValueError, IndexError):
+            # Thread exited between listdir and open
+            continue
+    return total or None
+
+
+def _cpu_time_ns(process):
+    times = process.cpu_times()
+    return int((times.user + times.system) * 1e9)
+
+
+# Tolerated disagreement between the two CPU clocks before trusting cpu_times()
+TICK_SLACK_NS = 20_000_000
+
+
+def _open_fds(process):
+    if hasattr(process, "num_fds"):
+        return process.num_fds()
+    return process.num_handles()
+
+
+class ServerMonitor:
+    """Samples CPU, memory, threads and descriptors of the server process."""
+
+    def __init__(self, process):
+        self.process = process
+
+    @property
+    def pid(self):
+        return self.process.pid
+
+    def snapshot(self):
+        with self.process.oneshot():
+            return {
+                "cpu_ns": _cpu_time_ns(self.process),
+                "thread_cpu_ns": _thread_cpu_time_ns(self.process),
+                "rss": self.process.memory_info().rss,
+                "threads": self.process.num_threads(),
+                "fds": _open_fds(self.process),
+                "wall_ns": time.perf_counter_ns(),
+            }
+
+    # Turn two snapshots taken around an operation into result metrics
+    def delta(self, before, after):
+        cpu_ns = after["cpu_ns"] - before["cpu_ns"]
+        if before["thread_cpu_ns"] is not None and after["thread_cpu_ns"] is not None:
+            # Prefer the precise per-thread clock unless threads exited in
+            # between, which makes it lose their time
+            thread_cpu_ns = after["thread_cpu_ns"] - before["thread_cpu_ns"]
+            if thread_cpu_ns >= 0 and thread_cpu_ns >= cpu_ns - TICK_SLACK_NS:
+                cpu_ns = thread_cpu_ns
+        wall_ns = after["wall_ns"] - before["wall_ns"]
+        return {
+            "cpu_time": cpu_ns / 1e6,  # ms of server CPU
+            "cpu_usage": 100.0 * cpu_ns / wall_ns if wall_ns > 0 else 0.0,
+            "memory_rss": after["rss"] / MB,
+            "threads": after["threads"],
+            "open_fds": after["fds"],
+        }
+
+
+def _connections(process):
+    # psutil renamed connections() to net_connections() in 6.0
+    getter = getattr(process, "net_connections", None) or process.connections
+    return getter(kind="tcp")
+
+
+# Find the process listening on the given TCP port
+def find_listening_process(port):
+    try:
+        for conn in psutil.net_connections(kind="tcp"):
+            if conn.status == psutil.CONN_LISTEN and conn.laddr and conn.laddr.port == port and conn.pid:
+                return psutil.Process(conn.pid)
+    except psutil.AccessDenied:
+        # macOS needs root for the system-wide table; scan java processes instead
+        pass
+
+    for process in psutil.process_iter(["name"]):
+        if "java" not in (process.info["name"] or "").lower():
+            continue
+        try:
+            for conn in _connections(process):
+                if conn.status == psutil.CONN_LISTEN and conn.laddr and conn.laddr.port == port:
+                    return process
+        except (psutil.AccessDenied, psutil.NoSuchProcess):
+            continue
+    return None
@@ -0,0 +1,73 @@
+import time
+
+import numpy as np
+
+from .config import BenchmarkConfig
+
+
+# Steady state: the last two windows agree on the median and show no trend
+def is_steady(latencies, window, tolerance):
+    """True once the latest ``2 * window`` latencies look stationary.
+
+    The medians of the last two windows must differ by less than
+    ``tolerance`` (relative), and a straight line fitted through both
+    windows must drift by less than ``tolerance`` of their median from
+    one end to the other.
+    """
+    if len(latencies) < 2 * window:
+        return False
+    recent = np.array(latencies[-2 * window:], dtype=float)
+    previous, last = np.median(recent[:window]), np.median(recent[window:])
+    median = np.median(recent)
+    if median <= 0:
+        return True
+    if abs(last - previous) / median >= tolerance:
+        return False
+    slope, _ = np.polyfit(np.arange(len(recent)), recent, 1)
+    return abs(slope) * len(recent) / median < tolerance
+
+
+# Repeat an operation until its latency is steady, before any timed sample
+def warm_up(operation, config=None, label="warm-up", mark=None):
+    """Call ``operation`` until ``is_steady`` passes or the time cap is hit.
+
+    ``operation`` performs one untimed warm-up request (or cycle) and
+    returns its latency in ms, or None when it failed. Returns the warm-up
+    metrics: iterations, seconds, whether a steady state was reached and
+    the steady median.
+    """
+    config = config or BenchmarkConfig()
+    if not config.warmup:
+        return None
+
+    if mark:
+        mark(label, "prepare_start")
+    latencies = []
+    failures = 0
+    start = time.perf_counter()
+    steady = False
+    while time.perf_counter() - start < config.warmup_max_seconds:
+        latency = operation()
+        if latency is None:
+            failures += 1
+            continue
+        latencies.append(latency)
+        if is_steady(latencies, config.warmup_window, config.warmup_tolerance):
+            steady = True
+            break
+    elapsed = time.perf_counter() - start
+    if mark:
+        mark(f"{label} done", "prepare_end")
+
+    window = latencies[-config.warmup_window:]
+    result = {
+        "iterations": len(latencies),
+        "failures": failures,
+        "seconds": elapsed,
+        "converged": steady,
+        "first_latency": latencies[0] if latencies else None,
+        "steady_median": float(np.median(window)) if window else None,
+    }
+    print(f"{label}: {'steady' if steady else 'NOT steady'} after {len(latencies)} iterations in {elapsed:.2f} s "
+          f"(first {result['first_latency'] or 0:.2f} ms, now {result['steady_median'] or 0:.2f} ms)")
+    return result
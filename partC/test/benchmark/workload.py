@@ -0,0 +1,332 @@
+import asyncio
+import json
+import os
+import random
+import time
+from dataclasses import dataclass, field
+
+import aiohttp
+
+from .config import BenchmarkConfig
+from .crud import clear_all, link_pairs, seed
+from .entities import ENTITIES, get_entity, get_relationship
+from .loadgen import LoadRecorder, print_report
+from .plotting import plot_load_results, write_results
+
+try:
+    import yaml
+except ImportError:  # YAML specs are optional, JSON always works
+    yaml = None
+
+# Operations a workload spec can mix. Entity operations need "entity",
+# relationship operations need "relationship" (e.g. "projects.tasks")
+ENTITY_OPERATIONS = ["list", "read", "create", "update", "delete"]
+RELATIONSHIP_OPERATIONS = ["list_related", "link", "unlink"]
+WORKLOAD_OPERATIONS = ENTITY_OPERATIONS + RELATIONSHIP_OPERATIONS
+
+THINK_DISTRIBUTIONS = ["constant", "exponential"]
+
+
+@dataclass
+class WorkloadOperation:
+    """One weighted entry of a workload mix."""
+
+    name: str
+    kind: str
+    weight: float
+    entity: object = None
+    relationship: object = None
+    query: dict = None
+
+
+@dataclass
+class WorkloadSpec:
+    """Declarative description of a closed-loop workload.
+
+    ``users`` virtual users each pick an operation by weight, wait for the
+    response, then think for ``think_time`` seconds (mean of an exponential
+    or a constant pause). ``population`` seeds each entity before the run
+    and ``fanout`` links that many random children to every parent of a
+    relationship.
+    """
+
+    name: str
+    operations: list
+    duration: float = 60.0
+    users: int = 8
+    think_time: float = 0.0
+    think_distribution: str = "exponential"
+    population: dict = field(default_factory=dict)
+    fanout: dict = field(default_factory=dict)
+    seed: int = None
+
+    def think(self, rng):
+        if self.think_time <= 0:
+            return 0.0
+        if self.think_distribution == "exponential":
+            return rng.expovariate(1.0 / self.think_time)
+        return self.think_time
+
+
+def _parse_operation(raw):
+    kind = raw.get("op")
+    if kind not in WORKLOAD_OPERATIONS:
+        raise ValueError(f"Unknown workload operation '{kind}', expected one of {WORKLOAD_OPERATIONS}")
+    weight = float(raw.get("weight", 1))
+    if weight <= 0:
+        raise ValueError(f"Workload operation '{kind}' needs a positive weight")
+
+    entity = relationship = None
+    if kind in ENTITY_OPERATIONS:
+        if "entity" not in raw:
+            raise ValueError(f"Workload operation '{kind}' needs an 'entity'")
+        entity = get_entity(raw["entity"])
+        target = entity.name
+    else:
+        if "relationship" not in raw:
+            raise ValueError(f"Workload operation '{kind}' needs a 'relationship'")
+        relationship = get_relationship(raw["relationship"])
+        target = relationship.key
+    if raw.get("query") and kind != "list":
+        raise ValueError("Only 'list' operations take a query")
+
+    return WorkloadOperation(name=raw.get("name") or f"{target}.{kind}", kind=kind, weight=weight,
+                             entity=entity, relationship=relationship, query=raw.get("query"))
+
+
+def parse_workload(data):
+    """Validate a workload mapping (as read from JSON or YAML) into a WorkloadSpec."""
+    if not data.get("operations"):
+        raise ValueError("A workload needs at least one operation")
+    operations = [_parse_operation(raw) for raw in data["operations"]]
+    names = [operation.name for operation in operations]
+    if len(set(names)) != len(names):
+        raise ValueError("Workload operation names must be unique")
+
+    think = data.get("think_time", 0.0)
+    if isinstance(think, dict):
+        think_time = float(think.get("mean", 0.0))
+        distribution = think.get("distribution", "exponential")
+    else:
+        think_time, distribution = float(think), "constant"
+    if distribution not in THINK_DISTRIBUTIONS:
+        raise ValueError(f"Unknown think time distribution '{distribution}', expected one of {THINK_DISTRIBUTIONS}")
+
+    population = data.get("population", {})
+    for name in population:
+        get_entity(name)
+    fanout = data.get("fanout", {})
+    for key in fanout:
+        get_relationship(key)
+
+    spec = WorkloadSpec(name=data.get("name", "workload"), operations=operations,
+                        duration=float(data.get("duration", 60.0)), users=int(data.get("users", 8)),
+                        think_time=think_time, think_distribution=distribution,
+                        population=population, fanout=fanout, seed=data.get("seed"))
+    if spec.users < 1 or spec.duration <= 0:
+        raise ValueError("A workload needs at least one user and a positive duration")
+    return spec
+
+
+def load_workload(path):
+    """Read a workload spec from a .json, .yaml or .yml file."""
+    with open(path) as f:
+        if os.path.splitext(path)[1].lower() in [".yaml", ".yml"]:
+            if yaml is None:
+                raise RuntimeError("PyYAML is required for YAML workloads: pip install PyYAML")
+            data = yaml.safe_load(f)
+        else:
+            data = json.load(f)
+    return parse_workload(data or {})
+
+
+# Entities the workload touches, directly or through a relationship
+def _workload_entities(spec):
+    names = set(spec.population)
+    for operation in spec.operations:
+        if operation.entity:
+            names.add(operation.entity.name)
+        if operation.relationship:
+            names.update([operation.relationship.parent.name, operation.relationship.child.name])
+    for key in spec.fanout:
+        relationship = get_relationship(key)
+        names.update([relationship.parent.name, relationship.child.name])
+    # Keep the declaration order stable
+    return [ENTITIES[name] for name in ENTITIES if name in names]
+
+
+# Seed the populations and relationship fan-out; returns (pools, links)
+def prepare_workload(spec, session, config):
+    entities = _workload_entities(spec)
+    pools = {}
+    for entity in entities:
+        clear_all(entity, session, config.base_url, config.workers)
+    for entity in entities:
+        size = spec.population.get(entity.name, config.load_population)
+        pools[entity.name], _ = seed(entity, size, config.base_url, config.workers)
+
+    rng = random.Random(spec.seed)
+    links = {}
+    for key, fanout in spec.fanout.items():
+        relationship = get_relationship(key)
+        children = pools[relationship.child.name]
+        pairs = [(parent, child) for parent in pools[relationship.parent.name]
+                 for child in rng.sample(children, min(fanout, len(children)))]
+        failed = set(link_pairs(relationship, pairs, config.base_url, config.workers))
+        links[key] = [pair for pair in pairs if pair not in failed]
+    for operation in spec.operations:
+        if operation.relationship:
+            links.setdefault(operation.relationship.key, [])
+    return pools, links
+
+
+# Pick a random element and remove it in O(1)
+def _pop_random(items, rng):
+    index = rng.randrange(len(items))
+    items[index], items[-1] = items[-1], items[index]
+    return items.pop()
+
+
+# Translate one workload operation into (method, path, payload, link), or None
+# to skip; link is the (parent, child) pair a successful link request adds
+def _request_for(operation, pools, links, rng):
+    kind = operation.kind
+    if operation.entity:
+        entity = operation.entity
+        pool = pools[entity.name]
+        if kind == "list":
+            return "GET", entity.endpoint, None, None
+        if kind == "create":
+            return "POST", entity.endpoint, entity.generate(), None
+        if not pool:
+            return None
+        if kind == "delete":
+            return "DELETE", entity.item_endpoint(_pop_random(pool, rng)), None, None
+        object_id = rng.choice(pool)
+        if kind == "read":
+            return "GET", entity.item_endpoint(object_id), None, None
+        return "PUT", entity.item_endpoint(object_id), entity.update_payload(), None
+
+    relationship = operation.relationship
+    parents = pools[relationship.parent.name]
+    pairs = links[relationship.key]
+    if kind == "unlink":
+        if not pairs:
+            return None
+        parent_id, child_id = _pop_random(pairs, rng)
+        return "DELETE", relationship.link_endpoint(parent_id, child_id), None, None
+    if not parents:
+        return None
+    parent_id = rng.choice(parents)
+    if kind == "list_related":
+        return "GET", relationship.endpoint(parent_id), None, None
+    children = pools[relationship.child.name]
+    if not children:
+        return None
+    child_id = rng.choice(children)
+    return "POST", relationship.endpoint(parent_id), {"id": child_id}, (parent_id, child_id)
+
+
+# Issue one workload operation and record its latency under the operation name
+async def _execute(http, config, operation, pools, links, recorder, rng):
+    request = _request_for(operation, pools, links, rng)
+    if request is None:
+        recorder.skip(operation.name)
+        return
+    method, path, payload, link = request
+
+    start_ns = time.perf_counter_ns()
+    try:
+        async with http.request(method, config.url(path), json=payload, params=operation.query) as response:
+            content = await response.read()
+            status = response.status
+            # Like clearing, an unlink of a link that is already gone is fine
+            ok = status < 400 or (operation.kind == "unlink" and status == 404)
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        content, status, ok = None, 0, False
+    # Closed loop: the request was sent when intended, so latency equals service time
+    recorder.record(operation.name, start_ns, start_ns, time.perf_counter_ns(), ok)
+
+    if ok and operation.kind == "create":
+        pools[operation.entity.name].append(json.loads(content)["id"])
+    # Only track links the server confirmed, so unlinks target real ones
+    if link and 200 <= status < 300:
+        links[operation.relationship.key].append(link)
+
+
+# One virtual user: pick by weight, wait for the response, think, repeat
+async def _virtual_user(http, config, spec, pools, links, recorder, deadline_ns, rng):
+    weights = [operation.weight for operation in spec.operations]
+    while time.perf_counter_ns() < deadline_ns:
+        operation = rng.choices(spec.operations, weights)[0]
+        await _execute(http, config, operation, pools, links, recorder, rng)
+        pause = spec.think(rng)
+        if pause:
+            await asyncio.sleep(pause)
+
+
+async def generate_workload(spec, config, pools, links, recorder):
+    """Run ``spec.users`` closed-loop users for ``spec.duration`` seconds; returns the elapsed time."""
+    connector = aiohttp.TCPConnector(limit=max(spec.users, 1))
+    timeout = aiohttp.ClientTimeout(total=config.request_timeout)
+    seeds = random.Random(spec.seed)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as http:
+        start_ns = time.perf_counter_ns()
+        deadline_ns = start_ns + int(spec.duration * 1e9)
+        await asyncio.gather(*[
+            _virtual_user(http, config, spec, pools, links, recorder, deadline_ns,
+                          random.Random(seeds.random()))
+            for _ in range(spec.users)])
+        elapsed = (time.perf_counter_ns() - start_ns) / 1e9
+    return elapsed
+
+
+# Summarize a workload run: overall and per-operation latency, throughput and mix
+def build_workload_report(spec, recorder, elapsed):
+    operations = recorder.report(elapsed)
+    _, latency = recorder.totals()
+    completed = latency.total_count
+    total_weight = sum(operation.weight for operation in spec.operations)
+    for operation in spec.operations:
+        entry = operations.setdefault(operation.name, {"count": 0, "errors": 0, "skipped": 0, "throughput": 0.0})
+        entry["weight_share"] = operation.weight / total_weight
+        entry["achieved_share"] = entry["count"] / completed if completed else 0.0
+    return {
+        "workload": spec.name,
+        "label": f"{spec.users} users, {spec.think_time:g} s think time",
+        "users": spec.users,
+        "think_time": spec.think_time,
+        "think_distribution": spec.think_distribution,
+        "duration": elapsed,
+        "requests": completed,
+        "errors": sum(op["errors"] for op in operations.values()),
+        "achieved_throughput": completed / elapsed if elapsed > 0 else 0.0,
+        "latency": latency.summary(),
+        "percentiles": latency.percentile_spectrum(),
+        "operations": operations,
+    }
+
+
+# Run a workload spec and save its report
+def run_workload(spec, session, config=None):
+    """Seed the spec's populations and links, then run its mix closed-loop.
+
+    Results go to ``results/workload_<name>_results.json`` with latency,
+    throughput and achieved-vs-configured share for every operation.
+    """
+    config = config or BenchmarkConfig()
+    if isinstance(spec, str):
+        spec = load_workload(spec)
+
+    pools, links = prepare_workload(spec, session, config)
+    print(f"\n=== Workload '{spec.name}': {spec.users} users, {spec.think_time:g} s "
+          f"{spec.think_distribution} think time, {spec.duration:g} s ===")
+    recorder = LoadRecorder()
+    elapsed = asyncio.run(generate_workload(spec, config, pools, links, recorder))
+
+    report = build_workload_report(spec, recorder, elapsed)
+    print_report(report)
+
+    write_results(f"workload_{spec.name}_results.json", report, config)
+    plot_load_results(report, config, name=os.path.join("workload", spec.name))
+    return report
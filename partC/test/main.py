@@ -1,42 +1,247 @@
 import os
-import sys
-import subprocess
 import argparse
 
-def run_test(test_file):
-    """Run a specific test file."""
-    print(f"Running test: {test_file}")
-    subprocess.run([sys.executable, test_file])
+import requests
+
+from benchmark import (
+    ENTITIES,
+    FORMATS,
+    LOAD_OPERATIONS,
+    RELATIONSHIPS,
+    SWEEP_MODES,
+    TIMING_MODES,
+    BenchmarkConfig,
+    run_benchmark,
+    run_connections,
+    run_filters,
+    run_formats,
+    run_listing,
+    run_load,
+    run_relationship_benchmark,
+    run_saturation,
+    run_soak,
+    run_workload,
+)
+
+# Benchmark modes selectable with --mode
+MODES = ["crud", "listing", "filter", "formats", "connections", "load", "saturation", "soak", "workload"]
+
+
+# Selectivities are percentages like the defaults and the report labels:
+# "50" or "50%" is 50, "12.5" stays 12.5
+def selectivity(text):
+    try:
+        value = float(text.strip().rstrip('%'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"'{text}' is not a percentage") from None
+    if not 0 <= value <= 100:
+        raise argparse.ArgumentTypeError(f"Selectivity {text} is outside 0-100 (percent of todos matching)")
+    return int(value) if value.is_integer() else value
+
+
+def build_config(args):
+    """Translate parsed command-line arguments into a BenchmarkConfig."""
+    config = BenchmarkConfig(
+        base_url=args.base_url,
+        workers=args.workers,
+        sweep=args.sweep,
+        timing=args.timing,
+        format=args.format,
+        samples=args.samples,
+        warmup=not args.no_warmup,
+        warmup_window=args.warmup_window,
+        warmup_tolerance=args.warmup_tolerance,
+        warmup_max_seconds=args.warmup_max_seconds,
+        server_pid=args.server_pid,
+        jar_path=args.jar,
+        sample_interval=args.sample_interval,
+        rate=args.rate,
+        duration=args.duration,
+        connections=args.connections,
+        processes=args.processes,
+        operations=args.operations,
+        load_population=args.load_population,
+        slo_p99_ms=args.slo_p99,
+        max_error_rate=args.max_error_rate,
+        step_duration=args.step_duration,
+        start_rate=args.start_rate,
+        max_rate=args.max_rate,
+        connection_requests=args.connection_requests,
+        soak_duration=args.soak_hours * 3600,
+        soak_window=args.soak_window,
+        soak_warmup=args.soak_warmup,
+        leak_threshold=args.leak_threshold,
+        degradation_threshold=args.degradation_threshold,
+    )
+    if args.pool_sizes:
+        config.pool_sizes = args.pool_sizes
+    if args.fanouts:
+        config.fanout_sizes = args.fanouts
+    if args.populations:
+        config.relationship_populations = args.populations
+    if args.sizes:
+        config.test_sizes = args.sizes
+        config.saturation_sizes = args.sizes
+        config.filter_sizes = args.sizes
+    if args.selectivities:
+        config.selectivities = args.selectivities
+    return config
+
 
 def main():
     """Main function to run the performance tests."""
     # Parse command-line arguments
     parser = argparse.ArgumentParser(description='Run API performance tests')
+    parser.add_argument('--mode', choices=MODES, default='crud',
+                        help='crud: per-size CRUD sweep; listing: full collection GET sweep; '
+                             'filter: server- vs client-side todo filters; formats: JSON vs XML side by side; '
+                             'connections: per-request connections vs keep-alive pools; '
+                             'load: open-loop load at a fixed arrival rate; '
+                             'saturation: search the max rate within a p99 SLO; '
+                             'soak: hours of constant-population churn with leak detection; '
+                             'workload: run a declarative operation mix from --workload')
     parser.add_argument('--all', action='store_true', help='Run all tests')
     parser.add_argument('--todos', action='store_true', help='Run tests for todos')
     parser.add_argument('--projects', action='store_true', help='Run tests for projects')
     parser.add_argument('--categories', action='store_true', help='Run tests for categories')
     parser.add_argument('--relationships', action='store_true', help='Run tests for relationships')
+    parser.add_argument('--base-url', default=BenchmarkConfig.base_url, help='Base URL of the Todo Manager API')
+    parser.add_argument('--workers', type=int, default=BenchmarkConfig.workers,
+                        help='Concurrent connections used for seeding and clearing')
+
+    crud = parser.add_argument_group('crud and listing modes')
+    crud.add_argument('--sizes', type=int, nargs='+', help='Population sizes to sweep')
+    crud.add_argument('--samples', type=int, default=BenchmarkConfig.samples,
+                      help='Timed samples of every operation at each size')
+    crud.add_argument('--no-warmup', action='store_true',
+                      help='Skip the adaptive warm-up before the first timed sample')
+    crud.add_argument('--warmup-window', type=int, default=BenchmarkConfig.warmup_window,
+                      help='Warm-up iterations per window of the steady-state test')
+    crud.add_argument('--warmup-tolerance', type=float, default=BenchmarkConfig.warmup_tolerance,
+                      help='Relative median change and drift accepted as steady')
+    crud.add_argument('--warmup-max-seconds', type=float, default=BenchmarkConfig.warmup_max_seconds,
+                      help='Give up warming up after this many seconds')
+    crud.add_argument('--server-pid', type=int, help='PID of the server process to monitor')
+    crud.add_argument('--jar', help='Launch this jar when no server is listening on the base URL')
+    crud.add_argument('--sample-interval', type=float, default=BenchmarkConfig.sample_interval,
+                      help='Seconds between background resource samples (0 disables)')
+    crud.add_argument('--timing', choices=TIMING_MODES, default=BenchmarkConfig.timing,
+                      help='Time whole requests (wall) or split them into phases (phased)')
+    crud.add_argument('--format', choices=FORMATS, default=BenchmarkConfig.format,
+                      help='Body format of the measured requests')
+    crud.add_argument('--sweep', choices=SWEEP_MODES, default=BenchmarkConfig.sweep,
+                      help='Grow the population between sizes (incremental) or clear and reseed it (rebuild)')
+
+    relationships = parser.add_argument_group('relationship benchmark (crud mode with --relationships)')
+    relationships.add_argument('--routes', nargs='+', choices=list(RELATIONSHIPS),
+                               help='Relationship routes to measure (default: all)')
+    relationships.add_argument('--fanouts', type=int, nargs='+',
+                               help='Children linked to the measured parent')
+    relationships.add_argument('--populations', type=int, nargs='+',
+                               help='Objects in the parent and child collections')
+
+    filters = parser.add_argument_group('filter mode (also uses --sizes, --samples)')
+    filters.add_argument('--selectivities', type=selectivity, nargs='+',
+                         help='Percentages (0-100) of todos matching the filters, e.g. 1 50 100')
+
+    connections = parser.add_argument_group('connections mode (also uses --load-population)')
+    connections.add_argument('--connection-requests', type=int, default=BenchmarkConfig.connection_requests,
+                             help='Requests issued with every connection strategy')
+    connections.add_argument('--pool-sizes', type=int, nargs='+',
+                             help='Concurrent connections compared with and without keep-alive')
+
+    load = parser.add_argument_group('load mode')
+    load.add_argument('--rate', type=float, default=BenchmarkConfig.rate, help='Offered requests per second')
+    load.add_argument('--duration', type=float, default=BenchmarkConfig.duration, help='Seconds of load')
+    load.add_argument('--connections', type=int, default=BenchmarkConfig.connections,
+                      help='Maximum concurrent connections per load process')
+    load.add_argument('--processes', type=int, default=BenchmarkConfig.processes,
+                      help='Worker processes generating load, each with its own connection pool')
+    load.add_argument('--operations', nargs='+', choices=LOAD_OPERATIONS, default=list(LOAD_OPERATIONS),
+                      help='Operations mixed uniformly into the load')
+    load.add_argument('--load-population', type=int, default=BenchmarkConfig.load_population,
+                      help='Objects seeded per entity before the load starts')
+
+    saturation = parser.add_argument_group('saturation mode (also uses --sizes, --processes, --operations)')
+    saturation.add_argument('--slo-p99', type=float, default=BenchmarkConfig.slo_p99_ms,
+                            help='p99 latency budget in ms')
+    saturation.add_argument('--max-error-rate', type=float, default=BenchmarkConfig.max_error_rate,
+                            help='Highest tolerated fraction of failed requests')
+    saturation.add_argument('--step-duration', type=float, default=BenchmarkConfig.step_duration,
+                            help='Seconds of load per search step')
+    saturation.add_argument('--start-rate', type=float, default=BenchmarkConfig.start_rate,
+                            help='First offered rate of the ramp')
+    saturation.add_argument('--max-rate', type=float, default=BenchmarkConfig.max_rate,
+                            help='Stop ramping at this rate')
+
+    soak = parser.add_argument_group('soak mode (also uses --rate, --operations, --load-population, --processes)')
+    soak.add_argument('--soak-hours', type=float, default=BenchmarkConfig.soak_duration / 3600,
+                      help='Length of the soak run in hours')
+    soak.add_argument('--soak-window', type=float, default=BenchmarkConfig.soak_window,
+                      help='Seconds of load per latency and resource data point')
+    soak.add_argument('--soak-warmup', type=float, default=BenchmarkConfig.soak_warmup,
+                      help='Seconds left out of the trend fits')
+    soak.add_argument('--leak-threshold', type=float, default=BenchmarkConfig.leak_threshold,
+                      help='Server RSS growth in MB per hour flagged as a leak')
+    soak.add_argument('--degradation-threshold', type=float, default=BenchmarkConfig.degradation_threshold,
+                      help='p99 growth in ms per hour flagged as degradation')
+
+    workload = parser.add_argument_group('workload mode')
+    workload.add_argument('--workload', help='JSON or YAML workload spec (see workloads/)')
 
     args = parser.parse_args()
+    if args.mode == 'workload' and not args.workload:
+        parser.error('--mode workload requires --workload FILE')
 
     # If no specific test is selected, run all tests
     if not (args.todos or args.projects or args.categories or args.relationships):
         args.all = True
 
+    config = build_config(args)
+    entities = [ENTITIES[name] for name in ENTITIES if args.all or getattr(args, name)]
+
     # Create directories for results and plots
-    os.makedirs("results", exist_ok=True)
-    os.makedirs("plots", exist_ok=True)
+    os.makedirs(config.results_dir, exist_ok=True)
+    os.makedirs(config.plots_dir, exist_ok=True)
+
+    # --relationships alone selects no entities for the per-entity modes
+    if not entities and args.mode in ('listing', 'connections', 'formats', 'load', 'saturation', 'soak'):
+        print(f"Warning: --mode {args.mode} needs --todos, --projects, --categories or --all; nothing to run")
+        return
 
     # Run selected tests
-    if args.all or args.todos:
-        run_test("test_todo.py")
-    
-    if args.all or args.projects:
-        run_test("test_project.py")
-
-    if args.all or args.categories:
-        run_test("test_category.py")
+    if args.mode == 'listing':
+        run_listing(entities, config)
+        return
+    if args.mode == 'connections':
+        run_connections(entities, config)
+        return
+    if args.mode == 'formats':
+        run_formats(entities, config)
+        return
+    if args.mode == 'filter':
+        run_filters(config)
+        return
+    if args.mode == 'workload':
+        # The spec names its own entities and relationships
+        run_workload(args.workload, requests.Session(), config)
+        return
+    if args.mode == 'load':
+        run_load(entities, requests.Session(), config)
+        return
+    if args.mode == 'saturation':
+        run_saturation(entities, requests.Session(), config)
+        return
+    if args.mode == 'soak':
+        run_soak(entities, requests.Session(), config)
+        return
+
+    for entity in entities:
+        run_benchmark(entity, config)
+
+    if args.all or args.relationships:
+        routes = [RELATIONSHIPS[key] for key in args.routes] if args.routes else None
+        run_relationship_benchmark(routes, config)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,5 @@
+from benchmark import run_relationship_benchmark
+
+if __name__ == "__main__":
+    # Run the fan-out scaling benchmark on every relationship route
+    run_relationship_benchmark()
@@ -0,0 +1,17 @@
+import pytest
+
+from benchmark import crud
+from benchmark.entities import TODOS
+
+
+def test_restore_population_trims_the_surplus(monkeypatch):
+    monkeypatch.setattr(crud, "delete_ids", lambda entity, ids, *args: [])
+    pool = ["1", "2", "3"]
+    crud.restore_population(TODOS, pool, 2)
+    assert pool == ["1", "2"]
+
+
+def test_restore_population_fails_when_deletes_keep_failing(monkeypatch):
+    monkeypatch.setattr(crud, "delete_ids", lambda entity, ids, *args: list(ids))
+    with pytest.raises(RuntimeError, match="Prepared 3 todos instead of 2"):
+        crud.restore_population(TODOS, ["1", "2", "3"], 2)
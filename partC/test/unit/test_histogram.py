@@ -0,0 +1,102 @@
+import json
+import random
+
+import numpy as np
+import pytest
+
+from benchmark.histogram import LatencyHistogram
+
+
+def within_precision(actual, expected, significant_figures=3):
+    return abs(actual - expected) <= max(1, expected / 10 ** significant_figures)
+
+
+def test_percentiles_match_known_data():
+    histogram = LatencyHistogram()
+    for value in range(1, 10001):
+        histogram.record(value)
+
+    assert histogram.total_count == 10000
+    for percentile in (1, 10, 50, 90, 99, 99.9):
+        assert within_precision(histogram.value_at_percentile(percentile), percentile * 100)
+    assert histogram.value_at_percentile(100) == 10000
+    assert histogram.min_value == 1
+    assert histogram.mean() == pytest.approx(5000.5)
+
+
+def test_percentiles_match_numpy_on_random_latencies():
+    rng = random.Random(7)
+    values = [int(rng.lognormvariate(8, 1.5)) for _ in range(20000)]
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.record(value)
+
+    for percentile in (50, 90, 99, 99.9):
+        expected = np.percentile(values, percentile, method="inverted_cdf")
+        assert within_precision(histogram.value_at_percentile(percentile), expected)
+
+
+def test_empty_histogram():
+    histogram = LatencyHistogram()
+    assert histogram.value_at_percentile(99) == 0
+    assert histogram.summary() == {"count": 0}
+    assert histogram.percentile_spectrum() == []
+
+
+@pytest.mark.parametrize("value", [0, 1, 2047, 2048, 2049, 4095, 4096, 4097, 1 << 20, (1 << 20) + 1])
+def test_bucket_boundaries(value):
+    histogram = LatencyHistogram()
+    index = histogram._counts_index(value)
+    lowest = histogram._value_from_index(index)
+    highest = histogram._highest_equivalent(value)
+
+    # The bucket holding a value spans it, within the configured precision
+    assert lowest <= value <= highest
+    assert within_precision(highest, lowest)
+    assert histogram._counts_index(lowest) == index
+    assert histogram._counts_index(highest) == index
+    assert histogram._counts_index(highest + 1) == index + 1
+
+
+def test_values_below_the_first_bucket_are_exact():
+    histogram = LatencyHistogram()
+    for value in range(histogram.sub_bucket_count):
+        assert histogram._highest_equivalent(value) == value
+
+
+def test_out_of_range_values_are_clamped():
+    histogram = LatencyHistogram(highest=1000)
+    histogram.record(-5)
+    histogram.record(5000, count=3)
+
+    assert histogram.min_value == 0
+    assert histogram.max_value == 1000
+    assert histogram.clamped == 3
+    assert histogram.value_at_percentile(100) == 1000
+
+
+def test_dict_round_trip():
+    histogram = LatencyHistogram()
+    for value in (3, 150, 150, 9000, 70000, 61 * 1000 * 1000):
+        histogram.record(value)
+
+    restored = LatencyHistogram.from_dict(json.loads(json.dumps(histogram.to_dict())))
+
+    assert restored.counts == histogram.counts
+    assert restored.to_dict() == histogram.to_dict()
+    assert restored.summary() == histogram.summary()
+    assert restored.percentile_spectrum() == histogram.percentile_spectrum()
+
+
+def test_merge_adds_counts():
+    first, second, both = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    for value in range(1, 500):
+        first.record(value)
+        both.record(value)
+    for value in range(500, 2000, 3):
+        second.record(value)
+        both.record(value)
+
+    assert first.merge(second).to_dict() == both.to_dict()
+    with pytest.raises(ValueError):
+        first.merge(LatencyHistogram(significant_figures=2))
@@ -0,0 +1,19 @@
+import argparse
+
+import pytest
+
+from main import selectivity
+
+
+@pytest.mark.parametrize("text, expected", [("0", 0), ("1", 1), ("50", 50), ("50%", 50), ("12.5", 12.5), ("100", 100)])
+def test_selectivities_parse_to_percentages(text, expected):
+    value = selectivity(text)
+    assert value == expected
+    # Keyed and labelled like the defaults: "50", not "50.0"
+    assert str(value) == str(expected)
+
+
+@pytest.mark.parametrize("text", ["-1", "100.5", "half", ""])
+def test_invalid_selectivities_are_rejected(text):
+    with pytest.raises(argparse.ArgumentTypeError):
+        selectivity(text)
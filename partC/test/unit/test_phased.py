@@ -0,0 +1,80 @@
+import http.client
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from benchmark.phased import PhasedClient, _decode, _encode
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"todos": []}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", "100" if self.path == "/truncated" else str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        if self.path == "/truncated":
+            self.close_connection = True
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def base_url():
+    server = ThreadingHTTPServer(("localhost", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://localhost:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_xml_body_is_wrapped_in_the_given_root():
+    assert _encode({"title": "a", "doneStatus": False}, "xml", "todo") == \
+        b"<todo><title>a</title><doneStatus>false</doneStatus></todo>"
+
+
+def test_xml_link_body_wraps_the_id():
+    # The server unwraps the root; a bare <id>2</id> is rejected as a string
+    assert _encode({"id": "2"}, "xml", "category") == b"<category><id>2</id></category>"
+
+
+def test_xml_body_needs_a_root():
+    with pytest.raises(ValueError):
+        _encode({"title": "a"}, "xml")
+
+
+def test_json_body_ignores_the_root():
+    assert _encode({"id": "2"}, "json", "todo") == b'{"id": "2"}'
+
+
+def test_xml_collection_decodes_like_json():
+    content = b"<todos><todo><id>1</id><title>a</title></todo><todo><id>2</id><title>b</title></todo></todos>"
+    assert _decode(content, "xml") == {"todos": [{"id": "1", "title": "a"}, {"id": "2", "title": "b"}]}
+
+
+def test_connection_is_reused(base_url):
+    client = PhasedClient(base_url)
+    client.get(f"{base_url}/todos")
+    response = client.get(f"{base_url}/todos")
+    assert response.timings["connection_reused"]
+    assert response.json() == {"todos": []}
+    client.close()
+
+
+def test_failed_request_drops_the_connection(base_url):
+    client = PhasedClient(base_url)
+    client.get(f"{base_url}/todos")
+    with pytest.raises(http.client.IncompleteRead):
+        client.get(f"{base_url}/truncated")
+    assert client._conn is None
+
+    response = client.get(f"{base_url}/todos")
+    assert response.status_code == 200
+    assert not response.timings["connection_reused"]
+    client.close()
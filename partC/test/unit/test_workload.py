@@ -0,0 +1,116 @@
+import asyncio
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from benchmark.config import BenchmarkConfig
+from benchmark.loadgen import LoadRecorder
+from benchmark.workload import WorkloadSpec, _execute, load_workload, parse_workload
+
+WORKLOADS = Path(__file__).resolve().parents[1] / "workloads"
+
+SPEC = {
+    "name": "mixed",
+    "duration": 5,
+    "users": 2,
+    "think_time": {"mean": 0.1, "distribution": "exponential"},
+    "population": {"todos": 10, "projects": 2},
+    "fanout": {"projects.tasks": 3},
+    "operations": [
+        {"op": "read", "entity": "todos", "weight": 3},
+        {"name": "todos.done", "op": "list", "entity": "todos", "query": {"doneStatus": "true"}},
+        {"op": "link", "relationship": "projects.tasks"},
+    ],
+}
+
+
+def test_parse_workload():
+    spec = parse_workload(SPEC)
+    assert isinstance(spec, WorkloadSpec)
+    assert [operation.name for operation in spec.operations] == ["todos.read", "todos.done", "projects.tasks.link"]
+    assert [operation.weight for operation in spec.operations] == [3.0, 1.0, 1.0]
+    assert spec.operations[1].query == {"doneStatus": "true"}
+    assert spec.operations[2].relationship.key == "projects.tasks"
+    assert (spec.think_time, spec.think_distribution) == (0.1, "exponential")
+    assert (spec.duration, spec.users) == (5.0, 2)
+
+
+def test_plain_think_time_is_constant():
+    spec = parse_workload({**SPEC, "think_time": 0.5})
+    assert (spec.think_time, spec.think_distribution) == (0.5, "constant")
+    assert spec.think(random.Random(1)) == 0.5
+
+
+def test_load_json_workload(tmp_path):
+    path = tmp_path / "mixed.json"
+    path.write_text(json.dumps(SPEC))
+    assert load_workload(str(path)) == parse_workload(SPEC)
+
+
+def test_load_yaml_workload(tmp_path):
+    yaml = pytest.importorskip("yaml")
+    path = tmp_path / "mixed.yaml"
+    path.write_text(yaml.safe_dump(SPEC))
+    assert load_workload(str(path)) == parse_workload(SPEC)
+
+
+@pytest.mark.parametrize("name", ["read_heavy.json", "write_heavy.yaml"])
+def test_shipped_workloads_parse(name):
+    if name.endswith(".yaml"):
+        pytest.importorskip("yaml")
+    assert load_workload(str(WORKLOADS / name)).operations
+
+
+@pytest.mark.parametrize("changes", [
+    {"operations": []},
+    {"operations": [{"op": "explode", "entity": "todos"}]},
+    {"operations": [{"op": "read"}]},
+    {"operations": [{"op": "link", "entity": "todos"}]},
+    {"operations": [{"op": "read", "entity": "widgets"}]},
+    {"operations": [{"op": "read", "entity": "todos", "weight": 0}]},
+    {"operations": [{"op": "read", "entity": "todos", "query": {"doneStatus": "true"}}]},
+    {"operations": [{"op": "read", "entity": "todos"}, {"op": "read", "entity": "todos"}]},
+    {"think_time": {"mean": 1, "distribution": "uniform"}},
+    {"population": {"widgets": 5}},
+    {"fanout": {"todos.widgets": 2}},
+    {"users": 0},
+    {"duration": 0},
+])
+def test_invalid_workloads_are_rejected(changes):
+    with pytest.raises(ValueError):
+        parse_workload({**SPEC, **changes})
+
+
+class FakeResponse:
+    def __init__(self, status):
+        self.status = status
+
+    async def read(self):
+        return b"{}"
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+
+class FakeHttp:
+    def __init__(self, status):
+        self.status = status
+
+    def request(self, method, url, **kwargs):
+        return FakeResponse(self.status)
+
+
+@pytest.mark.parametrize("status, tracked", [(201, 1), (400, 0), (404, 0), (500, 0)])
+def test_links_are_tracked_only_once_created(status, tracked):
+    spec = parse_workload(SPEC)
+    link = spec.operations[2]
+    pools = {"projects": ["1"], "todos": ["2"]}
+    links = {"projects.tasks": []}
+    recorder = LoadRecorder()
+    asyncio.run(_execute(FakeHttp(status), BenchmarkConfig(), link, pools, links, recorder, random.Random(1)))
+    assert links["projects.tasks"] == [("1", "2")] * tracked
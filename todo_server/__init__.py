@@ -0,0 +1,28 @@
+"""Launch, reset and tear down Todo Manager jar servers for the test suites."""
+
+from .cds import STARTUP_FLAGS, ensure_archive, measure_startup, startup_flags
+from .manager import (
+    DEFAULT_JAR,
+    TodoServer,
+    find_free_port,
+    is_ready,
+    start_server,
+)
+from .pool import ServerPool
+from .state import diff_state, reset_state, snapshot
+
+__all__ = [
+    "DEFAULT_JAR",
+    "STARTUP_FLAGS",
+    "ServerPool",
+    "TodoServer",
+    "diff_state",
+    "ensure_archive",
+    "find_free_port",
+    "is_ready",
+    "measure_startup",
+    "reset_state",
+    "snapshot",
+    "start_server",
+    "startup_flags",
+]
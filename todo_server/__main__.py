@@ -0,0 +1,3 @@
+from .cds import main
+
+main()
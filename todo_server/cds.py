@@ -0,0 +1,177 @@
+import argparse
+import functools
+import hashlib
+import json
+import os
+import re
+import statistics
+import subprocess
+import threading
+from pathlib import Path
+
+import requests
+
+from .manager import TodoServer, default_jar, default_java, default_jvm_flags
+
+# Startup-oriented flags for short-lived test servers: C1 only (no C2
+# compiler threads warming up code the tests never run long enough to
+# need) and the serial collector, which starts with the least setup
+STARTUP_FLAGS = ["-XX:TieredStopAtLevel=1", "-XX:+UseSerialGC"]
+
+# Dynamic archives (-XX:ArchiveClassesAtExit) need JDK 13 or later
+MIN_ARCHIVE_VERSION = 13
+
+# Dumping the archive happens at exit and can take a few seconds
+DUMP_TIMEOUT = 60
+
+# Requests replayed before dumping so request handling classes are archived too
+TRAINING_PATHS = ["/todos", "/projects", "/categories", "/todos/1", "/projects/1/tasks", "/categories/1/todos"]
+
+_archive_lock = threading.Lock()
+
+
+def cache_dir():
+    default = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "todo_server"
+    return Path(os.environ.get("TODO_SERVER_CACHE", default))
+
+
+def jar_digest(jar):
+    digest = hashlib.sha256()
+    with open(jar, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# Full `java -version` banner; it names vendor, version and build
+@functools.lru_cache(maxsize=None)
+def java_version(java=None):
+    result = subprocess.run([java or default_java(), "-version"], capture_output=True, text=True, timeout=30)
+    return (result.stderr or result.stdout).strip()
+
+
+# "1.8.0_392" is 8, "17.0.9" is 17
+def java_major(version):
+    match = re.search(r'version "(\d+)(?:\.(\d+))?', version)
+    if not match:
+        return None
+    major = int(match.group(1))
+    return int(match.group(2) or 0) if major == 1 else major
+
+
+# Archive for this jar content and JVM build, e.g. ~/.cache/todo_server/<jar>-<hash>-<hash>.jsa
+def archive_path(jar=None, java=None):
+    jar = Path(jar or default_jar()).resolve()
+    version = java_version(java)
+    jvm = hashlib.sha256(version.encode()).hexdigest()
+    return cache_dir() / f"{jar.stem}-{jar_digest(jar)[:16]}-{jvm[:12]}.jsa"
+
+
+# Run the jar once with -XX:ArchiveClassesAtExit and replay a few requests
+def create_archive(path, jar=None, java=None):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Workers may dump concurrently; each writes its own file and the
+    # finished one is renamed into place
+    partial = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    server = TodoServer(jar=jar, java=java, jvm_flags=[*STARTUP_FLAGS, f"-XX:ArchiveClassesAtExit={partial}"])
+    server.start()
+    try:
+        with requests.Session() as session:
+            for request_path in TRAINING_PATHS:
+                session.get(f"{server.base_url}{request_path}", headers={"Accept": "application/json"}, timeout=5)
+                session.get(f"{server.base_url}{request_path}", headers={"Accept": "application/xml"}, timeout=5)
+    finally:
+        # The archive is written while the JVM exits, so let it finish
+        server.stop(grace=DUMP_TIMEOUT)
+    if not partial.exists():
+        return None
+    os.replace(partial, path)
+    return path
+
+
+def ensure_archive(jar=None, java=None):
+    """Path of the archive for this jar and JVM, dumping it the first time.
+
+    Returns None when the JVM cannot write dynamic archives (before JDK
+    13) or the dump failed; servers then start without one.
+    """
+    with _archive_lock:
+        try:
+            version = java_version(java)
+        except (OSError, subprocess.SubprocessError):
+            return None
+        major = java_major(version)
+        if major is None or major < MIN_ARCHIVE_VERSION:
+            return None
+        path = archive_path(jar, java)
+        if path.exists():
+            return path
+        try:
+            return create_archive(path, jar, java)
+        except (OSError, RuntimeError, requests.exceptions.RequestException) as error:
+            print(f"Could not create a class-data-sharing archive: {error}")
+            return None
+
+
+def archive_flags(archive):
+    return [f"-XX:SharedArchiveFile={archive}"] if archive else []
+
+
+def startup_flags(jar=None, java=None, archive=True):
+    """JVM flags for fast test-server startup.
+
+    ``STARTUP_FLAGS`` plus the AppCDS archive (created on first use)
+    unless ``archive`` is false or TODO_SERVER_CDS=0, followed by
+    ``TODO_SERVER_JVM_FLAGS`` so those can override either.
+    """
+    archive = archive and os.environ.get("TODO_SERVER_CDS", "1") != "0"
+    archive_file = ensure_archive(jar, java) if archive else None
+    return [*STARTUP_FLAGS, *archive_flags(archive_file), *default_jvm_flags()]
+
+
+# Time from launch to the first 200 for each flag set, `runs` times each;
+# run with `python -m todo_server`
+def measure_startup(runs=5, jar=None, java=None):
+    archive = ensure_archive(jar, java)
+    configurations = {
+        "default": [],
+        "archive": archive_flags(archive),
+        "startup flags": STARTUP_FLAGS,
+        "startup flags + archive": [*STARTUP_FLAGS, *archive_flags(archive)],
+    }
+    if archive is None:
+        configurations = {k: v for k, v in configurations.items() if "archive" not in k}
+
+    results = {"archive": str(archive) if archive else None, "java": java_version(java),
+               "configurations": {}, "summary": {}}
+    for _ in range(runs):
+        # Interleave the configurations so drift affects them all alike
+        for name, flags in configurations.items():
+            with TodoServer(jar=jar, java=java, jvm_flags=flags, poll_interval=0.005) as server:
+                results["configurations"].setdefault(name, []).append(server.startup_seconds)
+
+    for name, times in results["configurations"].items():
+        results["summary"][name] = {"median": statistics.median(times), "min": min(times), "max": max(times)}
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare Todo Manager startup with and without an AppCDS archive")
+    parser.add_argument("--runs", type=int, default=5, help="Launches per configuration (default: 5)")
+    parser.add_argument("--jar", help="Todo Manager jar (default: the one at the repository root)")
+    parser.add_argument("--java", help="java executable (default: $JAVA_HOME/bin/java or java)")
+    parser.add_argument("--output", help="Also write the measurements to this JSON file")
+    args = parser.parse_args()
+
+    results = measure_startup(args.runs, args.jar, args.java)
+    print(results["java"].splitlines()[0])
+    print(f"Archive: {results['archive'] or 'not available'}")
+    baseline = results["summary"]["default"]["median"]
+    print(f"{'configuration':<26}{'median':>10}{'min':>10}{'max':>10}{'speedup':>10}")
+    for name in results["summary"]:
+        row = results["summary"][name]
+        print(f"{name:<26}{row['median'] * 1000:>8.0f}ms{row['min'] * 1000:>8.0f}ms"
+              f"{row['max'] * 1000:>8.0f}ms{baseline / row['median']:>9.2f}x")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
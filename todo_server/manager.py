@@ -0,0 +1,273 @@
+import atexit
+import ctypes
+import http.client
+import os
+import queue
+import shlex
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import psutil
+
+# The jar shipped at the root of the repository
+DEFAULT_JAR = Path(__file__).resolve().parent.parent / "runTodoManagerRestAPI-1.5.5.jar"
+
+# How long to wait for a launched jar to answer, and how often to ask
+STARTUP_TIMEOUT = 30
+POLL_INTERVAL = 0.02
+READY_PATH = "/todos"
+
+# How long the jar gets to exit after /shutdown, and then after SIGTERM,
+# before it is killed
+SHUTDOWN_GRACE = 1
+STOP_TIMEOUT = 5
+
+# Auto-allocated ports can be taken between probing and the jar binding them
+PORT_ATTEMPTS = 3
+
+# Linux prctl option delivering a signal to a child when its parent dies
+PR_SET_PDEATHSIG = 1
+
+# Servers still running, stopped at interpreter exit whatever the caller did
+_running = set()
+_running_lock = threading.Lock()
+
+
+def default_jar():
+    return Path(os.environ.get("TODO_SERVER_JAR", DEFAULT_JAR))
+
+
+# Extra JVM flags for every launch, e.g. TODO_SERVER_JVM_FLAGS="-Xmx256m -XX:+UseSerialGC"
+def default_jvm_flags():
+    return shlex.split(os.environ.get("TODO_SERVER_JVM_FLAGS", ""))
+
+
+def default_java():
+    java_home = os.environ.get("JAVA_HOME")
+    if java_home and os.path.exists(os.path.join(java_home, "bin", "java")):
+        return os.path.join(java_home, "bin", "java")
+    return "java"
+
+
+# Ask the OS for a port nobody is listening on
+def find_free_port(host="localhost"):
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+# One cheap GET; True once the API answers 200
+def is_ready(host, port, path=READY_PATH, timeout=1.0):
+    connection = http.client.HTTPConnection(host, port, timeout=timeout)
+    try:
+        connection.request("GET", path)
+        return connection.getresponse().status == 200
+    except (OSError, http.client.HTTPException):
+        return False
+    finally:
+        connection.close()
+
+
+# Run in the child before exec: die with the harness even if it is SIGKILLed
+def _die_with_parent():
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        libc.prctl(PR_SET_PDEATHSIG, signal.SIGTERM)
+    except (OSError, AttributeError):
+        pass
+
+
+# PR_SET_PDEATHSIG fires when the thread that forked the child exits, not
+# the process, so every jar is forked by one daemon thread that lives until
+# the harness itself dies
+_launch_requests = queue.Queue()
+_launcher_lock = threading.Lock()
+_launcher_pid = None
+
+
+def _launcher_loop():
+    while True:
+        command, reply = _launch_requests.get()
+        try:
+            reply.put(subprocess.Popen(
+                command,
+                stdout=subprocess.DEVNULL,  # Hide logs
+                stderr=subprocess.DEVNULL,
+                preexec_fn=_die_with_parent,
+            ))
+        except (OSError, subprocess.SubprocessError) as error:
+            reply.put(error)
+
+
+# Popen through the launcher thread, starting it on first use (and again
+# in a forked child, which does not inherit it)
+def _popen(command):
+    global _launcher_pid
+    with _launcher_lock:
+        if _launcher_pid != os.getpid():
+            threading.Thread(target=_launcher_loop, name="todo-server-launcher", daemon=True).start()
+            _launcher_pid = os.getpid()
+    reply = queue.Queue(maxsize=1)
+    _launch_requests.put((command, reply))
+    result = reply.get()
+    if isinstance(result, Exception):
+        raise result
+    return result
+
+
+def _stop_all():
+    with _running_lock:
+        servers = list(_running)
+    for server in servers:
+        server.stop()
+
+
+# SIGTERM normally skips atexit; turn it into SystemExit so servers are stopped
+def _install_signal_handler():
+    if threading.current_thread() is not threading.main_thread():
+        return
+    if signal.getsignal(signal.SIGTERM) is signal.SIG_DFL:
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(128 + signum))
+
+
+# Terminate a launched process and its children, killing what will not exit
+def _kill_tree(process):
+    try:
+        parent = psutil.Process(process.pid)
+        children = parent.children(recursive=True)
+    except psutil.NoSuchProcess:
+        children = []
+    for child in children:
+        try:
+            child.terminate()
+        except psutil.NoSuchProcess:
+            pass
+    process.terminate()
+    try:
+        process.wait(timeout=STOP_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+    psutil.wait_procs(children, timeout=STOP_TIMEOUT)
+
+
+atexit.register(_stop_all)
+
+
+class TodoServer:
+    """One Todo Manager jar process listening on its own port.
+
+    ``port=None`` picks a free port. ``jvm_flags`` go before ``-jar`` and
+    default to ``TODO_SERVER_JVM_FLAGS``; the jar defaults to
+    ``TODO_SERVER_JAR`` or the one at the root of the repository. Once
+    started, ``base_url`` and ``pid`` identify the server and
+    ``startup_seconds`` is the time from launch to the first 200.
+    """
+
+    def __init__(self, port=None, jar=None, jvm_flags=None, java=None, host="localhost",
+                 startup_timeout=STARTUP_TIMEOUT, poll_interval=POLL_INTERVAL):
+        self.requested_port = port
+        self.port = port
+        self.jar = Path(jar) if jar else default_jar()
+        self.jvm_flags = list(default_jvm_flags() if jvm_flags is None else jvm_flags)
+        self.java = java or default_java()
+        self.host = host
+        self.startup_timeout = startup_timeout
+        self.poll_interval = poll_interval
+        self.process = None
+        self.startup_seconds = None
+
+    @property
+    def base_url(self):
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def pid(self):
+        return self.process.pid if self.process else None
+
+    @property
+    def running(self):
+        return self.process is not None and self.process.poll() is None
+
+    def command(self):
+        return [self.java, *self.jvm_flags, "-jar", str(self.jar), f"-port={self.port}"]
+
+    # Poll until the jar answers, the process dies or the timeout passes
+    def _wait_ready(self, start):
+        deadline = start + self.startup_timeout
+        while time.perf_counter() < deadline:
+            if self.process.poll() is not None:
+                return False
+            if is_ready(self.host, self.port, timeout=max(self.poll_interval, 0.5)):
+                self.startup_seconds = time.perf_counter() - start
+                return True
+            time.sleep(self.poll_interval)
+        raise RuntimeError(f"Server on port {self.port} did not answer within {self.startup_timeout} s")
+
+    def start(self):
+        if not self.jar.exists():
+            raise RuntimeError(f"Todo Manager jar not found at {self.jar}")
+        if self.requested_port is not None and is_ready(self.host, self.requested_port):
+            raise RuntimeError(f"Another server is already answering on port {self.requested_port}")
+
+        attempts = 1 if self.requested_port is not None else PORT_ATTEMPTS
+        for _ in range(attempts):
+            self.port = self.requested_port or find_free_port(self.host)
+            start = time.perf_counter()
+            self.process = _popen(self.command())
+            with _running_lock:
+                _running.add(self)
+            # Only once there is a process to clean up
+            _install_signal_handler()
+            try:
+                if self._wait_ready(start):
+                    return self
+            except RuntimeError:
+                self.stop()
+                raise
+            # Exited during startup, most likely because the port was taken
+            code = self.process.returncode
+            self.stop()
+        raise RuntimeError(f"Server exited during startup with code {code}")
+
+    def stop(self, grace=SHUTDOWN_GRACE):
+        """Shut the server down, killing its process tree if it outlives ``grace`` s."""
+        process = self.process
+        if process is None:
+            return
+        with _running_lock:
+            _running.discard(self)
+        if process.poll() is None:
+            # The jar exits by itself on /shutdown, usually before answering
+            connection = http.client.HTTPConnection(self.host, self.port, timeout=1)
+            try:
+                connection.request("GET", "/shutdown")
+                connection.getresponse()
+            except (OSError, http.client.HTTPException):
+                pass
+            finally:
+                connection.close()
+            try:
+                process.wait(timeout=grace)
+            except subprocess.TimeoutExpired:
+                _kill_tree(process)
+        self.process = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def __repr__(self):
+        return f"TodoServer(port={self.port}, pid={self.pid})"
+
+
+# Launch a server and wait until it is ready
+def start_server(**kwargs):
+    return TodoServer(**kwargs).start()
@@ -0,0 +1,94 @@
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .manager import STARTUP_TIMEOUT, TodoServer, _install_signal_handler
+
+# Started servers kept waiting, overridable with TODO_SERVER_POOL_SIZE
+DEFAULT_POOL_SIZE = 2
+
+
+def default_pool_size():
+    return int(os.environ.get("TODO_SERVER_POOL_SIZE", DEFAULT_POOL_SIZE))
+
+
+class ServerPool:
+    """Servers started ahead of time on their own free ports.
+
+    ``acquire`` hands out a server that has already answered its first
+    request and has not served anything else, then starts a replacement in
+    the background so the next caller does not wait for a JVM either.
+    ``server_options`` are passed to every ``TodoServer``.
+    """
+
+    def __init__(self, size=None, **server_options):
+        self.size = size or default_pool_size()
+        self.server_options = server_options
+        self.ready = queue.Queue()
+        self.closed = False
+        self.lock = threading.Lock()
+        self.launched = []
+        # One thread per pool slot launches, one more stops returned servers
+        self.executor = ThreadPoolExecutor(max_workers=self.size + 1, thread_name_prefix="todo-server-pool")
+
+    def start(self):
+        # Servers start on executor threads, which cannot take signals
+        _install_signal_handler()
+        for _ in range(self.size):
+            self._refill()
+        return self
+
+    def _refill(self):
+        if not self.closed:
+            self.executor.submit(self._launch)
+
+    # Start one server; failures are queued too so acquire can report them
+    def _launch(self):
+        server = TodoServer(**self.server_options)
+        with self.lock:
+            if self.closed:
+                return
+            self.launched.append(server)
+        try:
+            self.ready.put(server.start())
+        except RuntimeError as error:
+            self.ready.put(error)
+
+    def acquire(self, timeout=STARTUP_TIMEOUT):
+        """Take a ready server, waiting up to ``timeout`` s if none is left."""
+        try:
+            item = self.ready.get(timeout=timeout)
+        except queue.Empty:
+            raise RuntimeError(f"No pooled server became ready within {timeout} s") from None
+        self._refill()
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    # Stop a server handed out by acquire without making the caller wait;
+    # it stays in launched until stopped so close still catches it
+    def release(self, server):
+        if self.closed:
+            self._stop(server)
+        else:
+            self.executor.submit(self._stop, server)
+
+    def _stop(self, server):
+        server.stop()
+        with self.lock:
+            if server in self.launched:
+                self.launched.remove(server)
+
+    def close(self):
+        with self.lock:
+            self.closed = True
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        for server in list(self.launched):
+            self._stop(server)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
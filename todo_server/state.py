@@ -0,0 +1,133 @@
+import requests
+
+# Collections making up the server's data
+KINDS = ["todos", "projects", "categories"]
+
+# Apply-and-compare rounds before a reset counts as failed; links that
+# mirror each other can need a second round
+RESET_PASSES = 2
+
+REQUEST_TIMEOUT = 5
+
+
+def _is_links(value):
+    return isinstance(value, list) and all(isinstance(item, dict) and "id" in item for item in value)
+
+
+def _link_ids(obj, field):
+    return sorted({link["id"] for link in obj.get(field, [])})
+
+
+# Relationship fields hold lists of {"id": ...}; everything else is data
+def _split(obj):
+    fields = {k: v for k, v in obj.items() if k != "id" and not _is_links(v)}
+    links = {k: _link_ids(obj, k) for k, v in obj.items() if _is_links(v)}
+    return fields, links
+
+
+# The API returns booleans as strings but only accepts real booleans back
+def _payload_value(value):
+    if value in ("true", "false"):
+        return value == "true"
+    return value
+
+
+# All objects of every collection, by kind and id
+def snapshot(base_url, session=None):
+    session = session or requests.Session()
+    state = {}
+    for kind in KINDS:
+        response = session.get(f"{base_url}/{kind}", headers={"Accept": "application/json"},
+                               timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        state[kind] = {obj["id"]: obj for obj in response.json().get(kind, [])}
+    return state
+
+
+def diff_state(baseline, current):
+    """Changes turning ``current`` back into ``baseline``.
+
+    Returns a dict of ``missing`` (baseline objects that were deleted and
+    cannot be recreated under their id), ``deletes`` (objects created
+    since), ``updates`` (fields to set back) and ``links`` / ``unlinks``
+    (relationship entries to restore or remove), each as tuples naming the
+    kind and object id.
+    """
+    changes = {"missing": [], "deletes": [], "updates": [], "links": [], "unlinks": []}
+    for kind in KINDS:
+        wanted, present = baseline.get(kind, {}), current.get(kind, {})
+        changes["missing"] += [(kind, i) for i in wanted if i not in present]
+        changes["deletes"] += [(kind, i) for i in present if i not in wanted]
+        for object_id in wanted.keys() & present.keys():
+            wanted_fields, wanted_links = _split(wanted[object_id])
+            fields, links = _split(present[object_id])
+            changed = {k: v for k, v in wanted_fields.items() if fields.get(k) != v}
+            # Fields the baseline does not have are cleared
+            changed.update({k: "" for k in fields if k not in wanted_fields})
+            if changed:
+                changes["updates"].append((kind, object_id, changed))
+            for field in wanted_links.keys() | links.keys():
+                targets, now = set(wanted_links.get(field, [])), set(links.get(field, []))
+                changes["links"] += [(kind, object_id, field, t) for t in sorted(targets - now)]
+                changes["unlinks"] += [(kind, object_id, field, t) for t in sorted(now - targets)]
+    return changes
+
+
+def has_changes(changes):
+    return any(changes.values())
+
+
+# Link order is not significant, anything else is
+def _normalized(state):
+    return {
+        kind: {i: {k: _link_ids(obj, k) if _is_links(v) else v for k, v in obj.items()}
+               for i, obj in objects.items()}
+        for kind, objects in state.items()
+    }
+
+
+def matches(baseline, current):
+    return _normalized(baseline) == _normalized(current)
+
+
+# Apply a diff: drop new objects, then set fields back, then fix the links
+def apply_changes(base_url, changes, session=None):
+    session = session or requests.Session()
+    for kind, object_id in changes["deletes"]:
+        session.delete(f"{base_url}/{kind}/{object_id}", timeout=REQUEST_TIMEOUT)
+    for kind, object_id, fields in changes["updates"]:
+        payload = {k: _payload_value(v) for k, v in fields.items()}
+        session.post(f"{base_url}/{kind}/{object_id}", json=payload, timeout=REQUEST_TIMEOUT)
+    for kind, object_id, field, target in changes["unlinks"]:
+        session.delete(f"{base_url}/{kind}/{object_id}/{field}/{target}", timeout=REQUEST_TIMEOUT)
+    for kind, object_id, field, target in changes["links"]:
+        session.post(f"{base_url}/{kind}/{object_id}/{field}", json={"id": target}, timeout=REQUEST_TIMEOUT)
+
+
+def reset_state(base_url, baseline, session=None):
+    """Bring the server back to ``baseline`` and verify it; True on success.
+
+    Only the differences are applied. Returns False when the reset cannot
+    be verified, e.g. because a baseline object was deleted (ids are never
+    reused) or the data still differs after ``RESET_PASSES`` rounds; the
+    caller should restart the server then.
+    """
+    session = session or requests.Session()
+    try:
+        for _ in range(RESET_PASSES):
+            current = snapshot(base_url, session)
+            if matches(baseline, current):
+                return True
+            changes = diff_state(baseline, current)
+            # Deleted baseline objects, or differences no request can undo
+            # (like an emptied relationship left as [])
+            if changes["missing"] or not has_changes(changes):
+                return False
+            # Objects are gone before their links are compared again
+            if changes["deletes"]:
+                apply_changes(base_url, {**changes, "updates": [], "links": [], "unlinks": []}, session)
+                changes = diff_state(baseline, snapshot(base_url, session))
+            apply_changes(base_url, changes, session)
+        return matches(baseline, snapshot(base_url, session))
+    except requests.exceptions.RequestException:
+        return False
@@ -0,0 +1,41 @@
+import sys
+import textwrap
+
+import pytest
+
+# Stands in for `java [flags] -jar JAR -port=N`: answers 200 to any GET and
+# exits on /shutdown, like the jar
+FAKE_JAVA = textwrap.dedent("""\
+    #!{python}
+    import sys
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+
+    port = next(int(a.split("=", 1)[1]) for a in sys.argv if a.startswith("-port="))
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.end_headers()
+            if self.path == "/shutdown":
+                raise SystemExit(0)
+
+        def log_message(self, *args):
+            pass
+
+    HTTPServer(("localhost", port), Handler).serve_forever()
+""")
+
+
+@pytest.fixture
+def fake_jar(tmp_path):
+    jar = tmp_path / "todo.jar"
+    jar.write_bytes(b"")
+    return jar
+
+
+@pytest.fixture
+def fake_java(tmp_path):
+    java = tmp_path / "java"
+    java.write_text(FAKE_JAVA.format(python=sys.executable))
+    java.chmod(0o755)
+    return java
@@ -0,0 +1,70 @@
+import os
+import subprocess
+import sys
+import textwrap
+import time
+
+import psutil
+
+from todo_server import ServerPool, TodoServer
+
+# A worker that takes a pooled server, reports its pid and waits to be killed
+WORKER = textwrap.dedent("""\
+    import time
+    from todo_server import ServerPool
+    pool = ServerPool(size=1, jar={jar!r}, java={java!r}, jvm_flags=[]).start()
+    print(pool.acquire().pid, flush=True)
+    time.sleep(60)
+""")
+
+
+def wait_gone(pid, timeout=10):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if psutil.Process(pid).status() == psutil.STATUS_ZOMBIE:
+                return True
+        except psutil.NoSuchProcess:
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def test_pooled_server_dies_with_killed_worker(fake_jar, fake_java):
+    script = WORKER.format(jar=str(fake_jar), java=str(fake_java))
+    worker = subprocess.Popen([sys.executable, "-c", script], stdout=subprocess.PIPE, text=True)
+    try:
+        server_pid = int(worker.stdout.readline())
+        assert psutil.pid_exists(server_pid)
+        # SIGKILL skips atexit, so only the death signal can stop the server
+        worker.kill()
+        worker.wait()
+        assert wait_gone(server_pid)
+    finally:
+        worker.kill()
+        worker.stdout.close()
+
+
+def test_pool_hands_out_started_servers(fake_jar, fake_java):
+    with ServerPool(size=1, jar=fake_jar, java=fake_java, jvm_flags=[]) as pool:
+        first = pool.acquire()
+        second = pool.acquire()
+        assert first.running and second.running
+        assert first.port != second.port
+        pool.release(first)
+        pool.release(second)
+    assert not first.running and not second.running
+
+
+def test_server_launched_from_short_lived_thread_keeps_running(fake_jar, fake_java):
+    # The death signal must not fire when the thread that asked for the launch exits
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        server = executor.submit(TodoServer(jar=fake_jar, java=fake_java, jvm_flags=[]).start).result()
+    try:
+        time.sleep(0.2)
+        assert server.running
+        assert os.getpid() == psutil.Process(server.pid).ppid()
+    finally:
+        server.stop()
@@ -0,0 +1,173 @@
+import copy
+
+from todo_server import diff_state, reset_state, snapshot
+from todo_server.state import matches
+
+BASE_URL = "http://localhost:4567"
+
+# Relationships the API keeps on both sides
+MIRRORS = {("todos", "tasksof"): ("projects", "tasks"), ("projects", "tasks"): ("todos", "tasksof")}
+
+BASELINE = {
+    "todos": {
+        "1": {"id": "1", "title": "scan paperwork", "doneStatus": "false", "description": "",
+              "tasksof": [{"id": "1"}], "categories": [{"id": "1"}]},
+        "2": {"id": "2", "title": "file paperwork", "doneStatus": "false", "description": "",
+              "tasksof": [{"id": "1"}]},
+    },
+    "projects": {
+        "1": {"id": "1", "title": "Office Work", "completed": "false", "active": "false", "description": "",
+              "tasks": [{"id": "1"}, {"id": "2"}]},
+    },
+    "categories": {
+        "1": {"id": "1", "title": "Office", "description": ""},
+        "2": {"id": "2", "title": "Home", "description": ""},
+    },
+}
+
+
+class FakeResponse:
+    def __init__(self, status_code, body=None):
+        self.status_code = status_code
+        self.body = body
+
+    def json(self):
+        return self.body
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeApi:
+    """In-memory stand-in for the Todo Manager API, used as the session."""
+
+    def __init__(self, state):
+        self.state = copy.deepcopy(state)
+        self.next_id = 100
+
+    def _parts(self, url):
+        return url[len(BASE_URL):].strip("/").split("/")
+
+    def _link(self, kind, object_id, field, target, add):
+        obj = self.state[kind][object_id]
+        links = [link for link in obj.get(field, []) if link["id"] != target]
+        if add:
+            links.append({"id": target})
+        if links:
+            obj[field] = links
+        else:
+            # The API leaves out empty relationships
+            obj.pop(field, None)
+
+    def link(self, kind, object_id, field, target, add=True):
+        self._link(kind, object_id, field, target, add)
+        if (kind, field) in MIRRORS:
+            other_kind, other_field = MIRRORS[kind, field]
+            self._link(other_kind, target, other_field, object_id, add)
+
+    def create(self, kind, **fields):
+        object_id = str(self.next_id)
+        self.next_id += 1
+        self.state[kind][object_id] = {"id": object_id, **fields}
+        return object_id
+
+    def get(self, url, **kwargs):
+        (kind,) = self._parts(url)
+        return FakeResponse(200, {kind: list(copy.deepcopy(self.state[kind]).values())})
+
+    def post(self, url, json=None, **kwargs):
+        parts = self._parts(url)
+        if len(parts) == 3:
+            kind, object_id, field = parts
+            self.link(kind, object_id, field, json["id"])
+            return FakeResponse(201)
+        kind, object_id = parts
+        self.state[kind][object_id].update(
+            {k: str(v).lower() if isinstance(v, bool) else v for k, v in json.items()})
+        return FakeResponse(200)
+
+    def delete(self, url, **kwargs):
+        parts = self._parts(url)
+        if len(parts) == 4:
+            kind, object_id, field, target = parts
+            self.link(kind, object_id, field, target, add=False)
+            return FakeResponse(200)
+        kind, object_id = parts
+        obj = self.state[kind].pop(object_id)
+        for field, value in obj.items():
+            if (kind, field) in MIRRORS:
+                for link in value:
+                    other_kind, other_field = MIRRORS[kind, field]
+                    self._link(other_kind, link["id"], other_field, object_id, add=False)
+        return FakeResponse(200)
+
+
+def test_diff_of_unchanged_state_is_empty():
+    changes = diff_state(BASELINE, copy.deepcopy(BASELINE))
+    assert not any(changes.values())
+
+
+def test_diff_deletes_created_objects():
+    api = FakeApi(BASELINE)
+    created = api.create("todos", title="new")
+    changes = diff_state(BASELINE, api.state)
+    assert changes["deletes"] == [("todos", created)]
+    assert changes["missing"] == []
+
+
+def test_diff_restores_modified_fields():
+    api = FakeApi(BASELINE)
+    api.state["projects"]["1"].update(title="Renamed", completed="true", extra="added")
+    changes = diff_state(BASELINE, api.state)
+    assert changes["updates"] == [("projects", "1", {"title": "Office Work", "completed": "false", "extra": ""})]
+
+
+def test_diff_reconciles_links():
+    api = FakeApi(BASELINE)
+    api.link("todos", "1", "categories", "2")
+    api.link("todos", "1", "categories", "1", add=False)
+    changes = diff_state(BASELINE, api.state)
+    assert changes["links"] == [("todos", "1", "categories", "1")]
+    assert changes["unlinks"] == [("todos", "1", "categories", "2")]
+
+
+def test_diff_reports_deleted_baseline_objects_as_missing():
+    api = FakeApi(BASELINE)
+    api.delete(f"{BASE_URL}/categories/2")
+    assert diff_state(BASELINE, api.state)["missing"] == [("categories", "2")]
+
+
+def test_reset_deletes_created_objects():
+    api = FakeApi(BASELINE)
+    api.create("todos", title="new")
+    api.create("categories", title="new")
+    assert reset_state(BASE_URL, BASELINE, session=api)
+    assert matches(BASELINE, api.state)
+
+
+def test_reset_restores_modified_baseline_objects():
+    api = FakeApi(BASELINE)
+    api.state["todos"]["2"].update(title="changed", doneStatus="true")
+    api.state["categories"]["1"]["description"] = "changed"
+    assert reset_state(BASE_URL, BASELINE, session=api)
+    assert matches(BASELINE, api.state)
+    assert api.state["todos"]["2"]["doneStatus"] == "false"
+
+
+def test_reset_reconciles_links():
+    api = FakeApi(BASELINE)
+    # One side of a mirrored link removed, another added, a plain one moved
+    api.delete(f"{BASE_URL}/projects/1/tasks/2")
+    created = api.create("todos", title="new")
+    api.link("todos", created, "tasksof", "1")
+    api.link("todos", "2", "categories", "2")
+    api.link("todos", "1", "categories", "1", add=False)
+    assert reset_state(BASE_URL, BASELINE, session=api)
+    assert matches(BASELINE, api.state)
+    assert sorted(link["id"] for link in snapshot(BASE_URL, api)["projects"]["1"]["tasks"]) == ["1", "2"]
+
+
+def test_reset_fails_when_a_baseline_object_was_deleted():
+    api = FakeApi(BASELINE)
+    api.delete(f"{BASE_URL}/todos/2")
+    assert not reset_state(BASE_URL, BASELINE, session=api)